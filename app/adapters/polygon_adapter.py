@@ -10,7 +10,7 @@ import pandas as pd
 
 from .base import BaseDataAdapter
 from app.models.quote import QuoteData, FastQuoteData, CompanyInfo
-from app.models.history import HistoryData
+from app.models.history import HistoryRecord
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -223,9 +223,9 @@ class PolygonDataAdapter(BaseDataAdapter):
                 headquarters=''
             )
 
-    def adapt_history_data_from_aggs(self, aggs) -> Dict[str, Any]:
+    def adapt_history_data_from_aggs(self, aggs) -> List[HistoryRecord]:
         """
-        从官方客户端的Agg响应对象转换为历史数据（新格式）
+        从官方客户端的Agg响应对象转换为历史记录列表（新格式）
         """
         try:
             # 处理不同的响应格式
@@ -235,10 +235,10 @@ class PolygonDataAdapter(BaseDataAdapter):
                 aggs_list = list(aggs)
             else:
                 logger.warning("无效的Aggs响应格式", aggs_type=type(aggs))
-                return {"prices": [], "volumes": [], "timestamps": []}
+                return []
 
             if not aggs_list:
-                return {"prices": [], "volumes": [], "timestamps": []}
+                return []
 
             # 构建历史数据列表
             history_list = []
@@ -259,7 +259,7 @@ class PolygonDataAdapter(BaseDataAdapter):
                     close_price = self.safe_float_from_attr(agg, 'c')
                     volume = self.safe_int_from_attr(agg, 'v')
 
-                    history_data = HistoryData(
+                    history_data = HistoryRecord(
                         date=date,
                         open=open_price,
                         high=high_price,
@@ -37,6 +37,8 @@ async def get_history(
     auto_adjust: bool = Query(True, description="是否自动调整价格"),
     prepost: bool = Query(False, description="是否包含盘前盘后数据"),
     actions: bool = Query(True, description="是否包含分红和拆股信息"),
+    data_format: str = Query(
+        "records", alias="format", description="数据格式: records 按行 / columnar 按列", pattern="^(records|columnar)$"),
     manager: DataSourceManager = Depends(get_data_source_manager)
 ):
     """
@@ -50,6 +52,7 @@ async def get_history(
     - **auto_adjust**: 是否自动调整价格(除权除息)
     - **prepost**: 是否包含盘前盘后数据
     - **actions**: 是否包含分红和拆股信息
+    - **format**: 数据格式，records 为按行记录列表（默认），columnar 为按列字典，体积更小
 
     注意：使用start/end参数时会忽略period参数
     支持多数据源降级机制
@@ -82,7 +85,8 @@ async def get_history(
         end=end,
         auto_adjust=auto_adjust,
         prepost=prepost,
-        actions=actions
+        actions=actions,
+        data_format=data_format
     )
 
     response = BaseResponse(
@@ -42,6 +42,12 @@ def get_service() -> SecService:
         )
 
 
+def _reraise_if_upstream_unavailable(e: Exception) -> None:
+    """熔断快速失败保留其503状态，交由全局异常处理器返回，而不是包装成500"""
+    if isinstance(e, FinanceAPIException) and e.code == "UPSTREAM_UNAVAILABLE":
+        raise e
+
+
 # ===== XBRL数据转换功能 =====
 
 @router.get(
@@ -86,6 +92,7 @@ async def convert_xbrl_to_json(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"XBRL转换失败: {filing_url}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"XBRL转换失败: {str(e)}")
 
@@ -125,6 +132,7 @@ async def get_company_xbrl_data(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取XBRL数据失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取XBRL数据失败: {str(e)}")
 
@@ -176,6 +184,7 @@ async def full_text_search(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"全文搜索失败: {query}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"全文搜索失败: {str(e)}")
 
@@ -216,6 +225,7 @@ async def search_company_filings(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"公司文件搜索失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"公司文件搜索失败: {str(e)}")
 
@@ -262,6 +272,7 @@ async def get_insider_trading(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取内幕交易数据失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取内幕交易数据失败: {str(e)}")
 
@@ -305,6 +316,7 @@ async def get_institutional_holdings(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取机构持股数据失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取机构持股数据失败: {str(e)}")
 
@@ -347,6 +359,7 @@ async def get_recent_ipos(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取IPO数据失败, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取IPO数据失败: {str(e)}")
 
@@ -380,6 +393,7 @@ async def get_company_ipo_details(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取公司IPO详情失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取公司IPO详情失败: {str(e)}")
 
@@ -421,6 +435,7 @@ async def get_executive_compensation(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取高管薪酬数据失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取高管薪酬数据失败: {str(e)}")
 
@@ -462,6 +477,7 @@ async def get_company_governance(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取公司治理信息失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取公司治理信息失败: {str(e)}")
 
@@ -501,6 +517,7 @@ async def get_recent_enforcement_actions(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取SEC执法行动失败, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取SEC执法行动失败: {str(e)}")
 
@@ -539,10 +556,45 @@ async def get_ticker_to_cik_mapping(
             is_fallback=False
         )
     except Exception as e:
+        _reraise_if_upstream_unavailable(e)
         logger.error(f"获取CIK映射失败: {ticker}, 错误: {e}")
         raise HTTPException(status_code=500, detail=f"获取CIK映射失败: {str(e)}")
 
 
+# ===== 公司全景数据 =====
+
+@router.get(
+    "/full-picture/{ticker}",
+    response_model=BaseResponse[Dict[str, Any]],
+    summary="公司全景数据",
+    description="""
+    并发获取公司的机构持股、公司治理、高管薪酬和CIK映射数据。
+    
+    **应用场景**:
+    - 公司概览页面
+    - 一次请求获取多类SEC数据
+    """
+)
+async def get_company_full_picture(
+    ticker: str,
+    service: SecService = Depends(get_service)
+):
+    """获取公司全景数据"""
+    try:
+        result = await service.get_company_full_picture(ticker=ticker)
+
+        return BaseResponse(
+            symbol=ticker,
+            data=result,
+            data_source="sec_api",
+            is_fallback=False
+        )
+    except Exception as e:
+        _reraise_if_upstream_unavailable(e)
+        logger.error(f"获取公司全景数据失败: {ticker}, 错误: {e}")
+        raise HTTPException(status_code=500, detail=f"获取公司全景数据失败: {str(e)}")
+
+
 # ===== 健康检查 =====
 
 @router.get(
@@ -618,6 +670,10 @@ async def sec_advanced_api_overview():
             "mapping": {
                 "description": "数据映射和实体信息",
                 "endpoints": ["/mapping/ticker-to-cik/{ticker}"]
+            },
+            "full_picture": {
+                "description": "公司全景数据（并发聚合）",
+                "endpoints": ["/full-picture/{ticker}"]
             }
         },
         "documentation": "https://sec-api.io/docs",
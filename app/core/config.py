@@ -31,6 +31,8 @@ class Settings(BaseSettings):
 
     # 缓存配置
     redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
+    redis_pool_max_size: int = Field(
+        default=50, env="REDIS_POOL_MAX_SIZE", description="Redis连接池最大连接数")
     cache_ttl_seconds: int = Field(
         default=300, env="CACHE_TTL", description="缓存过期时间(秒)")
 
@@ -38,7 +40,11 @@ class Settings(BaseSettings):
     yf_session_timeout: int = Field(
         default=30, env="YF_TIMEOUT", description="yfinance请求超时时间")
     yf_max_retries: int = Field(
-        default=5, env="YF_MAX_RETRIES", description="yfinance最大重试次数")
+        default=5, env="YF_MAX_RETRIES", description="yfinance HTTP请求失败时的重试次数")
+    yf_executor_workers: int = Field(
+        default=32, env="YF_EXECUTOR_WORKERS", description="执行yfinance同步调用的线程池大小")
+    yf_batch_concurrency: int = Field(
+        default=16, env="YF_BATCH_CONCURRENCY", description="批量报价时同时进行的yfinance请求数上限")
 
     # Polygon.io 配置
     polygon_api_key: Optional[str] = Field(
@@ -99,6 +105,10 @@ class Settings(BaseSettings):
         default=30, env="SEC_API_TIMEOUT", description="SEC API请求超时时间")
     sec_api_max_retries: int = Field(
         default=3, env="SEC_API_MAX_RETRIES", description="SEC API最大重试次数")
+    sec_breaker_fail_max: int = Field(
+        default=5, env="SEC_BREAKER_FAIL_MAX", description="SEC高级接口熔断前允许的连续失败次数")
+    sec_breaker_reset_timeout: int = Field(
+        default=30, env="SEC_BREAKER_RESET_TIMEOUT", description="SEC高级接口熔断后的冷却时间(秒)")
 
     class Config:
         env_file = ".env"
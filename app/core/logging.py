@@ -7,12 +7,18 @@ import logging
 import sys
 from typing import Any, Dict
 
+import orjson
 import structlog
 from structlog.typing import FilteringBoundLogger
 
 from .config import settings
 
 
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """使用orjson序列化日志事件"""
+    return orjson.dumps(obj, default=default).decode()
+
+
 def configure_logging() -> None:
     """配置应用日志"""
 
@@ -26,12 +32,17 @@ def configure_logging() -> None:
     # 配置 structlog
     structlog.configure(
         processors=[
+            # 按级别提前过滤，被过滤的日志不再执行后续处理
+            structlog.stdlib.filter_by_level,
             # 添加日志级别
             structlog.stdlib.add_log_level,
             # 添加时间戳
             structlog.processors.TimeStamper(fmt="iso"),
+            # 延迟格式化 %s 占位参数
+            structlog.stdlib.PositionalArgumentsFormatter(),
             # 在开发模式下使用更友好的格式
-            structlog.dev.ConsoleRenderer() if settings.debug else structlog.processors.JSONRenderer(),
+            structlog.dev.ConsoleRenderer() if settings.debug else structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -62,7 +62,8 @@ class DataSourceInterface(ABC):
         end: Optional[str] = None,
         auto_adjust: bool = True,
         prepost: bool = True,
-        actions: bool = True
+        actions: bool = True,
+        data_format: str = "records"
     ) -> Dict[str, Any]:
         """获取历史数据"""
         pass
@@ -101,7 +101,8 @@ class FallbackManager:
         end: Optional[str] = None,
         auto_adjust: bool = True,
         prepost: bool = True,
-        actions: bool = True
+        actions: bool = True,
+        data_format: str = "records"
     ) -> Dict[str, Any]:
         """获取历史数据（带降级）"""
         return await self._execute_with_fallback(
@@ -113,7 +114,8 @@ class FallbackManager:
             end=end,
             auto_adjust=auto_adjust,
             prepost=prepost,
-            actions=actions
+            actions=actions,
+            data_format=data_format
         )
 
     async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, FastQuoteData]:
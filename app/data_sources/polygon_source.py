@@ -20,7 +20,7 @@ from polygon.rest.models import (
 from .base import BaseDataSource, DataSourceType
 from app.adapters.polygon_adapter import PolygonDataAdapter
 from app.models.quote import QuoteData, FastQuoteData, CompanyInfo
-from app.models.history import HistoryData
+from app.models.history import HistoryRecord
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.utils.exceptions import TickerNotFoundError, YahooAPIError
@@ -168,7 +168,7 @@ class PolygonDataSource(BaseDataSource):
     async def get_history_data(self,
                                symbol: str,
                                period: str = "1mo",
-                               interval: str = "1d") -> HistoryData:
+                               interval: str = "1d") -> List[HistoryRecord]:
         """获取历史数据"""
         try:
             logger.debug("获取Polygon历史数据",
@@ -212,7 +212,7 @@ class PolygonDataSource(BaseDataSource):
 
             logger.debug("Polygon历史数据获取成功",
                          symbol=symbol,
-                         count=len(history_data.prices) if hasattr(history_data, 'prices') else 0)
+                         count=len(history_data))
 
             return history_data
 
@@ -329,31 +329,48 @@ class PolygonDataSource(BaseDataSource):
         end: Optional[str] = None,
         auto_adjust: bool = True,
         prepost: bool = True,
-        actions: bool = True
+        actions: bool = True,
+        data_format: str = "records"
     ) -> Dict[str, Any]:
-        """获取历史数据（兼容yfinance接口）"""
+        """获取历史数据（兼容yfinance接口，data_format: records 按行 / columnar 按列）"""
         try:
             logger.debug("获取Polygon历史数据（兼容接口）",
                          symbol=symbol,
                          period=period)
 
             # 调用内部的历史数据方法
-            history_data = await self.get_history_data(symbol, period)
+            bars = await self.get_history_data(symbol, period)
+
+            # 列名与yfinance一致，降级前后返回的数据格式相同；
+            # Polygon日线聚合不含分红和拆股，对应列为空值
+            columns = {
+                "Date": [bar.date for bar in bars],
+                "Open": [bar.open for bar in bars],
+                "High": [bar.high for bar in bars],
+                "Low": [bar.low for bar in bars],
+                "Close": [bar.close for bar in bars],
+                "Volume": [bar.volume for bar in bars],
+            }
+            if actions:
+                columns["Dividends"] = [bar.dividends for bar in bars]
+                columns["Stock Splits"] = [bar.stock_splits for bar in bars]
 
-            # 添加兼容性字段
-            history_data.update({
-                "interval": interval,
-                "period": period,
-                "auto_adjust": auto_adjust,
-                "prepost": prepost,
-                "actions": actions
-            })
+            data = columns
+            if data_format != "columnar":
+                names = list(columns)
+                data = [dict(zip(names, row)) for row in zip(*columns.values())]
 
             logger.debug("Polygon历史数据获取成功（兼容接口）",
                          symbol=symbol,
-                         records_count=len(history_data.get('timestamps', [])))
+                         records_count=len(bars))
 
-            return history_data
+            return {
+                "data": data,
+                "period": period,
+                "interval": interval,
+                "total_records": len(bars),
+                "format": data_format,
+            }
 
         except Exception as e:
             logger.error("Polygon历史数据获取失败（兼容接口）",
@@ -14,6 +14,8 @@ import os
 import logging
 from urllib.parse import quote, urlencode
 
+from requests.adapters import HTTPAdapter
+
 try:
     from sec_api import (
         ExtractorApi, QueryApi, RenderApi, XbrlApi,
@@ -22,16 +24,36 @@ try:
         DirectorsBoardMembersApi, SecEnforcementActionsApi,
         MappingApi, SubsidiaryApi
     )
+    from sec_api import index as sec_api_index
     SEC_API_AVAILABLE = True
 except ImportError:
     SEC_API_AVAILABLE = False
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.utils.exceptions import FinanceAPIException
 
 logger = get_logger(__name__)
 
 
+class _PooledSession(requests.Session):
+    """带连接池和默认超时的HTTP会话"""
+
+    def __init__(self, timeout: float, pool_connections: int = 20, pool_maxsize: int = 50):
+        super().__init__()
+        self.timeout = timeout
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
 class SecAdvancedDataSource:
     """SEC高级数据源实现"""
 
@@ -88,6 +110,14 @@ class SecAdvancedDataSource:
             'Authorization': f'Bearer {self.api_key}'
         }
 
+        # sec-api SDK 内部直接调用模块级的 requests.get/post，每次请求都会重新建立TCP/TLS连接，
+        # 且不支持为客户端单独传入会话。创建数据源时将SDK模块中的 requests 替换为
+        # 本实例的连接池会话，使所有API客户端复用 keep-alive 连接，关闭时再恢复原模块。
+        # 空闲连接由服务端超时关闭后，urllib3 会在下次请求时自动重建。
+        self.session = _PooledSession(timeout=settings.sec_api_timeout)
+        self._replaced_requests = sec_api_index.requests
+        sec_api_index.requests = self.session
+
     # ===== XBRL转换功能 =====
 
     async def convert_xbrl_to_json(
@@ -1219,6 +1249,9 @@ class SecAdvancedDataSource:
         """关闭数据源连接"""
         try:
             logger.info("关闭SEC高级数据源连接")
-            # 这里可以添加任何清理代码
+            # 只恢复本实例安装的会话，其他实例已替换的会话保持不变
+            if sec_api_index.requests is self.session:
+                sec_api_index.requests = self._replaced_requests
+            self.session.close()
         except Exception as e:
             logger.error(f"关闭SEC高级数据源时出错: {e}")
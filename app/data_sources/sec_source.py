@@ -13,6 +13,7 @@ from decimal import Decimal
 import pandas as pd
 import os
 import logging
+from cachetools import TTLCache
 
 try:
     from sec_api import ExtractorApi, QueryApi, RenderApi, XbrlApi
@@ -38,6 +39,10 @@ from app.models.sec import (
 
 logger = logging.getLogger(__name__)
 
+# SEC公布的完整股票代码 -> CIK 映射，整表下载一次后在进程内缓存一天
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+_ticker_cik_cache: TTLCache = TTLCache(maxsize=1, ttl=24 * 3600)
+
 
 class SecDataSource(BaseDataSource):
     """SEC数据源实现"""
@@ -185,7 +190,8 @@ class SecDataSource(BaseDataSource):
         end: Optional[str] = None,
         auto_adjust: bool = True,
         prepost: bool = True,
-        actions: bool = True
+        actions: bool = True,
+        data_format: str = "records"
     ) -> Dict[str, Any]:
         """
         SEC数据源不提供历史价格数据
@@ -241,23 +247,31 @@ class SecDataSource(BaseDataSource):
                 'last_checked': datetime.now().isoformat()
             }
 
+    def _get_ticker_cik_map(self) -> Dict[str, str]:
+        """获取股票代码（大写）到CIK的映射，整表缓存24小时"""
+        ticker_map = _ticker_cik_cache.get(COMPANY_TICKERS_URL)
+        if ticker_map is not None:
+            return ticker_map
+
+        response = requests.get(
+            COMPANY_TICKERS_URL, headers=self.headers, timeout=10)
+        if response.status_code != 200:
+            return {}
+
+        ticker_map = {}
+        for company in response.json().values():
+            ticker_map.setdefault(
+                company.get('ticker', '').upper(), str(company.get('cik_str')))
+        _ticker_cik_cache[COMPANY_TICKERS_URL] = ticker_map
+        return ticker_map
+
     def _get_cik_from_ticker(self, ticker: str) -> Optional[str]:
         """
         从股票代码获取CIK
         使用SEC.gov免费API
         """
         try:
-            # 获取公司代码映射
-            tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            response = requests.get(
-                tickers_url, headers=self.headers, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                for key, company in data.items():
-                    if company.get('ticker', '').upper() == ticker.upper():
-                        return str(company.get('cik_str'))
-            return None
+            return self._get_ticker_cik_map().get(ticker.upper())
         except Exception as e:
             logger.error(f"获取CIK失败: {ticker}, 错误: {e}")
             return None
@@ -588,17 +602,8 @@ class SecDataSource(BaseDataSource):
     async def _get_company_cik(self, ticker: str) -> Optional[str]:
         """获取公司的CIK号码"""
         try:
-            # 使用SEC.gov的公司搜索API
-            tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            response = requests.get(
-                tickers_url, headers=self.headers, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                for key, company in data.items():
-                    if company.get('ticker', '').upper() == ticker.upper():
-                        return str(company.get('cik_str'))
-            return None
+            # 使用SEC.gov的公司代码映射（整表缓存）
+            return self._get_ticker_cik_map().get(ticker.upper())
         except Exception as e:
             logger.error(f"获取CIK失败: {ticker}, 错误: {e}")
             return None
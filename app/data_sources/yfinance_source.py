@@ -50,7 +50,8 @@ class YFinanceDataSource(BaseDataSource):
         end: Optional[str] = None,
         auto_adjust: bool = True,
         prepost: bool = True,
-        actions: bool = True
+        actions: bool = True,
+        data_format: str = "records"
     ) -> Dict[str, Any]:
         """获取历史数据"""
         async def _fetch():
@@ -62,7 +63,8 @@ class YFinanceDataSource(BaseDataSource):
                 end=end,
                 auto_adjust=auto_adjust,
                 prepost=prepost,
-                actions=actions
+                actions=actions,
+                data_format=data_format
             )
 
         return await self.execute_with_metrics("get_history", _fetch)
@@ -10,6 +10,7 @@ from typing import Dict, Any
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.datastructures import Default
 from fastapi.responses import JSONResponse
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
@@ -23,11 +24,13 @@ from app.utils.exceptions import (
     general_exception_handler,
     http_exception_handler,
 )
-from app.utils.cache import get_cache_info
+from app.utils.cache import close_cache, get_cache_info
+from app.utils.responses import ORJSONResponse
 
 # 导入数据源管理器
 from app.services.data_source_manager import DataSourceManager
 from app.services.sec_service import initialize_sec_service, shutdown_sec_service
+from app.services.yfinance_service import close_yf_session
 
 # 导入路由
 from app.api.v1 import (
@@ -102,11 +105,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("SEC服务关闭失败", error=str(e))
 
+    # 关闭yfinance共享HTTP会话
+    close_yf_session()
+
+    # 关闭缓存连接
+    await close_cache()
+
 
 # 创建 FastAPI 应用
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
+    # 未声明 response_model 的路由使用orjson序列化；
+    # 以 Default 包装，声明了 response_model 的路由仍走 Pydantic 直接序列化的快速路径
+    default_response_class=Default(ORJSONResponse),
     description="""
     ## Finance API
 
@@ -379,9 +391,15 @@ def get_data_source_manager() -> DataSourceManager:
 
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+
     import uvicorn
 
-    logger.info("启动开发服务器", host=settings.host, port=settings.port)
+    # 优先使用 uvloop 事件循环（未安装时回退到标准 asyncio）；
+    # 应用按字符串导入，事件循环由 uvicorn 自行安装（--reload 时同样生效）
+    loop_impl = "uvloop" if find_spec("uvloop") is not None else "asyncio"
+
+    logger.info("启动开发服务器", host=settings.host, port=settings.port, loop=loop_impl)
 
     uvicorn.run(
         "app.main:app",
@@ -389,4 +407,5 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        loop=loop_impl,
     )
@@ -74,7 +74,8 @@ class DataSourceManager:
         end: Optional[str] = None,
         auto_adjust: bool = True,
         prepost: bool = False,
-        actions: bool = True
+        actions: bool = True,
+        data_format: str = "records"
     ) -> dict:
         """获取历史数据"""
         await self._ensure_initialized()
@@ -86,7 +87,8 @@ class DataSourceManager:
             end=end,
             auto_adjust=auto_adjust,
             prepost=prepost,
-            actions=actions
+            actions=actions,
+            data_format=data_format
         )
 
     async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, FastQuoteData]:
@@ -4,11 +4,15 @@ SEC数据服务
 包括基础财务数据和高级功能（XBRL转换、全文搜索、内幕交易等）
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Awaitable, Callable
+from dataclasses import dataclass
 import asyncio
+import re
+import time
 from urllib.parse import quote
 
+import requests
+
 from app.data_sources.sec_source import SecDataSource
 from app.data_sources.sec_advanced_source import SecAdvancedDataSource
 from app.models.sec import (
@@ -24,10 +28,198 @@ from app.core.config import settings
 
 logger = get_logger(__name__)
 
+# 缓存告警节流：同一 (操作, 键前缀) 在窗口期内只记录一次告警
+_WARN_THROTTLE: Dict[str, float] = {}
+_WARN_THROTTLE_SECONDS = 30.0
+
+
+def _iso_now_utc() -> str:
+    """当前UTC时间的ISO 8601字符串（微秒精度），避免构造datetime对象"""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)) + f'.{nanos // 1000:06d}Z'
+
+
+def _warn_cache_failure(op: str, key: str, error: Exception) -> None:
+    """记录缓存操作失败（节流）"""
+    throttle_key = f"{op}:{':'.join(key.split(':', 2)[:2])}"
+    now = time.monotonic()
+    if now - _WARN_THROTTLE.get(throttle_key, float('-inf')) < _WARN_THROTTLE_SECONDS:
+        return
+    _WARN_THROTTLE[throttle_key] = now
+    logger.warning("缓存%s失败: %s, 错误: %s", op, key, error)
+
+
+# 上游（SEC API）故障的判定：超时、连接错误、5xx响应
+_TRANSPORT_ERRORS = (
+    TimeoutError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+# sec_api 库以 "API error: <状态码> - <响应体>" 的通用异常报告非200响应
+_API_ERROR_STATUS = re.compile(r"API error: (\d{3})")
+
+
+def _is_upstream_failure(exc: BaseException) -> bool:
+    """
+    判断异常是否由上游服务故障引起
+
+    数据源会把原始异常包装为FinanceAPIException，因此沿异常链逐层检查；
+    未找到、参数错误等调用方错误说明上游可正常响应，不计入熔断。
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, _TRANSPORT_ERRORS):
+            return True
+
+        status = getattr(getattr(exc, 'response', None), 'status_code', None)
+        if status is None:
+            match = _API_ERROR_STATUS.search(str(exc))
+            status = int(match.group(1)) if match else None
+        if status is not None and status >= 500:
+            return True
+
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class _CircuitBreaker:
+    """简单熔断器：上游连续故障达到阈值后，在冷却期内直接快速失败"""
+
+    __slots__ = ('name', 'fail_max', 'reset_timeout', 'failures', 'opened_at', 'probing')
+
+    def __init__(self, name: str, fail_max: int, reset_timeout: float):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # 半开状态下是否已有试探请求在进行中
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        """熔断器状态：closed / open / half_open"""
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return 'open'
+        return 'half_open'
+
+    def _unavailable(self) -> FinanceAPIException:
+        return FinanceAPIException(
+            message=f"SEC上游服务暂不可用({self.name})，请稍后重试",
+            code="UPSTREAM_UNAVAILABLE",
+            status_code=503
+        )
+
+    def wrap(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """用熔断器包装数据源方法"""
+        async def guarded(**kwargs) -> Any:
+            state = self.state
+            if state == 'open':
+                raise self._unavailable()
+
+            # 冷却期结束后只放行一个试探请求，其余请求在试探完成前继续快速失败
+            is_probe = state == 'half_open'
+            if is_probe:
+                if self.probing:
+                    raise self._unavailable()
+                self.probing = True
+
+            try:
+                result = await func(**kwargs)
+            except Exception as e:
+                if _is_upstream_failure(e):
+                    self._record_failure()
+                else:
+                    # 调用方错误（如股票代码不存在）说明上游响应正常
+                    self._reset()
+                raise
+            finally:
+                if is_probe:
+                    self.probing = False
+
+            self._reset()
+            return result
+
+        return guarded
+
+    def _reset(self) -> None:
+        """上游响应正常，关闭熔断器并清零失败计数"""
+        self.failures = 0
+        self.opened_at = None
+
+    def _record_failure(self) -> None:
+        """记录一次上游故障，达到阈值时打开熔断器"""
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            if self.opened_at is None:
+                logger.warning("SEC接口熔断已打开: %s, 连续失败: %s", self.name, self.failures)
+            # 半开状态下试探失败会重新开始计时
+            self.opened_at = time.monotonic()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheTTLs:
+    """各类SEC数据的缓存过期时间(秒)"""
+    financials: int
+    news: int
+    ratios: int
+    xbrl: int
+    search: int
+    insider: int
+    holdings: int
+    ipo: int
+    compensation: int
+    governance: int
+    enforcement: int
+    mapping: int
+
 
 class SecService:
     """SEC数据服务 - 包含基础财务数据和高级功能"""
 
+    __slots__ = (
+        'data_source',
+        'advanced_data_source',
+        'advanced_available',
+        'cache_config',
+        # 预绑定的高级数据源方法
+        '_fetch_xbrl_conversion',
+        '_fetch_xbrl_data',
+        '_fetch_full_text_search',
+        '_fetch_company_search',
+        '_fetch_insider_trading',
+        '_fetch_holdings',
+        '_fetch_recent_ipos',
+        '_fetch_ipo_details',
+        '_fetch_compensation',
+        '_fetch_governance',
+        '_fetch_enforcement',
+        '_fetch_cik_mapping',
+        'ttls',
+        'breakers',
+    )
+
+    # 高级功能分发表：预绑定属性名 -> 高级数据源方法名
+    _ADVANCED_FETCHERS = {
+        '_fetch_xbrl_conversion': 'convert_xbrl_to_json',
+        '_fetch_xbrl_data': 'get_company_xbrl_data',
+        '_fetch_full_text_search': 'full_text_search',
+        '_fetch_company_search': 'search_company_filings',
+        '_fetch_insider_trading': 'get_insider_trading',
+        '_fetch_holdings': 'get_institutional_holdings',
+        '_fetch_recent_ipos': 'get_recent_ipos',
+        '_fetch_ipo_details': 'get_company_ipo_details',
+        '_fetch_compensation': 'get_executive_compensation',
+        '_fetch_governance': 'get_company_governance',
+        '_fetch_enforcement': 'get_recent_enforcement_actions',
+        '_fetch_cik_mapping': 'get_ticker_to_cik_mapping',
+    }
+
     def __init__(self, api_key: Optional[str] = None):
         """
         初始化SEC服务
@@ -42,7 +234,7 @@ class SecService:
         try:
             self.data_source = SecDataSource(api_key=api_key)
         except Exception as e:
-            logger.error(f"SEC基础数据源初始化失败: {e}")
+            logger.error("SEC基础数据源初始化失败: %s", e)
             raise FinanceAPIException(
                 message=f"SEC基础服务不可用: {str(e)}",
                 code="SEC_SERVICE_UNAVAILABLE"
@@ -54,10 +246,26 @@ class SecService:
             self.advanced_available = True
             logger.info("SEC高级功能已启用")
         except Exception as e:
-            logger.warning(f"SEC高级数据源初始化失败: {e}, 将仅提供基础功能")
+            logger.warning("SEC高级数据源初始化失败: %s, 将仅提供基础功能", e)
             self.advanced_data_source = None
             self.advanced_available = False
 
+        # 按分发表一次性绑定高级数据源方法：可用时绑定到带熔断的数据源实现，
+        # 不可用时统一绑定到占位方法，各业务方法无需再判断可用性
+        self.breakers: Dict[str, _CircuitBreaker] = {}
+        for attr, method_name in self._ADVANCED_FETCHERS.items():
+            if self.advanced_available:
+                # 每个接口独立熔断，避免单个慢接口拖垮全部高级功能
+                breaker = _CircuitBreaker(
+                    name=method_name,
+                    fail_max=settings.sec_breaker_fail_max,
+                    reset_timeout=settings.sec_breaker_reset_timeout
+                )
+                self.breakers[method_name] = breaker
+                setattr(self, attr, breaker.wrap(getattr(self.advanced_data_source, method_name)))
+            else:
+                setattr(self, attr, self._unavailable_stub)
+
         # 缓存配置
         self.cache_config = {
             # 基础功能缓存
@@ -77,6 +285,89 @@ class SecService:
             'mapping': {'ttl': 86400},      # 映射数据缓存24小时
         }
 
+        # 各类数据的缓存TTL，写缓存时直接按属性读取
+        self.ttls = CacheTTLs(**{k: v['ttl'] for k, v in self.cache_config.items()})
+
+    async def _safe_cache_get(self, key: str) -> Optional[Any]:
+        """读取缓存，失败时返回None"""
+        try:
+            return await get_cache_value(key)
+        except Exception as e:
+            _warn_cache_failure("get", key, e)
+            return None
+
+    async def _safe_cache_set(self, key: str, value: Any, ttl: int) -> bool:
+        """写入缓存，返回是否成功"""
+        try:
+            return await set_cache_value(key, value, ttl=ttl)
+        except Exception as e:
+            _warn_cache_failure("set", key, e)
+            return False
+
+    async def _cached_call(
+        self,
+        label: str,
+        subject: str,
+        cache_key_fn: Callable[[], str],
+        fetcher: Callable[[], Awaitable[Any]],
+        ttl: int,
+        use_cache: bool = True,
+        error_message: str = "获取SEC数据失败",
+        error_code: str = "SEC_DATA_ERROR"
+    ) -> Any:
+        """
+        带缓存的数据获取
+
+        Args:
+            label: 数据描述，用于日志
+            subject: 查询对象（股票代码等），用于日志
+            cache_key_fn: 缓存键构建函数，仅在使用缓存时调用
+            fetcher: 数据获取函数
+            ttl: 缓存过期时间(秒)
+            use_cache: 是否使用缓存
+            error_message: 包装非业务异常时使用的错误信息前缀
+            error_code: 包装非业务异常时使用的错误代码
+
+        Returns:
+            缓存或数据源返回的数据
+
+        Raises:
+            FinanceAPIException: 获取失败时抛出，非业务异常会被包装并保留原始异常链
+        """
+        try:
+            if not use_cache:
+                logger.info("从SEC数据源获取%s: %s", label, subject)
+                return await fetcher()
+
+            cache_key = cache_key_fn()
+            cached_data = await self._safe_cache_get(cache_key)
+            if cached_data:
+                logger.info("从缓存获取%s: %s", label, subject)
+                return cached_data
+
+            logger.info("从SEC数据源获取%s: %s", label, subject)
+            result = await fetcher()
+
+            if await self._safe_cache_set(cache_key, result, ttl):
+                logger.debug("%s已缓存: %s", label, subject)
+
+            return result
+        except FinanceAPIException:
+            raise
+        except Exception as e:
+            logger.error("%s: %s, 错误: %s", error_message, subject, e)
+            raise FinanceAPIException(
+                message=f"{error_message}: {str(e)}",
+                code=error_code
+            ) from e
+
+    async def _unavailable_stub(self, **kwargs) -> Dict[str, Any]:
+        """高级功能不可用时的占位数据获取方法"""
+        raise FinanceAPIException(
+            message="SEC高级功能不可用",
+            code="SEC_ADVANCED_UNAVAILABLE"
+        )
+
     async def get_company_financials(
         self,
         ticker: str,
@@ -114,22 +405,7 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:financials:{ticker}:{years}:{include_quarterly}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取财务数据: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取财务数据: {ticker}")
+        async def _fetch():
             result = await self.data_source.get_company_financials(
                 ticker=ticker,
                 years=years,
@@ -141,30 +417,18 @@ class SecService:
                     message=f"未找到股票代码 {ticker} 的财务数据",
                     code="DATA_NOT_FOUND"
                 )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['financials']['ttl']
-                    )
-                    logger.debug(f"财务数据已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
             return result
 
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取财务数据失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取财务数据失败: {str(e)}",
-                code="FINANCIALS_ERROR"
-            )
+        return await self._cached_call(
+            label="财务数据",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:financials:{ticker}:{years}:{include_quarterly}",
+            fetcher=_fetch,
+            ttl=self.ttls.financials,
+            use_cache=use_cache,
+            error_message="获取财务数据失败",
+            error_code="FINANCIALS_ERROR"
+        )
 
     async def get_quarterly_revenue(
         self,
@@ -234,7 +498,7 @@ class SecService:
             'company_name': financials.get('company_name', f'{ticker} Corporation'),
             'quarterly_data': quarterly_revenues,
             'total_quarters': len(quarterly_revenues),
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _iso_now_utc()
         }
 
     async def get_company_news(
@@ -261,21 +525,8 @@ class SecService:
             )
 
         ticker = ticker.upper().strip()
-        cache_key = f"sec:news:{ticker}:{limit}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取SEC新闻: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取新闻缓存失败: {e}")
 
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取新闻: {ticker}")
+        async def _fetch():
             news_items = await self.data_source.get_company_news(
                 ticker=ticker,
                 limit=limit
@@ -286,32 +537,20 @@ class SecService:
                 'company_name': f'{ticker} Corporation',
                 'news_items': news_items,
                 'total_count': len(news_items),
-                'last_updated': datetime.now().isoformat()
+                'last_updated': _iso_now_utc()
             }
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['news']['ttl']
-                    )
-                    logger.debug(f"SEC新闻已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"新闻缓存设置失败: {e}")
-
             return result
 
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取SEC新闻失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取SEC新闻失败: {str(e)}",
-                code="NEWS_ERROR"
-            )
+        return await self._cached_call(
+            label="SEC新闻",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:news:{ticker}:{limit}",
+            fetcher=_fetch,
+            ttl=self.ttls.news,
+            use_cache=use_cache,
+            error_message="获取SEC新闻失败",
+            error_code="NEWS_ERROR"
+        )
 
     async def get_financial_ratios(
         self,
@@ -337,20 +576,8 @@ class SecService:
             )
 
         ticker = ticker.upper().strip()
-        cache_key = f"sec:ratios:{ticker}:{period}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取财务比率: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取比率缓存失败: {e}")
 
-        try:
-            # 获取财务数据
+        async def _fetch():
             financials = await self.get_company_financials(
                 ticker=ticker,
                 years=2,
@@ -373,59 +600,41 @@ class SecService:
             ratios = {}
             period_info = f"{period}_{latest.get('fiscal_year', 2023)}"
 
-            if latest.get('total_assets') and latest.get('total_debt'):
+            total_assets = latest.get('total_assets')
+            total_debt = latest.get('total_debt')
+            net_income = latest.get('net_income')
+
+            if total_assets and total_debt and total_assets > 0:
                 # 计算负债权益比
-                if latest.get('total_assets') > 0:
-                    ratios['debt_to_equity'] = round(
-                        float(latest.get('total_debt', 0) /
-                              latest.get('total_assets')), 4
-                    )
-
-                # 计算ROA (需要净利润和总资产)
-                if latest.get('net_income') and latest.get('total_assets') > 0:
-                    ratios['roa'] = round(
-                        float(latest.get('net_income') /
-                              latest.get('total_assets')) * 100, 2
-                    )
-
-                # 计算ROE (使用总资产作为近似)
-                if latest.get('net_income') and latest.get('total_assets') > 0:
-                    ratios['roe'] = round(
-                        float(latest.get('net_income') /
-                              latest.get('total_assets')) * 100, 2
-                    )
+                ratios['debt_to_equity'] = round(
+                    float(total_debt / total_assets), 4)
+
+                # 计算ROA (需要净利润和总资产)；ROE 使用总资产作为近似，与ROA相同
+                if net_income:
+                    return_on_assets = round(
+                        float(net_income / total_assets) * 100, 2)
+                    ratios['roa'] = return_on_assets
+                    ratios['roe'] = return_on_assets
 
             result = {
                 'ticker': ticker,
                 'period': period_info,
                 'ratios': ratios,
-                'calculation_date': datetime.now().isoformat(),
+                'calculation_date': _iso_now_utc(),
                 'data_source': 'SEC EDGAR'
             }
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['ratios']['ttl']
-                    )
-                    logger.debug(f"财务比率已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"比率缓存设置失败: {e}")
-
             return result
 
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"计算财务比率失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"计算财务比率失败: {str(e)}",
-                code="RATIOS_ERROR"
-            )
+        return await self._cached_call(
+            label="财务比率",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:ratios:{ticker}:{period}",
+            fetcher=_fetch,
+            ttl=self.ttls.ratios,
+            use_cache=use_cache,
+            error_message="计算财务比率失败",
+            error_code="RATIOS_ERROR"
+        )
 
     async def get_annual_comparison(
         self,
@@ -509,7 +718,7 @@ class SecService:
                 'latest_year': comparison_data[0]['fiscal_year'] if comparison_data else None,
                 'earliest_year': comparison_data[-1]['fiscal_year'] if comparison_data else None
             },
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _iso_now_utc()
         }
 
     # ===== 高级功能：XBRL转换 =====
@@ -534,35 +743,14 @@ class SecService:
         Raises:
             FinanceAPIException: 转换失败时抛出
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not filing_url or not filing_url.strip():
             raise FinanceAPIException(
                 message="XBRL文件URL不能为空",
                 code="INVALID_FILING_URL"
             )
 
-        # 构建缓存键
-        cache_key = f"sec:xbrl:convert:{quote(filing_url)}:{include_dimensions}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取XBRL转换数据: {filing_url}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取转换数据
-            logger.info(f"从SEC数据源转换XBRL: {filing_url}")
-            result = await self.advanced_data_source.convert_xbrl_to_json(
+        async def _fetch():
+            result = await self._fetch_xbrl_conversion(
                 filing_url=filing_url,
                 include_dimensions=include_dimensions
             )
@@ -572,30 +760,18 @@ class SecService:
                     message=f"XBRL文件转换失败: {filing_url}",
                     code="XBRL_CONVERSION_FAILED"
                 )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['xbrl']['ttl']
-                    )
-                    logger.debug(f"XBRL转换数据已缓存: {filing_url}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
             return result
 
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"XBRL转换失败: {filing_url}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"XBRL转换失败: {str(e)}",
-                code="XBRL_CONVERSION_ERROR"
-            )
+        return await self._cached_call(
+            label="XBRL转换数据",
+            subject=filing_url,
+            cache_key_fn=lambda: f"sec:xbrl:convert:{quote(filing_url)}:{include_dimensions}",
+            fetcher=_fetch,
+            ttl=self.ttls.xbrl,
+            use_cache=use_cache,
+            error_message="XBRL转换失败",
+            error_code="XBRL_CONVERSION_ERROR"
+        )
 
     async def get_company_xbrl_data(
         self,
@@ -616,12 +792,6 @@ class SecService:
         Returns:
             公司XBRL数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         # 参数验证
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
@@ -631,23 +801,8 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:xbrl:company:{ticker}:{form_type}:{fiscal_year}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取公司XBRL数据: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取公司XBRL数据: {ticker}")
-            result = await self.advanced_data_source.get_company_xbrl_data(
+        async def _fetch():
+            result = await self._fetch_xbrl_data(
                 ticker=ticker,
                 form_type=form_type,
                 fiscal_year=fiscal_year
@@ -658,30 +813,18 @@ class SecService:
                     message=f"未找到股票代码 {ticker} 的XBRL数据",
                     code="XBRL_DATA_NOT_FOUND"
                 )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['xbrl']['ttl']
-                    )
-                    logger.debug(f"公司XBRL数据已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
             return result
 
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取公司XBRL数据失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取公司XBRL数据失败: {str(e)}",
-                code="XBRL_DATA_ERROR"
-            )
+        return await self._cached_call(
+            label="公司XBRL数据",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:xbrl:company:{ticker}:{form_type}:{fiscal_year}",
+            fetcher=_fetch,
+            ttl=self.ttls.xbrl,
+            use_cache=use_cache,
+            error_message="获取公司XBRL数据失败",
+            error_code="XBRL_DATA_ERROR"
+        )
 
     # ===== 高级功能：全文搜索 =====
 
@@ -708,65 +851,28 @@ class SecService:
         Returns:
             搜索结果
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not query or not query.strip():
             raise FinanceAPIException(
                 message="搜索查询不能为空",
                 code="INVALID_SEARCH_QUERY"
             )
 
-        # 构建缓存键
-        cache_key = f"sec:search:fulltext:{quote(query)}:{'-'.join(form_types or [])}:{date_from}:{date_to}:{limit}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取全文搜索结果: {query}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源搜索
-            logger.info(f"执行SEC全文搜索: {query}")
-            result = await self.advanced_data_source.full_text_search(
+        return await self._cached_call(
+            label="全文搜索结果",
+            subject=query,
+            cache_key_fn=lambda: f"sec:search:fulltext:{quote(query)}:{'-'.join(form_types or [])}:{date_from}:{date_to}:{limit}",
+            fetcher=lambda: self._fetch_full_text_search(
                 query=query,
                 form_types=form_types,
                 date_from=date_from,
                 date_to=date_to,
                 limit=limit
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['search']['ttl']
-                    )
-                    logger.debug(f"全文搜索结果已缓存: {query}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"全文搜索失败: {query}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"全文搜索失败: {str(e)}",
-                code="FULLTEXT_SEARCH_ERROR"
-            )
+            ),
+            ttl=self.ttls.search,
+            use_cache=use_cache,
+            error_message="全文搜索失败",
+            error_code="FULLTEXT_SEARCH_ERROR"
+        )
 
     async def search_company_filings(
         self,
@@ -789,12 +895,6 @@ class SecService:
         Returns:
             搜索结果
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -809,52 +909,21 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:search:company:{ticker}:{quote(query)}:{'-'.join(form_types or [])}:{years}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取公司文件搜索结果: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源搜索
-            logger.info(f"在公司文件中搜索: {ticker}, 查询: {query}")
-            result = await self.advanced_data_source.search_company_filings(
+        return await self._cached_call(
+            label="公司文件搜索结果",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:search:company:{ticker}:{quote(query)}:{'-'.join(form_types or [])}:{years}",
+            fetcher=lambda: self._fetch_company_search(
                 ticker=ticker,
                 query=query,
                 form_types=form_types,
                 years=years
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['search']['ttl']
-                    )
-                    logger.debug(f"公司文件搜索结果已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"公司文件搜索失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"公司文件搜索失败: {str(e)}",
-                code="COMPANY_SEARCH_ERROR"
-            )
+            ),
+            ttl=self.ttls.search,
+            use_cache=use_cache,
+            error_message="公司文件搜索失败",
+            error_code="COMPANY_SEARCH_ERROR"
+        )
 
     # ===== 高级功能：内幕交易数据 =====
 
@@ -877,12 +946,6 @@ class SecService:
         Returns:
             内幕交易数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -897,51 +960,20 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:insider:{ticker}:{days_back}:{include_derivatives}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取内幕交易数据: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取内幕交易数据: {ticker}")
-            result = await self.advanced_data_source.get_insider_trading(
+        return await self._cached_call(
+            label="内幕交易数据",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:insider:{ticker}:{days_back}:{include_derivatives}",
+            fetcher=lambda: self._fetch_insider_trading(
                 ticker=ticker,
                 days_back=days_back,
                 include_derivatives=include_derivatives
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['insider']['ttl']
-                    )
-                    logger.debug(f"内幕交易数据已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取内幕交易数据失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取内幕交易数据失败: {str(e)}",
-                code="INSIDER_TRADING_ERROR"
-            )
+            ),
+            ttl=self.ttls.insider,
+            use_cache=use_cache,
+            error_message="获取内幕交易数据失败",
+            error_code="INSIDER_TRADING_ERROR"
+        )
 
     # ===== 高级功能：机构持股数据 =====
 
@@ -964,12 +996,6 @@ class SecService:
         Returns:
             机构持股数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -984,51 +1010,20 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:holdings:{ticker}:{quarters}:{min_value}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取机构持股数据: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取机构持股数据: {ticker}")
-            result = await self.advanced_data_source.get_institutional_holdings(
+        return await self._cached_call(
+            label="机构持股数据",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:holdings:{ticker}:{quarters}:{min_value}",
+            fetcher=lambda: self._fetch_holdings(
                 ticker=ticker,
                 quarters=quarters,
                 min_value=min_value
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['holdings']['ttl']
-                    )
-                    logger.debug(f"机构持股数据已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取机构持股数据失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取机构持股数据失败: {str(e)}",
-                code="INSTITUTIONAL_HOLDINGS_ERROR"
-            )
+            ),
+            ttl=self.ttls.holdings,
+            use_cache=use_cache,
+            error_message="获取机构持股数据失败",
+            error_code="INSTITUTIONAL_HOLDINGS_ERROR"
+        )
 
     # ===== 高级功能：IPO数据 =====
 
@@ -1049,62 +1044,25 @@ class SecService:
         Returns:
             IPO数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not (1 <= days_back <= 365):
             raise FinanceAPIException(
                 message="查询天数必须在1-365之间",
                 code="INVALID_DAYS_BACK"
             )
 
-        # 构建缓存键
-        cache_key = f"sec:ipo:recent:{days_back}:{min_offering_amount}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取最近IPO数据")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取最近IPO数据")
-            result = await self.advanced_data_source.get_recent_ipos(
+        return await self._cached_call(
+            label="最近IPO数据",
+            subject=f"{days_back}天",
+            cache_key_fn=lambda: f"sec:ipo:recent:{days_back}:{min_offering_amount}",
+            fetcher=lambda: self._fetch_recent_ipos(
                 days_back=days_back,
                 min_offering_amount=min_offering_amount
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['ipo']['ttl']
-                    )
-                    logger.debug(f"最近IPO数据已缓存")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取最近IPO数据失败, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取最近IPO数据失败: {str(e)}",
-                code="IPO_DATA_ERROR"
-            )
+            ),
+            ttl=self.ttls.ipo,
+            use_cache=use_cache,
+            error_message="获取最近IPO数据失败",
+            error_code="IPO_DATA_ERROR"
+        )
 
     async def get_company_ipo_details(
         self,
@@ -1121,12 +1079,6 @@ class SecService:
         Returns:
             公司IPO详情
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -1135,47 +1087,16 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:ipo:company:{ticker}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取公司IPO详情: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取公司IPO详情: {ticker}")
-            result = await self.advanced_data_source.get_company_ipo_details(ticker=ticker)
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['ipo']['ttl']
-                    )
-                    logger.debug(f"公司IPO详情已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取公司IPO详情失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取公司IPO详情失败: {str(e)}",
-                code="COMPANY_IPO_ERROR"
-            )
+        return await self._cached_call(
+            label="公司IPO详情",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:ipo:company:{ticker}",
+            fetcher=lambda: self._fetch_ipo_details(ticker=ticker),
+            ttl=self.ttls.ipo,
+            use_cache=use_cache,
+            error_message="获取公司IPO详情失败",
+            error_code="COMPANY_IPO_ERROR"
+        )
 
     # ===== 高级功能：高管薪酬数据 =====
 
@@ -1196,12 +1117,6 @@ class SecService:
         Returns:
             高管薪酬数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -1216,50 +1131,19 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:compensation:{ticker}:{years}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取高管薪酬数据: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取高管薪酬数据: {ticker}")
-            result = await self.advanced_data_source.get_executive_compensation(
+        return await self._cached_call(
+            label="高管薪酬数据",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:compensation:{ticker}:{years}",
+            fetcher=lambda: self._fetch_compensation(
                 ticker=ticker,
                 years=years
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['compensation']['ttl']
-                    )
-                    logger.debug(f"高管薪酬数据已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取高管薪酬数据失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取高管薪酬数据失败: {str(e)}",
-                code="EXECUTIVE_COMPENSATION_ERROR"
-            )
+            ),
+            ttl=self.ttls.compensation,
+            use_cache=use_cache,
+            error_message="获取高管薪酬数据失败",
+            error_code="EXECUTIVE_COMPENSATION_ERROR"
+        )
 
     # ===== 高级功能：公司治理数据 =====
 
@@ -1282,12 +1166,6 @@ class SecService:
         Returns:
             公司治理信息
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -1296,51 +1174,20 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:governance:{ticker}:{include_subsidiaries}:{include_audit_fees}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取公司治理信息: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取公司治理信息: {ticker}")
-            result = await self.advanced_data_source.get_company_governance(
+        return await self._cached_call(
+            label="公司治理信息",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:governance:{ticker}:{include_subsidiaries}:{include_audit_fees}",
+            fetcher=lambda: self._fetch_governance(
                 ticker=ticker,
                 include_subsidiaries=include_subsidiaries,
                 include_audit_fees=include_audit_fees
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['governance']['ttl']
-                    )
-                    logger.debug(f"公司治理信息已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取公司治理信息失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取公司治理信息失败: {str(e)}",
-                code="COMPANY_GOVERNANCE_ERROR"
-            )
+            ),
+            ttl=self.ttls.governance,
+            use_cache=use_cache,
+            error_message="获取公司治理信息失败",
+            error_code="COMPANY_GOVERNANCE_ERROR"
+        )
 
     # ===== 高级功能：SEC执法数据 =====
 
@@ -1361,62 +1208,25 @@ class SecService:
         Returns:
             SEC执法行动数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not (1 <= days_back <= 365):
             raise FinanceAPIException(
                 message="查询天数必须在1-365之间",
                 code="INVALID_DAYS_BACK"
             )
 
-        # 构建缓存键
-        cache_key = f"sec:enforcement:{days_back}:{action_type}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取SEC执法行动数据")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取SEC执法行动数据")
-            result = await self.advanced_data_source.get_recent_enforcement_actions(
+        return await self._cached_call(
+            label="SEC执法行动数据",
+            subject=f"{days_back}天",
+            cache_key_fn=lambda: f"sec:enforcement:{days_back}:{action_type}",
+            fetcher=lambda: self._fetch_enforcement(
                 days_back=days_back,
                 action_type=action_type
-            )
-
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['enforcement']['ttl']
-                    )
-                    logger.debug(f"SEC执法行动数据已缓存")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
-
-            return result
-
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
-
-            logger.error(f"获取SEC执法行动数据失败, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取SEC执法行动数据失败: {str(e)}",
-                code="ENFORCEMENT_ACTIONS_ERROR"
-            )
+            ),
+            ttl=self.ttls.enforcement,
+            use_cache=use_cache,
+            error_message="获取SEC执法行动数据失败",
+            error_code="ENFORCEMENT_ACTIONS_ERROR"
+        )
 
     # ===== 高级功能：映射和实体数据 =====
 
@@ -1437,12 +1247,6 @@ class SecService:
         Returns:
             映射数据
         """
-        if not self.advanced_available:
-            raise FinanceAPIException(
-                message="SEC高级功能不可用",
-                code="SEC_ADVANCED_UNAVAILABLE"
-            )
-
         if not ticker or not ticker.strip():
             raise FinanceAPIException(
                 message="股票代码不能为空",
@@ -1451,50 +1255,61 @@ class SecService:
 
         ticker = ticker.upper().strip()
 
-        # 构建缓存键
-        cache_key = f"sec:mapping:{ticker}:{include_historical}"
-
-        # 尝试从缓存获取
-        if use_cache:
-            try:
-                cached_data = await get_cache_value(cache_key)
-                if cached_data:
-                    logger.info(f"从缓存获取CIK映射: {ticker}")
-                    return cached_data
-            except Exception as e:
-                logger.warning(f"获取缓存失败: {e}")
-
-        try:
-            # 从数据源获取数据
-            logger.info(f"从SEC数据源获取CIK映射: {ticker}")
-            result = await self.advanced_data_source.get_ticker_to_cik_mapping(
+        return await self._cached_call(
+            label="CIK映射",
+            subject=ticker,
+            cache_key_fn=lambda: f"sec:mapping:{ticker}:{include_historical}",
+            fetcher=lambda: self._fetch_cik_mapping(
                 ticker=ticker,
                 include_historical=include_historical
-            )
+            ),
+            ttl=self.ttls.mapping,
+            use_cache=use_cache,
+            error_message="获取CIK映射失败",
+            error_code="CIK_MAPPING_ERROR"
+        )
 
-            # 缓存结果
-            if use_cache:
-                try:
-                    await set_cache_value(
-                        cache_key,
-                        result,
-                        ttl=self.cache_config['mapping']['ttl']
-                    )
-                    logger.debug(f"CIK映射已缓存: {ticker}")
-                except Exception as e:
-                    logger.warning(f"缓存设置失败: {e}")
+    async def get_company_full_picture(
+        self,
+        ticker: str,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        并发获取公司全景数据（机构持股、公司治理、高管薪酬、CIK映射）
 
-            return result
+        Args:
+            ticker: 股票代码
+            use_cache: 是否使用缓存
 
-        except Exception as e:
-            if isinstance(e, FinanceAPIException):
-                raise
+        Returns:
+            按数据类别汇总的公司数据
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                holdings = tg.create_task(
+                    self.get_institutional_holdings(ticker=ticker, use_cache=use_cache)
+                )
+                governance = tg.create_task(
+                    self.get_company_governance(ticker=ticker, use_cache=use_cache)
+                )
+                compensation = tg.create_task(
+                    self.get_executive_compensation(ticker=ticker, use_cache=use_cache)
+                )
+                mapping = tg.create_task(
+                    self.get_ticker_to_cik_mapping(ticker=ticker, use_cache=use_cache)
+                )
+        except* FinanceAPIException as eg:
+            # 任一子任务失败时其余任务会被取消，向上抛出第一个业务异常
+            raise eg.exceptions[0]
 
-            logger.error(f"获取CIK映射失败: {ticker}, 错误: {e}")
-            raise FinanceAPIException(
-                message=f"获取CIK映射失败: {str(e)}",
-                code="CIK_MAPPING_ERROR"
-            )
+        return {
+            'ticker': ticker.upper().strip(),
+            'holdings': holdings.result(),
+            'governance': governance.result(),
+            'compensation': compensation.result(),
+            'mapping': mapping.result(),
+            'last_updated': _iso_now_utc()
+        }
 
     async def get_health_status(self) -> Dict[str, Any]:
         """获取SEC服务健康状态"""
@@ -1508,7 +1323,7 @@ class SecService:
                 try:
                     advanced_status = await self.advanced_data_source.get_health_status()
                 except Exception as e:
-                    logger.warning(f"高级数据源健康检查失败: {e}")
+                    logger.warning("高级数据源健康检查失败: %s", e)
                     advanced_status = {"status": "unhealthy", "error": str(e)}
 
             return {
@@ -1517,15 +1332,16 @@ class SecService:
                 'basic_data_source_status': basic_status,
                 'advanced_available': self.advanced_available,
                 'advanced_data_source_status': advanced_status,
+                'circuit_breakers': {name: b.state for name, b in self.breakers.items()},
                 'cache_enabled': True,
-                'last_checked': datetime.now().isoformat()
+                'last_checked': _iso_now_utc()
             }
         except Exception as e:
             return {
                 'service': 'sec_service',
                 'status': 'unhealthy',
                 'error': str(e),
-                'last_checked': datetime.now().isoformat()
+                'last_checked': _iso_now_utc()
             }
 
     async def shutdown(self):
@@ -1536,7 +1352,7 @@ class SecService:
                 await self.advanced_data_source.shutdown()
             logger.info("SEC服务已关闭")
         except Exception as e:
-            logger.error(f"关闭SEC服务失败: {e}")
+            logger.error("关闭SEC服务失败: %s", e)
 
 
 # 全局服务实例
@@ -1558,7 +1374,7 @@ def get_sec_service() -> SecService:
                 logger.info("SEC服务已初始化（使用免费API）")
 
         except Exception as e:
-            logger.error(f"SEC服务初始化失败: {e}")
+            logger.error("SEC服务初始化失败: %s", e)
             raise FinanceAPIException(
                 message=f"SEC服务不可用: {str(e)}",
                 code="SEC_SERVICE_UNAVAILABLE"
@@ -1573,7 +1389,7 @@ async def initialize_sec_service(api_key: Optional[str] = None):
         _sec_service = SecService(api_key=api_key)
         logger.info("SEC服务已初始化")
     except Exception as e:
-        logger.error(f"SEC服务初始化失败: {e}")
+        logger.error("SEC服务初始化失败: %s", e)
         # 不抛出异常，允许应用继续启动，但服务不可用
         _sec_service = None
 
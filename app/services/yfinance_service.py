@@ -4,23 +4,106 @@ yfinance 服务层
 """
 
 import asyncio
+import threading
 import time
 from typing import Dict, List, Optional, Any
 from concurrent.futures import ThreadPoolExecutor
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
+from curl_cffi import requests as curl_requests
+from yfinance.data import YfData
 
 from app.core.config import settings
 from app.core.logging import get_logger, log_yfinance_call
 from app.models.quote import QuoteData, FastQuoteData, CompanyInfo
-from app.utils.exceptions import TickerNotFoundError, YahooAPIError
-from app.utils.cache import quote_cache, history_cache, financial_cache, news_cache
+from app.utils.exceptions import FinanceAPIException, TickerNotFoundError, YahooAPIError
+from app.utils.cache import quote_cache, history_cache, cache_key_builder
 
 logger = get_logger(__name__)
 
 # 线程池执行器，用于异步执行同步的yfinance调用
-executor = ThreadPoolExecutor(max_workers=10)
+# yfinance调用几乎全部是网络等待，线程数按I/O并发而非CPU核数设置
+executor = ThreadPoolExecutor(
+    max_workers=settings.yf_executor_workers,
+    thread_name_prefix="yf"
+)
+
+# HTTP层重试：首次重试前的等待时间(秒)，之后按指数退避
+YF_RETRY_DELAY = 0.5
+# 需要重试的响应状态码（限流和上游临时故障）
+YF_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class _StatusRetrySession(curl_requests.Session):
+    """
+    按响应状态码重试的curl_cffi会话
+
+    curl_cffi 的 RetryStrategy 只重试传输层错误（连接失败、超时等），
+    429/5xx 响应由这里按指数退避重发；会话只在线程池中使用，可直接 sleep。
+    """
+
+    def request(self, *args, **kwargs):
+        response = super().request(*args, **kwargs)
+        for attempt in range(settings.yf_max_retries):
+            if response.status_code not in YF_RETRY_STATUS_CODES:
+                break
+            time.sleep(YF_RETRY_DELAY * 2 ** attempt)
+            response = super().request(*args, **kwargs)
+        return response
+
+
+# 所有yfinance调用共享的HTTP会话，复用TCP/TLS连接
+# （新版yfinance要求使用curl_cffi会话以模拟浏览器指纹）
+# 重试放在HTTP层：只重发失败的那一次请求，不重复整个调用链
+yf_session = _StatusRetrySession(
+    impersonate="chrome",
+    retry=curl_requests.RetryStrategy(
+        count=settings.yf_max_retries,
+        delay=YF_RETRY_DELAY,
+        backoff="exponential"
+    )
+)
+
+# Ticker对象缓存：Ticker内部会缓存info/fast_info，过期时间与报价缓存保持一致
+TICKER_CACHE_TTL = 60
+TICKER_CACHE_MAX_SIZE = 2048
+
+# 详细报价数值字段映射：(模型字段, 按优先级排列的数据键, 类型转换函数)
+QUOTE_NUMERIC_FIELDS = (
+    ("last_price", ("currentPrice", "regularMarketPrice"), float),
+    ("previous_close", ("previousClose",), float),
+    ("open_price", ("open",), float),
+    ("day_high", ("dayHigh",), float),
+    ("day_low", ("dayLow",), float),
+    ("volume", ("volume", "regularMarketVolume"), int),
+    ("average_volume", ("averageVolume",), int),
+    ("market_cap", ("marketCap",), int),
+    ("shares_outstanding", ("sharesOutstanding",), int),
+    ("fifty_two_week_high", ("fiftyTwoWeekHigh",), float),
+    ("fifty_two_week_low", ("fiftyTwoWeekLow",), float),
+    ("pe_ratio", ("trailingPE",), float),
+    ("forward_pe", ("forwardPE",), float),
+    ("price_to_book", ("priceToBook",), float),
+    ("dividend_rate", ("dividendRate",), float),
+    ("dividend_yield", ("dividendYield",), float),
+    ("eps", ("trailingEps",), float),
+    ("beta", ("beta",), float),
+)
+# 详细报价文本字段（模型字段与数据键同名）
+QUOTE_TEXT_FIELDS = ("currency", "exchange", "sector", "industry")
+
+# Yahoo 批量报价接口，一次请求可查询多个股票代码
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+# Yahoo quoteSummary 接口，一次请求返回详细报价所需的全部模块
+YAHOO_QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/"
+# 详细报价使用的模块，按字段优先级排列（同名字段取靠前模块的值）
+DETAILED_QUOTE_MODULES = (
+    "price", "summaryDetail", "financialData", "defaultKeyStatistics", "assetProfile"
+)
+# 每次批量请求的股票数量上限
+BATCH_QUOTE_CHUNK_SIZE = 20
 
 
 class YFinanceService:
@@ -28,83 +111,119 @@ class YFinanceService:
 
     def __init__(self):
         self.session_timeout = settings.yf_session_timeout
-        self.max_retries = settings.yf_max_retries
-
-    async def _run_in_executor(self, func, *args, **kwargs) -> Any:
-        """在线程池中执行同步函数"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(executor, func, *args, **kwargs)
-
-    async def _retry_yfinance_call(self, func, *args, **kwargs) -> Any:
-        """带重试机制的yfinance调用包装器"""
-        last_exception = None
-
-        for attempt in range(self.max_retries):
-            try:
-                return await func(*args, **kwargs)
-            except TickerNotFoundError:
-                # 股票代码不存在，不需要重试
-                raise
-            except Exception as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt  # 指数退避: 1s, 2s, 4s
-                    logger.warning(
-                        f"yfinance调用失败，{wait_time}秒后重试",
-                        attempt=attempt + 1,
-                        max_retries=self.max_retries,
-                        error=str(e)
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(
-                        f"yfinance调用失败，已达到最大重试次数",
-                        attempts=self.max_retries,
-                        error=str(e)
-                    )
-
-        # 所有重试都失败，抛出最后的异常
-        raise YahooAPIError(
-            f"调用失败，已重试{self.max_retries}次: {str(last_exception)}")
+        # 按股票代码缓存的Ticker对象: symbol -> (创建时间, Ticker)
+        # _get_ticker 在工作线程中调用，使用线程锁保护
+        self._ticker_cache: Dict[str, tuple] = {}
+        self._ticker_lock = threading.Lock()
+
+    async def _run_in_executor(self, func, *args) -> Any:
+        """
+        在线程池中执行同步函数
+
+        直接使用 loop.run_in_executor 而不是 asyncio.to_thread：
+        to_thread 每次调用都会 copy_context() 并通过 ctx.run 执行，
+        而yfinance调用不依赖请求上下文变量，无需承担这部分开销。
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
+
+    async def _call_upstream(self, func, *args) -> Any:
+        """
+        调用上游获取数据，非业务异常统一转换为YahooAPIError
+
+        并发的相同请求由外层缓存装饰器合并为一次回源，这里不再重复合并。
+        """
+        try:
+            return await func(*args)
+        except FinanceAPIException:
+            raise
+        except Exception as e:
+            raise YahooAPIError(f"yfinance调用失败: {str(e)}") from e
 
     def _get_ticker(self, symbol: str) -> yf.Ticker:
-        """获取yfinance Ticker对象"""
+        """获取yfinance Ticker对象（在有效期内复用已创建的对象）"""
+        now = time.monotonic()
+        with self._ticker_lock:
+            entry = self._ticker_cache.get(symbol)
+            if entry is not None and now - entry[0] < TICKER_CACHE_TTL:
+                return entry[1]
+
         try:
-            return yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=yf_session)
         except Exception as e:
             logger.error(f"创建Ticker对象失败", symbol=symbol, error=str(e))
             raise YahooAPIError(f"无法创建Ticker对象: {str(e)}")
 
-    def _safe_get_float(self, data: dict, key: str) -> Optional[float]:
-        """安全获取浮点数值"""
-        value = data.get(key)
-        if value is None or pd.isna(value):
+        with self._ticker_lock:
+            if len(self._ticker_cache) >= TICKER_CACHE_MAX_SIZE:
+                # 先清理过期对象，仍然已满时淘汰最早创建的对象
+                expired = [key for key, (created_at, _) in self._ticker_cache.items()
+                           if now - created_at >= TICKER_CACHE_TTL]
+                for key in expired:
+                    del self._ticker_cache[key]
+                if len(self._ticker_cache) >= TICKER_CACHE_MAX_SIZE:
+                    del self._ticker_cache[next(iter(self._ticker_cache))]
+            # 重新插入以维持按创建时间排序
+            self._ticker_cache.pop(symbol, None)
+            self._ticker_cache[symbol] = (now, ticker)
+
+        return ticker
+
+    @staticmethod
+    def _coerce_number(value: Any, cast) -> Any:
+        """将数值转换为指定类型，None/NaN或无法转换时返回None"""
+        # NaN 不等于自身，比 pd.isna 的标量判断开销小得多
+        if value is None or value != value:
             return None
         try:
-            return float(value)
+            return cast(value)
         except (ValueError, TypeError):
             return None
 
+    def _safe_get_float(self, data: dict, key: str) -> Optional[float]:
+        """安全获取浮点数值"""
+        # 有效股票的键通常都存在，直接索引比 dict.get 更快，缺失时由 KeyError 处理
+        try:
+            value = data[key]
+        except KeyError:
+            return None
+        return self._coerce_number(value, float)
+
     def _safe_get_int(self, data: dict, key: str) -> Optional[int]:
         """安全获取整数值"""
-        value = data.get(key)
-        if value is None or pd.isna(value):
-            return None
         try:
-            return int(value)
-        except (ValueError, TypeError):
+            value = data[key]
+        except KeyError:
             return None
+        return self._coerce_number(value, int)
 
     async def _get_fast_quote_internal(self, symbol: str) -> FastQuoteData:
         """内部获取快速报价数据的实现"""
-        ticker = await self._run_in_executor(self._get_ticker, symbol)
-        fast_info = await self._run_in_executor(lambda: ticker.fast_info)
+        # 优先使用报价接口，一次请求即可拿到全部字段
+        try:
+            raw = await self._run_in_executor(self._fetch_quote_batch, [symbol])
+        except Exception as e:
+            logger.debug("报价接口调用失败，回退到fast_info", symbol=symbol, error=str(e))
+            raw = {}
+
+        item = raw.get(symbol.upper())
+        if item and item.get('regularMarketPrice') is not None:
+            return self._build_fast_quote_from_batch(item)
+
+        # 报价接口无数据时回退到fast_info：创建Ticker和读取fast_info在同一次线程调度中完成，
+        # fast_info 为惰性加载，取值时才会发起网络请求
+        return await self._run_in_executor(self._build_fast_quote, symbol)
+
+    def _build_fast_quote(self, symbol: str) -> FastQuoteData:
+        """获取并构建快速报价数据（同步调用，在线程中执行）"""
+        fast_info = self._get_ticker(symbol).fast_info
 
         if not fast_info:
             raise TickerNotFoundError(symbol)
 
         # 构建快速报价数据
-        quote_data = FastQuoteData(
+        # 数值均已由 _safe_get_* 转换，跳过Pydantic字段校验直接构造
+        quote_data = FastQuoteData.model_construct(
             last_price=self._safe_get_float(fast_info, 'lastPrice'),
             previous_close=self._safe_get_float(fast_info, 'previousClose'),
             open_price=self._safe_get_float(fast_info, 'open'),
@@ -124,7 +243,7 @@ class YFinanceService:
         start_time = time.time()
 
         try:
-            quote_data = await self._retry_yfinance_call(
+            quote_data = await self._call_upstream(
                 self._get_fast_quote_internal, symbol
             )
 
@@ -144,50 +263,71 @@ class YFinanceService:
                               response_time, str(e))
             raise
 
-    async def _get_detailed_quote_internal(self, symbol: str) -> QuoteData:
-        """内部获取详细报价数据的实现"""
-        ticker = await self._run_in_executor(self._get_ticker, symbol)
-        info = await self._run_in_executor(lambda: ticker.info)
-        fast_info = await self._run_in_executor(lambda: ticker.fast_info)
+    def _fetch_quote_summary(self, symbol: str) -> dict:
+        """通过quoteSummary接口一次获取详细报价所需模块，合并为扁平字典（同步调用）"""
+        data = YfData(session=yf_session).get_raw_json(
+            YAHOO_QUOTE_SUMMARY_URL + symbol,
+            params={"modules": ",".join(DETAILED_QUOTE_MODULES), "formatted": "false"}
+        )
+        results = (data or {}).get("quoteSummary", {}).get("result") or []
+        if not results:
+            return {}
+
+        flat: Dict[str, Any] = {}
+        for name in DETAILED_QUOTE_MODULES:
+            for key, value in (results[0].get(name) or {}).items():
+                if isinstance(value, dict):
+                    value = value.get("raw")
+                if value is not None:
+                    flat.setdefault(key, value)
+        return flat
+
+    def _fetch_detailed_data(self, symbol: str) -> dict:
+        """获取详细报价数据（同步调用，在线程中执行）"""
+        # 一次quoteSummary请求即可拿到价格、估值和公司概况
+        try:
+            data = self._fetch_quote_summary(symbol)
+        except Exception as e:
+            logger.debug("quoteSummary调用失败，回退到info", symbol=symbol, error=str(e))
+            data = {}
 
-        if not info and not fast_info:
+        if data.get('regularMarketPrice') is not None:
+            return data
+
+        # 接口无数据（如返回404）时回退到Ticker.info
+        info = self._get_ticker(symbol).info
+        if not info:
             raise TickerNotFoundError(symbol)
+        return info
 
-        # 合并info和fast_info数据
-        combined_data = {**info, **fast_info} if info else fast_info
+    async def _get_detailed_quote_internal(self, symbol: str) -> QuoteData:
+        """内部获取详细报价数据的实现"""
+        combined_data = await self._run_in_executor(self._fetch_detailed_data, symbol)
+        return self._build_quote_from_dict(combined_data)
+
+    def _build_quote_from_dict(self, data: dict) -> QuoteData:
+        """按字段映射一次遍历构建详细报价数据，并计算涨跌"""
+        coerce = self._coerce_number
+        fields: Dict[str, Any] = {}
+        # 多个候选键时取第一个非空非零值（与原先 a or b 的语义一致）
+        for attr, keys, cast in QUOTE_NUMERIC_FIELDS:
+            value = None
+            for key in keys:
+                try:
+                    value = coerce(data[key], cast)
+                except KeyError:
+                    continue
+                if value:
+                    break
+            fields[attr] = value
+        for key in QUOTE_TEXT_FIELDS:
+            try:
+                fields[key] = data[key]
+            except KeyError:
+                fields[key] = None
 
-        # 构建详细报价数据
-        quote_data = QuoteData(
-            last_price=self._safe_get_float(combined_data, 'currentPrice') or
-            self._safe_get_float(combined_data, 'lastPrice'),
-            previous_close=self._safe_get_float(
-                combined_data, 'previousClose'),
-            open_price=self._safe_get_float(combined_data, 'open'),
-            day_high=self._safe_get_float(combined_data, 'dayHigh'),
-            day_low=self._safe_get_float(combined_data, 'dayLow'),
-            volume=self._safe_get_int(combined_data, 'volume') or
-            self._safe_get_int(combined_data, 'lastVolume'),
-            average_volume=self._safe_get_int(combined_data, 'averageVolume'),
-            market_cap=self._safe_get_int(combined_data, 'marketCap'),
-            shares_outstanding=self._safe_get_int(
-                combined_data, 'sharesOutstanding'),
-            fifty_two_week_high=self._safe_get_float(
-                combined_data, 'fiftyTwoWeekHigh'),
-            fifty_two_week_low=self._safe_get_float(
-                combined_data, 'fiftyTwoWeekLow'),
-            pe_ratio=self._safe_get_float(combined_data, 'trailingPE'),
-            forward_pe=self._safe_get_float(combined_data, 'forwardPE'),
-            price_to_book=self._safe_get_float(combined_data, 'priceToBook'),
-            dividend_rate=self._safe_get_float(combined_data, 'dividendRate'),
-            dividend_yield=self._safe_get_float(
-                combined_data, 'dividendYield'),
-            eps=self._safe_get_float(combined_data, 'trailingEps'),
-            beta=self._safe_get_float(combined_data, 'beta'),
-            currency=combined_data.get('currency'),
-            exchange=combined_data.get('exchange'),
-            sector=combined_data.get('sector'),
-            industry=combined_data.get('industry'),
-        )
+        # 字段值已按类型转换，跳过字段校验直接构造
+        quote_data = QuoteData.model_construct(**fields)
 
         # 计算变化值和百分比
         if quote_data.last_price and quote_data.previous_close:
@@ -204,7 +344,7 @@ class YFinanceService:
         start_time = time.time()
 
         try:
-            quote_data = await self._retry_yfinance_call(
+            quote_data = await self._call_upstream(
                 self._get_detailed_quote_internal, symbol
             )
 
@@ -226,13 +366,12 @@ class YFinanceService:
 
     async def _get_company_info_internal(self, symbol: str) -> CompanyInfo:
         """内部获取公司信息的实现"""
-        ticker = await self._run_in_executor(self._get_ticker, symbol)
-        info = await self._run_in_executor(lambda: ticker.info)
+        info = await self._run_in_executor(lambda: self._get_ticker(symbol).info)
 
         if not info:
             raise TickerNotFoundError(symbol)
 
-        company_info = CompanyInfo(
+        company_info = CompanyInfo.model_construct(
             name=info.get('longName') or info.get('shortName'),
             sector=info.get('sector'),
             industry=info.get('industry'),
@@ -250,7 +389,7 @@ class YFinanceService:
         start_time = time.time()
 
         try:
-            company_info = await self._retry_yfinance_call(
+            company_info = await self._call_upstream(
                 self._get_company_info_internal, symbol
             )
 
@@ -270,31 +409,164 @@ class YFinanceService:
                               False, response_time, str(e))
             raise
 
-    async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, FastQuoteData]:
-        """批量获取报价数据"""
-        logger.info(f"批量获取报价", symbols=symbols, count=len(symbols))
+    def _fetch_quote_batch(self, symbols: List[str]) -> Dict[str, dict]:
+        """通过Yahoo批量报价接口一次获取多个股票的行情（同步调用）"""
+        data = YfData(session=yf_session).get_raw_json(
+            YAHOO_QUOTE_URL,
+            params={"symbols": ",".join(symbols), "formatted": "false"}
+        )
+        items = (data or {}).get("quoteResponse", {}).get("result") or []
+        return {item["symbol"].upper(): item for item in items if item.get("symbol")}
 
-        # 使用asyncio.gather并发获取
-        tasks = [self.get_fast_quote(symbol) for symbol in symbols]
-        results = {}
+    def _build_fast_quote_from_batch(self, item: dict) -> FastQuoteData:
+        """将批量报价接口返回的单条数据转换为快速报价数据"""
+        return FastQuoteData.model_construct(
+            last_price=self._safe_get_float(item, 'regularMarketPrice'),
+            previous_close=self._safe_get_float(
+                item, 'regularMarketPreviousClose'),
+            open_price=self._safe_get_float(item, 'regularMarketOpen'),
+            day_high=self._safe_get_float(item, 'regularMarketDayHigh'),
+            day_low=self._safe_get_float(item, 'regularMarketDayLow'),
+            volume=self._safe_get_int(item, 'regularMarketVolume'),
+            market_cap=self._safe_get_int(item, 'marketCap'),
+            shares=self._safe_get_int(item, 'sharesOutstanding'),
+            currency=item.get('currency'),
+        )
 
-        try:
-            quotes = await asyncio.gather(*tasks, return_exceptions=True)
+    def _fast_quote_cache_key(self, symbol: str) -> str:
+        """构建与 get_fast_quote 缓存装饰器一致的缓存键"""
+        return cache_key_builder(YFinanceService.get_fast_quote, symbol)
 
-            for symbol, quote in zip(symbols, quotes):
+    async def _get_quote_chunk(
+        self,
+        chunk: List[str],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """获取一组股票的报价：先查缓存，再批量请求，批量未返回的逐个获取"""
+        results: Dict[str, Any] = {}
+        pending: List[str] = []
+
+        # 先批量读取缓存（一次往返），与单个获取的缓存键保持一致
+        cached_values = await quote_cache.multi_get_from_cache(
+            [self._fast_quote_cache_key(symbol) for symbol in chunk])
+        for symbol, cached in zip(chunk, cached_values):
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                pending.append(symbol)
+
+        if not pending:
+            return results
+
+        async with semaphore:
+            start_time = time.time()
+            try:
+                raw = await self._run_in_executor(self._fetch_quote_batch, pending)
+                log_yfinance_call(",".join(pending), "batch_quote",
+                                  True, time.time() - start_time)
+            except Exception as e:
+                log_yfinance_call(",".join(pending), "batch_quote",
+                                  False, time.time() - start_time, str(e))
+                raw = {}
+
+        missing: List[str] = []
+        fetched: List[tuple] = []
+        for symbol in pending:
+            item = raw.get(symbol.upper())
+            if not item or item.get('regularMarketPrice') is None:
+                missing.append(symbol)
+                continue
+
+            quote = self._build_fast_quote_from_batch(item)
+            results[symbol] = quote
+            fetched.append((self._fast_quote_cache_key(symbol), quote))
+
+        # 按单个获取的缓存键批量回填，后续单个查询可直接命中
+        await quote_cache.multi_set_in_cache(fetched)
+
+        # 批量接口未返回的股票回退到逐个获取，同样受并发上限约束
+        async def _fetch_one(symbol: str) -> FastQuoteData:
+            async with semaphore:
+                return await self.get_fast_quote(symbol)
+
+        if missing:
+            quotes = await asyncio.gather(
+                *(_fetch_one(symbol) for symbol in missing),
+                return_exceptions=True
+            )
+            for symbol, quote in zip(missing, quotes):
                 if isinstance(quote, Exception):
                     logger.warning(f"获取{symbol}报价失败", error=str(quote))
                     continue
                 results[symbol] = quote
 
+        return results
+
+    async def get_batch_quotes(self, symbols: List[str]) -> Dict[str, FastQuoteData]:
+        """批量获取报价数据"""
+        logger.info(f"批量获取报价", symbols=symbols, count=len(symbols))
+
+        # 去重并保持顺序，按批量接口上限分组
+        unique_symbols = list(dict.fromkeys(symbols))
+        chunks = [
+            unique_symbols[i:i + BATCH_QUOTE_CHUNK_SIZE]
+            for i in range(0, len(unique_symbols), BATCH_QUOTE_CHUNK_SIZE)
+        ]
+        # 并发上限与线程池宽度匹配，避免大批量请求占满线程池影响其他接口
+        semaphore = asyncio.Semaphore(settings.yf_batch_concurrency)
+        results = {}
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._get_quote_chunk(chunk, semaphore))
+                    for chunk in chunks
+                ]
+            for task in tasks:
+                results.update(task.result())
+
             logger.info(f"批量获取报价完成", successful=len(
-                results), total=len(symbols))
+                results), total=len(unique_symbols))
             return results
 
         except Exception as e:
             logger.error(f"批量获取报价失败", error=str(e))
             raise YahooAPIError(f"批量获取报价失败: {str(e)}")
 
+    def _history_columns(self, history: pd.DataFrame) -> tuple:
+        """按列将历史数据转换为Python原生值数组（NaN转换为None）"""
+        df = history.reset_index()
+        columns = df.columns.tolist()
+        arrays = []
+
+        for col in columns:
+            series = df[col]
+            if series.dtype.kind in 'biu':
+                # 整数/布尔列不会有缺失值，直接转换为Python原生值
+                arrays.append(series.to_numpy().astype(object))
+                continue
+
+            # 其余列（浮点、日期、对象）用向量化的缺失值掩码将NaN/NaT替换为None；
+            # 日期列转为Timestamp对象，有无时区保持一致
+            missing = series.isna().to_numpy()
+            values = series.to_numpy(dtype=object)
+            if missing.any():
+                values = np.where(missing, None, values)
+            arrays.append(values)
+
+        return columns, arrays
+
+    @staticmethod
+    def _columns_to_records(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """将按列的历史数据展开为按行的记录列表"""
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    def _history_to_columns(self, history: pd.DataFrame) -> Dict[str, List[Any]]:
+        """将历史数据转换为按列的字典，体积和对象数都远小于按行格式"""
+        columns, arrays = self._history_columns(history)
+        return {col: values.tolist() for col, values in zip(columns, arrays)}
+
     async def _get_history_internal(
         self,
         symbol: str,
@@ -306,9 +578,7 @@ class YFinanceService:
         prepost: bool = True,
         actions: bool = True
     ) -> Dict[str, Any]:
-        """内部获取历史数据的实现"""
-        ticker = await self._run_in_executor(self._get_ticker, symbol)
-
+        """内部获取历史数据的实现，统一返回按列格式"""
         # 构建参数
         kwargs = {
             "period": period,
@@ -323,15 +593,15 @@ class YFinanceService:
         if end:
             kwargs["end"] = end
 
-        # 获取历史数据
-        history = await self._run_in_executor(lambda: ticker.history(**kwargs))
+        # 获取历史数据（创建Ticker与请求在同一次线程调度中完成）
+        history = await self._run_in_executor(
+            lambda: self._get_ticker(symbol).history(**kwargs))
 
         if history.empty:
             raise TickerNotFoundError(symbol, {"reason": "无历史数据"})
 
-        # 转换为字典格式
         result = {
-            "data": history.reset_index().to_dict("records"),
+            "data": self._history_to_columns(history),
             "period": period,
             "interval": interval,
             "total_records": len(history),
@@ -340,7 +610,7 @@ class YFinanceService:
         return result
 
     @history_cache
-    async def get_history(
+    async def _get_history_columns(
         self,
         symbol: str,
         period: str = "1y",
@@ -351,11 +621,11 @@ class YFinanceService:
         prepost: bool = True,
         actions: bool = True
     ) -> Dict[str, Any]:
-        """获取历史数据（带重试）"""
+        """获取按列格式的历史数据（缓存只保存按列布局，两种输出格式共用同一条缓存）"""
         start_time = time.time()
 
         try:
-            result = await self._retry_yfinance_call(
+            result = await self._call_upstream(
                 self._get_history_internal,
                 symbol, period, interval, start, end, auto_adjust, prepost, actions
             )
@@ -376,6 +646,37 @@ class YFinanceService:
             log_yfinance_call(symbol, "history", False, response_time, str(e))
             raise
 
+    async def get_history(
+        self,
+        symbol: str,
+        period: str = "1y",
+        interval: str = "1d",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        auto_adjust: bool = True,
+        prepost: bool = True,
+        actions: bool = True,
+        data_format: str = "records"
+    ) -> Dict[str, Any]:
+        """获取历史数据（data_format: records 按行 / columnar 按列）"""
+        result = await self._get_history_columns(
+            symbol, period, interval, start, end, auto_adjust, prepost, actions)
+
+        data = result["data"]
+        if data_format != "columnar":
+            data = self._columns_to_records(data)
+
+        return {**result, "data": data, "format": data_format}
+
 
 # 创建全局服务实例
 yfinance_service = YFinanceService()
+
+
+def close_yf_session() -> None:
+    """关闭共享的yfinance HTTP会话"""
+    try:
+        yf_session.close()
+        logger.info("yfinance HTTP会话已关闭")
+    except Exception as e:
+        logger.error("关闭yfinance HTTP会话失败", error=str(e))
@@ -0,0 +1,303 @@
+"""
+缓存工具测试（内存后端）
+"""
+
+import asyncio
+import hashlib
+import zlib
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+from pydantic import BaseModel
+
+from app.utils.cache import (
+    CACHE_COMPRESS_MIN_BYTES,
+    MsgpackSerializer,
+    ShardedTTLCache,
+    create_cache_key,
+    finance_cached,
+)
+
+
+class _RecordingLocal(ShardedTTLCache):
+    """记录每次写入本地缓存时使用的过期时间"""
+
+    def __init__(self, ttl: int):
+        super().__init__(ttl=ttl)
+        self.ttls = {}
+
+    def set(self, key, value, ttl=None):
+        self.ttls[key] = ttl
+        super().set(key, value, ttl=ttl)
+
+
+def _make_cached(ttl: int = 100):
+    """创建使用内存后端的两级缓存，返回 (装饰器, 被装饰函数, 回源调用记录)"""
+    decorator = finance_cached(ttl=ttl)
+    decorator.local = _RecordingLocal(ttl=ttl)
+    calls = []
+
+    @decorator
+    async def fetch(self, symbol):
+        calls.append(symbol)
+        return {"symbol": symbol, "price": 1.0}
+
+    return decorator, fetch, calls
+
+
+def test_sharded_cache_per_key_ttl():
+    """单个键可指定过期时间，未指定时使用默认TTL"""
+    cache = ShardedTTLCache(ttl=60, maxsize=64, shards=4)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=0)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("missing") is None
+
+    assert cache.delete_matching("a*") == 1
+    assert cache.get("a") is None
+
+
+def test_backfill_ttl_is_fraction_of_ttl():
+    """回填副本的过期时间为TTL的10%，至少1秒"""
+    assert finance_cached(ttl=60).backfill_ttl == 6
+    assert finance_cached(ttl=5).backfill_ttl == 1
+
+
+@pytest.mark.asyncio
+async def test_miss_writes_local_and_backend():
+    """未命中时回源一次，结果同时写入本地和后端，之后直接命中本地"""
+    decorator, fetch, calls = _make_cached()
+
+    assert await fetch(None, "AAPL") == {"symbol": "AAPL", "price": 1.0}
+    assert await fetch(None, "AAPL") == {"symbol": "AAPL", "price": 1.0}
+    assert calls == ["AAPL"]
+
+    key = decorator.get_cache_key(fetch.__wrapped__, (None, "AAPL"), {})
+    assert decorator.local.ttls[key] is None
+    assert await decorator.cache.get(key) == {"symbol": "AAPL", "price": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_backend_hit_backfills_local_with_short_ttl():
+    """本地未命中、后端命中时不回源，并以回填TTL写入本地"""
+    decorator, fetch, calls = _make_cached(ttl=100)
+    key = decorator.get_cache_key(fetch.__wrapped__, (None, "MSFT"), {})
+    await decorator.cache.set(key, {"symbol": "MSFT"})
+
+    assert await fetch(None, "MSFT") == {"symbol": "MSFT"}
+    assert calls == []
+    assert decorator.local.get(key) == {"symbol": "MSFT"}
+    assert decorator.local.ttls[key] == 10
+
+
+@pytest.mark.asyncio
+async def test_multi_get_from_cache():
+    """批量读取依次查本地和后端，后端命中的键回填本地"""
+    decorator, _, _ = _make_cached(ttl=100)
+    decorator.local.set("local", "L")
+    await decorator.cache.set("backend", "B")
+
+    values = await decorator.multi_get_from_cache(["local", "backend", "missing"])
+    assert values == ["L", "B", None]
+    assert decorator.local.get("backend") == "B"
+    assert decorator.local.ttls["backend"] == 10
+    assert decorator.local.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_multi_set_in_cache():
+    """批量写入同时写本地和后端"""
+    decorator, _, _ = _make_cached()
+    await decorator.multi_set_in_cache([("a", 1), ("b", 2)])
+
+    assert [decorator.local.get("a"), decorator.local.get("b")] == [1, 2]
+    assert await decorator.cache.multi_get(["a", "b"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_fetch_once():
+    """同一个键并发未命中时只回源一次，所有调用方共享结果"""
+    decorator = finance_cached(ttl=100)
+    release = asyncio.Event()
+    calls = 0
+
+    @decorator
+    async def fetch(self, symbol):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return symbol
+
+    tasks = [asyncio.create_task(fetch(None, "AAPL")) for _ in range(10)]
+    # 让所有调用方都进入等待后再放行回源
+    await asyncio.sleep(0.05)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["AAPL"] * 10
+    assert calls == 1
+    assert decorator._refreshing == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    """先发起回源的调用方被取消时，其他等待同一个键的调用方仍得到结果"""
+    decorator = finance_cached(ttl=100)
+    release = asyncio.Event()
+    calls = 0
+
+    @decorator
+    async def fetch(self, symbol):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return symbol
+
+    leader = asyncio.create_task(fetch(None, "AAPL"))
+    # 等到回源任务已登记，确保取消发生在等待回源结果时
+    while not decorator._refreshing:
+        await asyncio.sleep(0)
+    follower = asyncio.create_task(fetch(None, "AAPL"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    assert await follower == "AAPL"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_shared_and_not_cached():
+    """回源异常传给所有等待方，且不写入缓存，下次请求重新回源"""
+    decorator = finance_cached(ttl=100)
+    release = asyncio.Event()
+    calls = 0
+
+    @decorator
+    async def fetch(self, symbol):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise RuntimeError("上游失败")
+
+    tasks = [asyncio.create_task(fetch(None, "AAPL")) for _ in range(3)]
+    # 让所有调用方都进入等待后再放行回源
+    await asyncio.sleep(0.05)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert calls == 1
+
+    with pytest.raises(RuntimeError):
+        await fetch(None, "AAPL")
+    assert calls == 2
+
+
+# ===== 缓存键 =====
+
+def test_cache_key_primitive_args():
+    """只有简单参数时直接拼接，不计算哈希"""
+    assert create_cache_key("quote") == "quote"
+    assert create_cache_key("quote", "AAPL", 5, 1.5, True) == "quote|AAPL|5|1.5|True"
+    assert create_cache_key("history", "AAPL", period="1mo") == "history|AAPL|period=1mo"
+
+
+def test_cache_key_structured_args():
+    """dict/list参数以#占位，整个键末尾追加一次blake2b摘要"""
+    params = {"b": 2, "a": 1}
+    key = create_cache_key("search", "AAPL", params)
+
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+    hasher.update(b"\x00")
+    assert key == f"search|AAPL|#|{hasher.hexdigest()}"
+
+    # dict键顺序不影响结果，值或参数位置不同则键不同
+    assert create_cache_key("search", "AAPL", {"a": 1, "b": 2}) == key
+    assert create_cache_key("search", "AAPL", {"a": 1, "b": 3}) != key
+    assert create_cache_key("search", params, "AAPL") != key
+
+
+def test_cache_key_kwargs_order_independent():
+    """多个关键字参数与传入顺序无关"""
+    first = create_cache_key("history", "AAPL", period="1mo", interval="1d")
+    second = create_cache_key("history", "AAPL", interval="1d", period="1mo")
+    assert first == second
+    assert first.startswith("history|AAPL|")
+    assert first != create_cache_key("history", "AAPL", period="1mo", interval="1h")
+
+
+def test_cache_key_long_key_hashed():
+    """超长键改用前缀加哈希，结果稳定"""
+    symbols = ["SYM%d" % i for i in range(100)]
+    key = create_cache_key("batch", *symbols)
+    assert key.startswith("batch:hash:")
+    assert len(key) == len("batch:hash:") + 16
+    assert create_cache_key("batch", *symbols) == key
+
+
+# ===== 序列化 =====
+
+class _Quote(BaseModel):
+    symbol: str
+    price: float
+
+
+def test_serializer_round_trip_small():
+    """小数据不压缩，可原样还原"""
+    serializer = MsgpackSerializer()
+    value = {"symbol": "AAPL", "price": 1.5, "tags": ["a", "b"], "volume": None}
+    data = serializer.dumps(value)
+    assert not data.startswith(b"ZLB1")
+    assert serializer.loads(data) == value
+
+
+def test_serializer_compresses_large_values():
+    """达到阈值的数据压缩存储并带ZLB1前缀"""
+    serializer = MsgpackSerializer()
+    value = [{"date": "2024-01-01", "close": float(i)} for i in range(200)]
+    data = serializer.dumps(value)
+    assert data.startswith(b"ZLB1")
+    assert len(zlib.decompress(data[4:])) >= CACHE_COMPRESS_MIN_BYTES
+    assert serializer.loads(data) == value
+
+
+def test_serializer_encodes_special_types():
+    """Pydantic模型、Timestamp、NaT和numpy类型转换为基础类型"""
+    serializer = MsgpackSerializer()
+    value = {
+        "quote": _Quote(symbol="AAPL", price=1.5),
+        "time": pd.Timestamp("2024-01-02T03:04:05"),
+        "missing": pd.NaT,
+        "count": np.int64(3),
+        "prices": np.array([1.0, 2.0]),
+    }
+    assert serializer.loads(serializer.dumps(value)) == {
+        "quote": {"symbol": "AAPL", "price": 1.5},
+        "time": "2024-01-02T03:04:05",
+        "missing": None,
+        "count": 3,
+        "prices": [1.0, 2.0],
+    }
+
+
+def test_serializer_reads_legacy_json():
+    """升级前写入的JSON数据（bytes或str）仍可读取"""
+    serializer = MsgpackSerializer()
+    value = {"symbol": "AAPL", "price": 1.5}
+    assert serializer.loads(orjson.dumps(value)) == value
+    assert serializer.loads(orjson.dumps(value).decode()) == value
+
+
+def test_serializer_invalid_data_returns_none():
+    """空数据和损坏的数据返回None"""
+    serializer = MsgpackSerializer()
+    assert serializer.loads(None) is None
+    assert serializer.loads(b"") is None
+    assert serializer.loads(b"ZLB1not-zlib") is None
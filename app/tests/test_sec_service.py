@@ -0,0 +1,162 @@
+"""
+SEC服务熔断器测试
+"""
+
+import asyncio
+
+import pytest
+import requests
+
+from app.services.sec_service import _CircuitBreaker, _is_upstream_failure
+from app.utils.exceptions import FinanceAPIException
+
+
+def _wrapped(cause: Exception) -> FinanceAPIException:
+    """模拟数据源把原始异常包装为FinanceAPIException"""
+    try:
+        raise cause
+    except Exception as e:
+        try:
+            raise FinanceAPIException(message=f"获取数据失败: {e}", code="SEC_ERROR") from e
+        except FinanceAPIException as wrapped:
+            return wrapped
+
+
+class _Upstream:
+    """可控的上游调用，记录调用次数"""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return kwargs
+
+
+@pytest.mark.parametrize("exc, expected", [
+    (requests.ConnectionError("连接失败"), True),
+    (asyncio.TimeoutError(), True),
+    (Exception("API error: 503 - Service Unavailable"), True),
+    (Exception("API error: 404 - Not Found"), False),
+    (ValueError("股票代码不存在"), False),
+])
+def test_is_upstream_failure(exc, expected):
+    """传输错误和5xx计入熔断，调用方错误不计入"""
+    assert _is_upstream_failure(exc) is expected
+
+
+def test_is_upstream_failure_follows_cause_chain():
+    """沿异常链识别被包装的上游故障"""
+    assert _is_upstream_failure(_wrapped(requests.Timeout("超时"))) is True
+    assert _is_upstream_failure(_wrapped(KeyError("ticker"))) is False
+
+
+def test_is_upstream_failure_reads_response_status():
+    """带响应对象的异常按HTTP状态码判断"""
+    for status, expected in ((502, True), (429, False)):
+        response = requests.Response()
+        response.status_code = status
+        exc = requests.HTTPError(f"{status}", response=response)
+        assert _is_upstream_failure(exc) is expected
+
+
+@pytest.mark.asyncio
+async def test_opens_after_fail_max_and_fails_fast():
+    """连续上游故障达到阈值后打开熔断器，冷却期内不再调用上游"""
+    breaker = _CircuitBreaker("test", fail_max=3, reset_timeout=60)
+    upstream = _Upstream(requests.ConnectionError("连接失败"))
+    guarded = breaker.wrap(upstream)
+
+    for _ in range(3):
+        with pytest.raises(requests.ConnectionError):
+            await guarded(ticker="AAPL")
+    assert breaker.state == 'open'
+
+    with pytest.raises(FinanceAPIException) as exc_info:
+        await guarded(ticker="AAPL")
+    assert exc_info.value.code == "UPSTREAM_UNAVAILABLE"
+    assert exc_info.value.status_code == 503
+    assert upstream.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_non_upstream_errors_do_not_count():
+    """调用方错误不计入失败次数，并清零之前的上游故障计数"""
+    breaker = _CircuitBreaker("test", fail_max=2, reset_timeout=60)
+
+    with pytest.raises(requests.ConnectionError):
+        await breaker.wrap(_Upstream(requests.ConnectionError("连接失败")))(ticker="AAPL")
+    assert breaker.failures == 1
+
+    not_found = breaker.wrap(_Upstream(_wrapped(KeyError("ticker"))))
+    for _ in range(3):
+        with pytest.raises(FinanceAPIException):
+            await not_found(ticker="XXXX")
+    assert breaker.failures == 0
+    assert breaker.state == 'closed'
+
+
+@pytest.mark.asyncio
+async def test_success_resets_failures():
+    """调用成功后清零失败计数"""
+    breaker = _CircuitBreaker("test", fail_max=3, reset_timeout=60)
+    upstream = _Upstream(requests.ConnectionError("连接失败"))
+    guarded = breaker.wrap(upstream)
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            await guarded(ticker="AAPL")
+
+    upstream.error = None
+    assert await guarded(ticker="AAPL") == {"ticker": "AAPL"}
+    assert breaker.failures == 0
+    assert breaker.state == 'closed'
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_single_probe():
+    """冷却期结束后只放行一个试探请求，试探成功后关闭熔断器"""
+    breaker = _CircuitBreaker("test", fail_max=1, reset_timeout=0)
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_upstream(**kwargs):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "ok"
+
+    breaker._record_failure()
+    assert breaker.state == 'half_open'
+
+    guarded = breaker.wrap(slow_upstream)
+    probe = asyncio.create_task(guarded(ticker="AAPL"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(FinanceAPIException) as exc_info:
+        await guarded(ticker="AAPL")
+    assert exc_info.value.code == "UPSTREAM_UNAVAILABLE"
+
+    release.set()
+    assert await probe == "ok"
+    assert calls == 1
+    assert breaker.state == 'closed'
+    assert breaker.probing is False
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens():
+    """试探请求失败后重新打开熔断器并重新计时"""
+    breaker = _CircuitBreaker("test", fail_max=1, reset_timeout=60)
+    breaker._record_failure()
+    # 模拟冷却期已结束
+    breaker.opened_at -= 60
+    assert breaker.state == 'half_open'
+
+    with pytest.raises(requests.Timeout):
+        await breaker.wrap(_Upstream(requests.Timeout("超时")))(ticker="AAPL")
+    assert breaker.state == 'open'
+    assert breaker.probing is False
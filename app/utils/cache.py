@@ -3,14 +3,22 @@
 提供基于aiocache的缓存装饰器和配置
 """
 
+import asyncio
+import fnmatch
 import functools
 import hashlib
-import json
-from typing import Any, Callable, Optional, Union
-from datetime import datetime
+import random
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
+import msgspec
+import numpy as np
+import orjson
 import pandas as pd
 
 from aiocache import Cache, cached
+from cachetools import TLRUCache
 from aiocache.serializers import BaseSerializer
 from aiocache.backends.memory import SimpleMemoryCache
 from aiocache.backends.redis import RedisCache
@@ -22,55 +30,274 @@ from app.utils.exceptions import CacheError
 
 logger = get_logger(__name__)
 
+# 进程内缓存分片数（必须为2的幂）与总容量
+LOCAL_CACHE_SHARDS = 16
+LOCAL_CACHE_MAX_SIZE = 16384
+
+# 缓存过期时间随机延长的最大比例，避免同时写入的键同时过期
+CACHE_TTL_JITTER_RATIO = 0.1
+
+# 从后端回填到本地的副本只保留TTL的该比例：后端剩余有效期未知，
+# 短期副本使其最多比后端多存活这一小段时间，各worker之间的数据差异也随之收敛
+LOCAL_BACKFILL_TTL_RATIO = 0.1
+
+# Redis按模式清除缓存时每批扫描/删除的键数量
+REDIS_SCAN_BATCH = 1000
+
+# 超过该长度的缓存键使用哈希
+CACHE_KEY_MAX_LENGTH = 200
+# 可直接拼入缓存键的参数类型
+_PRIMITIVE_KEY_TYPES = frozenset((str, int, float, bool))
+
+# 达到该大小的缓存数据压缩后再写入（小对象压缩收益抵不上CPU开销）
+CACHE_COMPRESS_MIN_BYTES = 1024
+# 压缩数据的前缀标记，未压缩的旧数据仍可直接解析
+_COMPRESSED_MAGIC = b"ZLB1"
+
+
+def _encode_default(obj: Any) -> Any:
+    """编码器无法原生处理的类型（仅在叶子节点调用）"""
+    if isinstance(obj, BaseModel):
+        # 直接调用pydantic-core序列化器生成JSON兼容的基础类型，
+        # 省去 model_dump 的通用参数处理，结果无需再做二次转换
+        return obj.__pydantic_serializer__.to_python(obj, mode="json")
+    if isinstance(obj, pd.Timestamp):
+        # Pandas时间戳转换为ISO字符串
+        return obj.isoformat()
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise NotImplementedError(f"无法序列化类型: {type(obj).__name__}")
+
+
+class MsgpackSerializer(BaseSerializer):
+    """
+    msgpack序列化器，支持Pydantic模型和Timestamp，较大的数据压缩存储
+
+    缓存只由本服务读写，无需JSON的可读性；msgpack体积更小、编解码更快。
+    """
+
+    # 以bytes读写：msgpack和压缩数据都不能按utf-8解码
+    DEFAULT_ENCODING = None
 
-class CustomJsonSerializer(BaseSerializer):
-    """自定义JSON序列化器，支持Pydantic模型和Timestamp"""
+    _encoder = msgspec.msgpack.Encoder(enc_hook=_encode_default)
+    _decoder = msgspec.msgpack.Decoder()
 
-    def dumps(self, value: Any) -> str:
+    def dumps(self, value: Any) -> bytes:
         """序列化数据"""
-        def convert_value(obj):
-            if isinstance(obj, BaseModel):
-                # Pydantic模型转换为字典
-                return obj.model_dump()
-            elif isinstance(obj, pd.Timestamp):
-                # Pandas时间戳转换为ISO字符串
-                return obj.isoformat()
-            elif isinstance(obj, datetime):
-                # datetime对象转换为ISO字符串
-                return obj.isoformat()
-            elif isinstance(obj, dict):
-                # 递归处理字典
-                return {k: convert_value(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                # 递归处理列表
-                return [convert_value(item) for item in obj]
-            else:
-                return obj
-
-        converted_value = convert_value(value)
-        return json.dumps(converted_value, ensure_ascii=False)
+        data = self._encoder.encode(value)
+        # 历史数据、搜索结果等大块数据字段名和日期重复度高，压缩后体积显著减小
+        if len(data) >= CACHE_COMPRESS_MIN_BYTES:
+            return _COMPRESSED_MAGIC + zlib.compress(data, 1)
+        return data
 
     def loads(self, value: Union[str, bytes, None]) -> Any:
         """反序列化数据"""
-        if value is None:
+        if not value:  # None或空数据
             return None
 
-        # 确保value是字符串类型
-        if isinstance(value, bytes):
-            value = value.decode('utf-8')
-
-        if not value:  # 空字符串
+        try:
+            if isinstance(value, str):
+                # 内存后端中升级前写入的JSON字符串
+                return orjson.loads(value)
+            if value[:4] == _COMPRESSED_MAGIC:
+                value = zlib.decompress(value[4:])
+            try:
+                return self._decoder.decode(value)
+            except msgspec.DecodeError:
+                # 升级前写入的JSON数据，过期前仍可读取
+                return orjson.loads(value)
+        except (orjson.JSONDecodeError, zlib.error, TypeError) as e:
+            logger.warning("缓存反序列化失败", error=str(e))
             return None
 
+
+class ShardedTTLCache:
+    """
+    按键哈希分片的进程内TTL缓存
+
+    每个分片独立加锁，多线程/高并发访问时不会全部竞争同一把锁。
+    每个键可单独指定过期时间，未指定时使用默认TTL。
+    """
+
+    __slots__ = ("_shards", "_locks", "_mask", "ttl")
+
+    def __init__(self, ttl: int, maxsize: int = LOCAL_CACHE_MAX_SIZE,
+                 shards: int = LOCAL_CACHE_SHARDS):
+        per_shard = max(1, maxsize // shards)
+        self.ttl = ttl
+        # 分片中存放 (值, 过期时间秒数)，由 ttu 计算每个键的到期时刻
+        self._shards = [
+            TLRUCache(maxsize=per_shard, ttu=lambda _key, item, now: now + item[1])
+            for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._mask = shards - 1
+
+    def get(self, key: str) -> Any:
+        """获取缓存值，不存在或已过期时返回None"""
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            item = self._shards[index].get(key)
+        return None if item is None else item[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """设置缓存值，ttl 为空时使用默认TTL"""
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            self._shards[index][key] = (value, self.ttl if ttl is None else ttl)
+
+    def clear(self) -> None:
+        """清空所有分片"""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+
+    def delete_matching(self, pattern: str) -> int:
+        """删除匹配通配符模式的键，返回删除数量"""
+        deleted = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                for key in fnmatch.filter(list(shard.keys()), pattern):
+                    del shard[key]
+                    deleted += 1
+        return deleted
+
+
+def _jittered_ttl(ttl: int) -> int:
+    """在基础过期时间上随机增加最多10%，分散热点键的过期时刻"""
+    return ttl + random.randint(0, int(ttl * CACHE_TTL_JITTER_RATIO))
+
+
+class LocalFirstCached(cached):
+    """
+    两级缓存装饰器
+
+    先查进程内分片缓存，未命中再读取aiocache后端（Redis/内存）并回填本地；
+    写入时同时写本地和后端。热点数据命中本地后无需网络往返和反序列化。
+    缓存未命中时同一键只有一个协程回源，写入后端的过期时间带随机抖动。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.local = ShardedTTLCache(ttl=self.ttl)
+        # 从后端回填的本地副本使用较短的过期时间
+        self.backfill_ttl = max(1, int(self.ttl * LOCAL_BACKFILL_TTL_RATIO))
+        # 正在回源的键及其回源任务，其余请求等待同一个结果
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    async def decorator(self, f, *args, cache_read=True, cache_write=True,
+                        aiocache_wait_for_write=True, **kwargs):
+        if not cache_read:
+            return await super().decorator(
+                f, *args, cache_read=cache_read, cache_write=cache_write,
+                aiocache_wait_for_write=aiocache_wait_for_write, **kwargs)
+
+        key = self.get_cache_key(f, args, kwargs)
+        value = await self.get_from_cache(key)
+        if value is not None:
+            return value
+
+        # 热点键过期时只让一个协程回源，其余协程等待并共享其结果或异常。
+        # 回源在独立任务中执行：某个调用方被取消（如客户端断开）只取消它自己的等待，
+        # 不会取消回源本身，也不会波及等待同一个键的其他调用方
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_and_store(key, f, args, kwargs, cache_write))
+            self._refreshing[key] = task
+            task.add_done_callback(functools.partial(self._refresh_done, key))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, f, args, kwargs, cache_write: bool) -> Any:
+        """回源获取数据并写入缓存"""
+        result = await f(*args, **kwargs)
+        if cache_write and not self.skip_cache_func(result):
+            await self.set_in_cache(key, result)
+        return result
+
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        """回源任务结束后移除登记，并标记异常已读取（调用方可能都已取消）"""
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_cache_key(self, f, args, kwargs) -> str:
+        # 被装饰的都是单例服务的方法，self不参与键的构建：
+        # 对象地址写入键会导致多进程/重启后无法共享Redis缓存
+        if self.noself:
+            args = args[1:]
+        return super().get_cache_key(f, args, kwargs)
+
+    async def get_from_cache(self, key: str) -> Any:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        value = await super().get_from_cache(key)
+        if value is not None:
+            # 后端剩余有效期未知，回填的副本只保留短时间，避免超出后端过期时刻太久
+            self.local.set(key, value, ttl=self.backfill_ttl)
+        return value
+
+    async def set_in_cache(self, key: str, value: Any) -> None:
+        self.local.set(key, value)
         try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning("缓存反序列化失败", value=value, error=str(e))
-            return None
+            await self.cache.set(key, value, ttl=_jittered_ttl(self.ttl))
+        except Exception:
+            logger.warning("写入缓存失败", key=key)
 
+    async def multi_get_from_cache(self, keys: List[str]) -> List[Any]:
+        """批量读取：本地未命中的键通过后端一次 multi_get（Redis为单次MGET）获取"""
+        values = [self.local.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
 
+        try:
+            fetched = await self.cache.multi_get([keys[i] for i in missing])
+        except Exception:
+            logger.warning("批量读取缓存失败", count=len(missing))
+            return values
+
+        for i, value in zip(missing, fetched):
+            if value is not None:
+                self.local.set(keys[i], value, ttl=self.backfill_ttl)
+                values[i] = value
+        return values
+
+    async def multi_set_in_cache(self, pairs: List[tuple]) -> None:
+        """批量写入：本地逐个写入，后端一次 multi_set"""
+        if not pairs:
+            return
+        for key, value in pairs:
+            self.local.set(key, value)
+        try:
+            await self.cache.multi_set(pairs, ttl=_jittered_ttl(self.ttl))
+        except Exception:
+            logger.warning("批量写入缓存失败", count=len(pairs))
+
+
+def _redis_options() -> Dict[str, Any]:
+    """将REDIS_URL解析为aiocache Redis后端的连接参数（含连接池上限）"""
+    url = urlparse(settings.redis_url)
+    return {
+        "endpoint": url.hostname or "127.0.0.1",
+        "port": url.port or 6379,
+        "db": int(url.path.lstrip("/") or 0),
+        "password": url.password,
+        "ssl": url.scheme == "rediss",
+        "pool_max_size": settings.redis_pool_max_size,
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def get_cache_backend():
-    """获取缓存后端类"""
+    """获取缓存后端类（结果缓存，配置只读取一次）"""
     if settings.redis_url:
         logger.info("使用Redis作为缓存后端", redis_url=settings.redis_url)
         return RedisCache
@@ -79,58 +306,89 @@ def get_cache_backend():
         return SimpleMemoryCache
 
 
+@functools.lru_cache(maxsize=1)
 def get_cache() -> Cache:
-    """获取配置的缓存实例"""
+    """获取配置的缓存实例（进程内单例，复用连接池）"""
     cache_backend = get_cache_backend()
 
     if settings.redis_url:
         # 使用 Redis 作为缓存后端
-        cache = Cache(Cache.REDIS, endpoint=settings.redis_url,
-                      serializer=CustomJsonSerializer())
+        cache = Cache(Cache.REDIS, serializer=MsgpackSerializer(),
+                      **_redis_options())
     else:
         # 使用内存作为缓存后端
-        cache = Cache(Cache.MEMORY, serializer=CustomJsonSerializer())
+        cache = Cache(Cache.MEMORY, serializer=MsgpackSerializer())
 
     return cache
 
 
+def _limit_key_length(prefix: str, full_key: str) -> str:
+    """键太长时使用哈希（blake2b比md5更快，64位摘要对缓存键空间已足够）"""
+    if len(full_key) > CACHE_KEY_MAX_LENGTH:
+        hash_obj = hashlib.blake2b(full_key.encode(), digest_size=8)
+        return f"{prefix}:hash:{hash_obj.hexdigest()}"
+    return full_key
+
+
 def create_cache_key(prefix: str, *args, **kwargs) -> str:
     """创建缓存键"""
-    # 将参数转换为字符串
+    # 常见情况：只有股票代码、周期等简单参数，直接拼接
+    if not kwargs and all(type(arg) in _PRIMITIVE_KEY_TYPES for arg in args):
+        if not args:
+            return prefix
+        return _limit_key_length(prefix, prefix + "|" + "|".join(map(str, args)))
+
+    # 简单参数直接拼入键，保持可读；dict/list参数和关键字参数
+    # 按规范化字节流写入同一个哈希器，只在末尾追加一次摘要
     key_parts = [prefix]
+    hasher = None
 
     # 添加位置参数
     for arg in args:
         if isinstance(arg, (dict, list)):
-            key_parts.append(json.dumps(arg, sort_keys=True))
+            if hasher is None:
+                hasher = hashlib.blake2b(digest_size=8)
+            # 占位符记录结构化参数的位置，分隔符区分相邻参数
+            key_parts.append("#")
+            hasher.update(orjson.dumps(arg, option=orjson.OPT_SORT_KEYS))
+            hasher.update(b"\x00")
         else:
             key_parts.append(str(arg))
 
-    # 添加关键字参数
+    # 添加关键字参数：单个简单关键字参数直接拼入键，无需排序和哈希
+    if len(kwargs) == 1:
+        (name, value), = kwargs.items()
+        if type(value) in _PRIMITIVE_KEY_TYPES:
+            key_parts.append(f"{name}={value}")
+            kwargs = None
     if kwargs:
-        sorted_kwargs = sorted(kwargs.items())
-        key_parts.append(json.dumps(sorted_kwargs, sort_keys=True))
+        if hasher is None:
+            hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(b"\x01")
+        items = sorted(kwargs.items()) if len(kwargs) > 1 else list(kwargs.items())
+        hasher.update(orjson.dumps(items, option=orjson.OPT_SORT_KEYS))
+
+    if hasher is not None:
+        key_parts.append(hasher.hexdigest())
 
     # 创建完整的键
-    full_key = "|".join(key_parts)
+    return _limit_key_length(prefix, "|".join(key_parts))
 
-    # 如果键太长，使用哈希
-    if len(full_key) > 200:
-        hash_obj = hashlib.md5(full_key.encode())
-        return f"{prefix}:hash:{hash_obj.hexdigest()}"
 
-    return full_key
+@functools.lru_cache(maxsize=None)
+def _qualified_name(func: Callable) -> str:
+    """函数的完整名称（每个函数只计算一次）"""
+    return f"{func.__module__}.{func.__qualname__}"
 
 
 def cache_key_builder(func: Callable, *args, **kwargs) -> str:
     """为缓存装饰器构建键"""
-    func_name = f"{func.__module__}.{func.__qualname__}"
-    return create_cache_key(func_name, *args, **kwargs)
+    return create_cache_key(_qualified_name(func), *args, **kwargs)
 
 
 def finance_cached(ttl: Optional[int] = None) -> Callable:
     """
-    财务数据缓存装饰器
+    财务数据缓存装饰器（用于服务类方法，self不参与缓存键）
 
     Args:
         ttl: 缓存过期时间(秒)，默认使用配置中的值
@@ -141,39 +399,75 @@ def finance_cached(ttl: Optional[int] = None) -> Callable:
     kwargs = {
         "ttl": actual_ttl,
         "cache": cache_backend,
-        "serializer": CustomJsonSerializer(),
+        "serializer": MsgpackSerializer(),
         "key_builder": cache_key_builder,
+        "noself": True,
     }
 
     # 如果使用Redis，添加连接参数
     if settings.redis_url and cache_backend == RedisCache:
-        kwargs["endpoint"] = settings.redis_url
+        kwargs.update(_redis_options())
+
+    return LocalFirstCached(**kwargs)
+
+
+async def _delete_redis_pattern(cache_instance: RedisCache, pattern: str) -> int:
+    """用SCAN分批查找匹配的键并删除，避免KEYS阻塞Redis"""
+    client = cache_instance.client
+    deleted = 0
+    batch = []
+    async for key in client.scan_iter(match=pattern, count=REDIS_SCAN_BATCH):
+        batch.append(key)
+        if len(batch) >= REDIS_SCAN_BATCH:
+            deleted += await client.unlink(*batch)
+            batch = []
+    if batch:
+        deleted += await client.unlink(*batch)
+    return deleted
+
 
-    return cached(**kwargs)
+async def _delete_memory_pattern(cache_instance: SimpleMemoryCache, pattern: str) -> int:
+    """删除内存缓存中匹配模式的键"""
+    # SimpleMemoryCache 没有按模式查询的接口，直接遍历其内部字典的键
+    keys = fnmatch.filter(list(cache_instance._cache), pattern)
+    for key in keys:
+        await cache_instance.delete(key)
+    return len(keys)
 
 
 async def clear_cache_pattern(pattern: str) -> int:
     """
     清除匹配模式的缓存
 
+    只清除当前进程的本地缓存层和共享后端；其他worker进程的本地副本
+    不会被清除，会在各自的过期时间（回填副本为TTL的一小部分）后失效。
+
     Args:
-        pattern: 要清除的缓存键模式
+        pattern: 要清除的缓存键模式（Redis通配符语法，如 "app.services.*AAPL*"）
 
     Returns:
         清除的键数量
     """
     try:
-        cache_instance = get_cache()
+        decorators = (quote_cache, history_cache, financial_cache, news_cache)
+
+        # 先清除进程内缓存，避免后端删除后仍命中本地旧值
+        for decorator in decorators:
+            decorator.local.delete_matching(pattern)
 
-        if hasattr(cache_instance, 'clear'):
-            # 对于内存缓存，清除所有
-            await cache_instance.clear()
-            logger.info("清除所有内存缓存")
-            return 1
+        cache_instance = get_cache()
+        if isinstance(cache_instance, RedisCache):
+            # 所有缓存实例共用同一个Redis库，扫描一次即可
+            deleted = await _delete_redis_pattern(cache_instance, pattern)
         else:
-            # 对于Redis，需要使用具体的实现
-            logger.warning("Redis缓存清除需要额外实现", pattern=pattern)
-            return 0
+            # 内存缓存每个实例独立存储，逐个清除
+            deleted = 0
+            for instance in (cache_instance, *(d.cache for d in decorators)):
+                if isinstance(instance, SimpleMemoryCache):
+                    deleted += await _delete_memory_pattern(instance, pattern)
+
+        logger.info("按模式清除缓存", pattern=pattern, deleted=deleted)
+        return deleted
 
     except Exception as e:
         logger.error("清除缓存失败", pattern=pattern, error=str(e))
@@ -231,7 +525,7 @@ async def set_cache_value(key: str, value: Any, ttl: Optional[int] = None) -> bo
     """
     try:
         cache_instance = get_cache()
-        actual_ttl = ttl or settings.cache_ttl_seconds
+        actual_ttl = _jittered_ttl(ttl or settings.cache_ttl_seconds)
         await cache_instance.set(key, value, ttl=actual_ttl)
         return True
     except Exception as e:
@@ -239,8 +533,71 @@ async def set_cache_value(key: str, value: Any, ttl: Optional[int] = None) -> bo
         return False
 
 
+async def get_cache_values(keys: List[str]) -> List[Any]:
+    """
+    批量从缓存获取数据
+
+    Args:
+        keys: 缓存键列表
+
+    Returns:
+        与键顺序对应的数据列表，不存在的键为None
+    """
+    if not keys:
+        return []
+    try:
+        cache_instance = get_cache()
+        # Redis后端为单次MGET，一次往返获取全部键
+        return await cache_instance.multi_get(keys)
+    except Exception as e:
+        logger.warning("批量获取缓存失败", count=len(keys), error=str(e))
+        return [None] * len(keys)
+
+
+async def set_cache_values(mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    """
+    批量设置缓存数据
+
+    Args:
+        mapping: 缓存键到数据的映射
+        ttl: 过期时间(秒)，默认使用配置中的值
+
+    Returns:
+        是否设置成功
+    """
+    if not mapping:
+        return True
+    try:
+        cache_instance = get_cache()
+        actual_ttl = _jittered_ttl(ttl or settings.cache_ttl_seconds)
+        # Redis后端在一个事务管道中执行MSET和EXPIRE
+        await cache_instance.multi_set(list(mapping.items()), ttl=actual_ttl)
+        return True
+    except Exception as e:
+        logger.warning("批量设置缓存失败", count=len(mapping), error=str(e))
+        return False
+
+
 # 预配置的缓存装饰器
 quote_cache = finance_cached(ttl=60)  # 报价缓存1分钟
 history_cache = finance_cached(ttl=3600)  # 历史数据缓存1小时
 financial_cache = finance_cached(ttl=86400)  # 财务数据缓存1天
 news_cache = finance_cached(ttl=1800)  # 新闻缓存30分钟
+
+
+async def close_cache() -> None:
+    """关闭缓存连接（应用关闭时调用）"""
+    caches = [decorator.cache for decorator in (
+        quote_cache, history_cache, financial_cache, news_cache)]
+    if get_cache.cache_info().currsize:
+        caches.append(get_cache())
+
+    for cache_instance in caches:
+        if cache_instance is None:
+            continue
+        try:
+            await cache_instance.close()
+        except Exception as e:
+            logger.warning("关闭缓存连接失败", error=str(e))
+
+    get_cache.cache_clear()
@@ -0,0 +1,29 @@
+"""
+并发工具模块
+提供受并发上限约束的协程批量执行
+"""
+
+import asyncio
+from typing import Any, Awaitable, List
+
+
+async def gather_with_concurrency(
+    limit: int,
+    *aws: Awaitable[Any],
+    return_exceptions: bool = True
+) -> List[Any]:
+    """
+    并发执行多个协程，同时运行的数量不超过 limit，结果按传入顺序返回
+
+    用于请求有速率限制的后端（SEC、Polygon），在保留并发收益的同时避免触发429。
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(_run(aw) for aw in aws),
+        return_exceptions=return_exceptions
+    )
@@ -2,9 +2,9 @@
 自定义异常类和异常处理器
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
@@ -14,12 +14,54 @@ from starlette.status import (
     HTTP_503_SERVICE_UNAVAILABLE,
     HTTP_504_GATEWAY_TIMEOUT,
 )
-from datetime import datetime
+import time
 
 from app.core.logging import get_logger
+from app.utils.responses import ORJSONResponse
 
 logger = get_logger(__name__)
 
+# 错误代码到HTTP状态码的映射
+_STATUS_CODE_MAPPING: Mapping[str, int] = MappingProxyType({
+    "INVALID_SYMBOL": HTTP_400_BAD_REQUEST,
+    "TICKER_NOT_FOUND": HTTP_404_NOT_FOUND,
+    "INVALID_PARAM": HTTP_400_BAD_REQUEST,
+    "INSUFFICIENT_PERMISSIONS": HTTP_403_FORBIDDEN,
+    "TIMEOUT_ERROR": HTTP_504_GATEWAY_TIMEOUT,
+    "SERVICE_UNAVAILABLE": HTTP_503_SERVICE_UNAVAILABLE,
+    "YAHOO_API_ERROR": HTTP_502_BAD_GATEWAY,
+    "CACHE_ERROR": HTTP_500_INTERNAL_SERVER_ERROR,
+})
+
+# HTTP状态码到错误代码的映射
+_HTTP_CODE_MAPPING: Mapping[int, str] = MappingProxyType({
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    422: "VALIDATION_ERROR",
+    429: "TOO_MANY_REQUESTS",
+    500: "INTERNAL_ERROR",
+    502: "BAD_GATEWAY",
+    503: "SERVICE_UNAVAILABLE",
+    504: "GATEWAY_TIMEOUT",
+})
+
+# 最近一次生成的时间戳（秒, ISO字符串），同一秒内的错误响应复用
+_LAST_TS: tuple[int, str] = (0, "")
+
+
+def _iso_now_cached() -> str:
+    """当前UTC时间的ISO 8601字符串（秒级精度，按秒缓存），与SEC服务数据的时间戳同为UTC"""
+    global _LAST_TS
+    seconds = int(time.time())
+    cached = _LAST_TS
+    if cached[0] != seconds:
+        cached = (seconds, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds)))
+        _LAST_TS = cached
+    return cached[1]
+
 
 class FinanceAPIException(Exception):
     """财务API基础异常类"""
@@ -98,23 +140,10 @@ class CacheError(FinanceAPIException):
         )
 
 
-async def finance_api_exception_handler(request: Request, exc: FinanceAPIException) -> JSONResponse:
+async def finance_api_exception_handler(request: Request, exc: FinanceAPIException) -> ORJSONResponse:
     """财务API异常处理器"""
-
-    # 根据错误代码映射到合适的HTTP状态码
-    status_code_mapping = {
-        "INVALID_SYMBOL": HTTP_400_BAD_REQUEST,
-        "TICKER_NOT_FOUND": HTTP_404_NOT_FOUND,
-        "INVALID_PARAM": HTTP_400_BAD_REQUEST,
-        "INSUFFICIENT_PERMISSIONS": HTTP_403_FORBIDDEN,
-        "TIMEOUT_ERROR": HTTP_504_GATEWAY_TIMEOUT,
-        "SERVICE_UNAVAILABLE": HTTP_503_SERVICE_UNAVAILABLE,
-        "YAHOO_API_ERROR": HTTP_502_BAD_GATEWAY,
-        "CACHE_ERROR": HTTP_500_INTERNAL_SERVER_ERROR,
-    }
-
     # 使用映射的状态码，或者使用异常自带的状态码
-    final_status_code = status_code_mapping.get(exc.code, exc.status_code)
+    final_status_code = _STATUS_CODE_MAPPING.get(exc.code, exc.status_code)
 
     logger.error(
         "API异常",
@@ -127,20 +156,20 @@ async def finance_api_exception_handler(request: Request, exc: FinanceAPIExcepti
         method=request.method,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=final_status_code,
         content={
             "success": False,
             "code": exc.code,
             "message": exc.message,
             "detail": exc.message,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now_cached(),
             "details": exc.details,
         },
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """通用异常处理器"""
     logger.error(
         "未处理的异常",
@@ -150,19 +179,19 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         method=request.method,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
             "code": "INTERNAL_ERROR",
             "message": "内部服务器错误",
             "detail": "服务器内部错误，请稍后重试",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now_cached(),
         },
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """HTTP异常处理器"""
     logger.warning(
         "HTTP异常",
@@ -173,29 +202,15 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
     # 根据状态码确定错误代码
-    code_mapping = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        422: "VALIDATION_ERROR",
-        429: "TOO_MANY_REQUESTS",
-        500: "INTERNAL_ERROR",
-        502: "BAD_GATEWAY",
-        503: "SERVICE_UNAVAILABLE",
-        504: "GATEWAY_TIMEOUT",
-    }
-
-    error_code = code_mapping.get(exc.status_code, "HTTP_ERROR")
-
-    return JSONResponse(
+    error_code = _HTTP_CODE_MAPPING.get(exc.status_code, "HTTP_ERROR")
+
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "code": error_code,
             "message": str(exc.detail),
             "detail": str(exc.detail),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now_cached(),
         },
     )
@@ -0,0 +1,19 @@
+"""
+响应工具模块
+提供基于orjson的JSON响应类
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """使用orjson序列化的JSON响应，原生支持numpy数组、datetime和非字符串键"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
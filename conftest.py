@@ -0,0 +1,22 @@
+"""
+根目录pytest共享fixture
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+
+
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """整个测试会话共用的FastAPI应用，只导入和注册路由一次"""
+    from app.main import app
+    return app
+
+
+@pytest_asyncio.fixture
+async def client(fastapi_app):
+    """进程内直连ASGI应用的异步客户端，不经过TestClient的后台线程"""
+    transport = httpx.ASGITransport(app=fastapi_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
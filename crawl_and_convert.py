@@ -8,110 +8,445 @@ SEC-API 文档站点分析和转换工具
 4. 生成站点地图和分析报告
 """
 
+import functools
+import io
 import os
-import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from urllib.parse import urljoin, urlparse, unquote
-from collections import defaultdict
+from urllib.parse import urljoin, unquote
+from collections import Counter
 from datetime import datetime
+from html.parser import HTMLParser
 
+import orjson
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree
 from markitdown import MarkItDown
 import html2text
 
+# 每次派发给子进程的文件数，用于摊薄进程间通信开销
+PARSE_CHUNK_SIZE = 32
+
+# 链接分类：绝对链接（group(1) 非空表示指向 sec-api.io）或站内绝对路径 "/"
+LINK_CLASS_RE = re.compile(r'https?://(?:.*(sec-api\.io))?|/')
+
+# 外部链接的域名部分（与 urlparse(...).netloc 一致）
+LINK_DOMAIN_RE = re.compile(r'https?://([^/?#]*)')
+
+# 主要内容区域的选择器，按优先级排列
+CONTENT_SELECTORS = ('main', 'article', '.content', '#content', '.docs-content')
+
+# 预编译的内容选择器（逐个保留优先级，合并成一个选择器会变成按文档顺序匹配）
+COMPILED_CONTENT_SELECTORS = tuple(
+    soupsieve.compile(selector) for selector in CONTENT_SELECTORS)
+
+
+def _walk_tree(root):
+    """递归遍历目录，产出 (路径, 是否目录)（os.scandir 复用目录项缓存的类型信息）"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    stack.append(entry.path)
+                yield entry.path, is_dir
+
+
+def _parse_links(html_bytes):
+    """解析 HTML 的标题和链接
+
+    返回 (标题, 链接列表, 错误信息)，出错时前两项为 None。
+    """
+    try:
+        title_text = None
+        file_links = []
+
+        # 流式解析，只关心 title/a/link，处理完的节点立即释放，不构建完整 DOM
+        for _, elem in etree.iterparse(io.BytesIO(html_bytes), events=('end',),
+                                       tag=('a', 'link', 'title'), html=True,
+                                       recover=True, encoding='utf-8'):
+            if elem.tag == 'title':
+                # 提取页面标题
+                if title_text is None:
+                    title_text = ''.join(elem.itertext()).strip()
+            else:
+                # 提取链接
+                href = elem.get('href')
+                if href:
+                    file_links.append({
+                        'href': href,
+                        'text': ''.join(elem.itertext()).strip() if elem.tag == 'a' else '',
+                        'tag': elem.tag
+                    })
+
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        if title_text is None:
+            title_text = "无标题"
+
+        return title_text, file_links, None
+
+    except Exception as e:
+        return None, None, str(e)
+
+
+class _StopScan(Exception):
+    """内容扫描提前结束"""
+
+
+class _ContentScanner(HTMLParser):
+    """单遍扫描 HTML，记录第一个 <title> 和各内容选择器首次命中区域在源码中的范围"""
+
+    def __init__(self, html_content):
+        super().__init__()
+        self.html_content = html_content
+        self.line_starts = [0]
+        self.line_starts.extend(
+            m.end() for m in re.finditer('\n', html_content))
+        self.title = None
+        self.regions = {}      # 选择器序号 -> (起始偏移, 结束偏移)
+        self._open = {}        # 选择器序号 -> [标签名, 起始偏移, 同名标签嵌套深度]
+        self._title_parts = None
+
+    def _offset(self):
+        line, col = self.getpos()
+        return self.line_starts[line - 1] + col
+
+    @staticmethod
+    def _match_selectors(tag, attrs):
+        """返回该标签命中的选择器序号"""
+        matched = []
+        if tag == 'main':
+            matched.append(0)
+        elif tag == 'article':
+            matched.append(1)
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes = value.split()
+                if 'content' in classes:
+                    matched.append(2)
+                if 'docs-content' in classes:
+                    matched.append(4)
+            elif name == 'id' and value == 'content':
+                matched.append(3)
+        return matched
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title' and self.title is None:
+            self._title_parts = []
+
+        for index in self._match_selectors(tag, attrs):
+            if index not in self.regions and index not in self._open:
+                self._open[index] = [tag, self._offset(), 0]
+
+        for tracker in self._open.values():
+            if tracker[0] == tag:
+                tracker[2] += 1
+
+    def handle_data(self, data):
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._title_parts is not None:
+            self.title = ''.join(self._title_parts).strip()
+            self._title_parts = None
+
+        for index, tracker in list(self._open.items()):
+            if tracker[0] != tag:
+                continue
+            tracker[2] -= 1
+            if tracker[2] == 0:
+                end = self.html_content.find('>', self._offset()) + 1
+                self.regions[index] = (tracker[1], end or len(self.html_content))
+                del self._open[index]
+
+        # 最高优先级的区域和标题都已拿到，后面的内容不必再扫描
+        if 0 in self.regions and self.title is not None:
+            raise _StopScan()
+
+
+def _scan_content(html_content):
+    """不构建 DOM，单遍定位标题和主要内容区域
+
+    返回 (标题, 内容区域 HTML)，未找到完整闭合的内容区域时内容为 None。
+    """
+    scanner = _ContentScanner(html_content)
+    try:
+        scanner.feed(html_content)
+        scanner.close()
+    except _StopScan:
+        pass
+
+    for index in range(len(CONTENT_SELECTORS)):
+        region = scanner.regions.get(index)
+        if region is not None:
+            start, end = region
+            return scanner.title, html_content[start:end]
+    return scanner.title, None
+
+
+def _select_content_with_soup(html_content):
+    """用 BeautifulSoup 定位标题和主要内容区域，返回 (标题, 内容区域 HTML)"""
+    soup = BeautifulSoup(html_content, 'lxml')
+
+    # 获取标题
+    title = soup.find('title')
+    title_text = title.text.strip() if title else None
+
+    # 查找主要内容区域
+    content = None
+    for selector in COMPILED_CONTENT_SELECTORS:
+        content = selector.select_one(soup)
+        if content:
+            break
+
+    if not content:
+        content = soup.body if soup.body else soup
+
+    return title_text, str(content)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_converters():
+    """获取当前进程的 Markdown 转换器（每个进程只创建一次）"""
+    markitdown = MarkItDown()
+    converter = html2text.HTML2Text()
+    converter.ignore_links = False
+    converter.ignore_images = False
+    return markitdown, converter
+
+
+def _convert_file(html_bytes, relative_path, output_path):
+    """将 HTML 转换为 Markdown 并写入 output_path
+
+    成功返回 None，失败返回错误信息。
+    """
+    try:
+        html_content = html_bytes.decode('utf-8')
+
+        # 先单遍扫描定位标题和内容区域，扫描不出完整区域时再构建 DOM
+        title_text, content_html = _scan_content(html_content)
+        if content_html is None:
+            title_text, content_html = _select_content_with_soup(html_content)
+        del html_content
+
+        if title_text is None:
+            title_text = "Documentation"
+
+        markitdown, converter = _get_converters()
+
+        # 尝试使用 markitdown
+        try:
+            result = markitdown.convert(content_html)
+            markdown_content = result.text_content
+        except:
+            # 降级使用 html2text
+            markdown_content = converter.handle(content_html)
+        del content_html
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 写入 Markdown 文件
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.writelines((
+                f"# {title_text}\n\n",
+                f"> 源文件: {relative_path}\n",
+                f"> 转换时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+                "---\n\n",
+                markdown_content,
+            ))
+
+        return None
+
+    except Exception as e:
+        return str(e)
+
+
+def _process_file(file_path, download_dir, markdown_dir, force=False):
+    """读取一次 HTML 文件，提取标题和链接并转换为 Markdown（在子进程中运行）
+
+    Markdown 文件比源文件新时跳过转换（force=True 时总是重新转换）。
+    返回 (标题, 链接列表, 链接提取错误, 转换错误)。
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            source_mtime = os.fstat(f.fileno()).st_mtime
+            html_bytes = f.read()
+    except Exception as e:
+        return None, None, str(e), str(e)
+
+    title_text, file_links, link_error = _parse_links(html_bytes)
+
+    # 构建输出路径
+    relative_path = file_path.relative_to(download_dir)
+    output_path = markdown_dir / relative_path.with_suffix('.md')
+
+    try:
+        up_to_date = not force and os.stat(output_path).st_mtime >= source_mtime
+    except FileNotFoundError:
+        up_to_date = False
+
+    if up_to_date:
+        convert_error = None
+    else:
+        convert_error = _convert_file(html_bytes, relative_path, output_path)
+    return title_text, file_links, link_error, convert_error
+
 
 class SiteAnalyzer:
-    def __init__(self, download_dir, output_dir="output"):
+    def __init__(self, download_dir, output_dir="output", force=False):
         self.download_dir = Path(download_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-
-        # 初始化转换器
-        self.markitdown = MarkItDown()
-        self.html2text = html2text.HTML2Text()
-        self.html2text.ignore_links = False
-        self.html2text.ignore_images = False
+        # 为 True 时忽略已有的 Markdown 文件，全部重新转换
+        self.force = force
 
         # 数据存储
         self.all_files = []
-        self.all_links = defaultdict(list)
+        self.all_links = {}
         self.internal_links = set()
         self.external_links = set()
         self.broken_links = []
         self.file_structure = {}
+        # 下载目录下所有文件和目录的相对路径，供死链接检查做存在性判断
+        self.existing_paths = frozenset()
+        # 字符串池：重复出现的标题、链接等只保留一份
+        self._str_pool = {}
 
     def scan_files(self):
         """扫描所有 HTML 文件"""
         print("📁 扫描文件...")
-        for file_path in self.download_dir.rglob("*.html"):
-            self.all_files.append(file_path)
+        root = str(self.download_dir)
+        prefix_len = len(os.path.join(root, ''))
+        existing_paths = set()
+        for path, is_dir in _walk_tree(root):
+            existing_paths.add(path[prefix_len:])
+            if not is_dir and path.endswith('.html'):
+                self.all_files.append(Path(path))
+        self.existing_paths = frozenset(existing_paths)
 
         print(f"✅ 找到 {len(self.all_files)} 个 HTML 文件")
         return self.all_files
 
-    def extract_links(self):
-        """从所有 HTML 文件中提取链接"""
-        print("\n🔗 提取链接...")
+    def process_files(self):
+        """提取所有 HTML 文件的链接并转换为 Markdown（每个文件只读取一次）"""
+        print("\n🔗 提取链接并转换为 Markdown...")
 
-        for file_path in self.all_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    soup = BeautifulSoup(f.read(), 'html.parser')
+        markdown_dir = self.output_dir / 'markdown'
+        markdown_dir.mkdir(exist_ok=True)
 
-                # 提取页面标题
-                title = soup.find('title')
-                title_text = title.text.strip() if title else "无标题"
+        converted_count = 0
+        failed_count = 0
+
+        # 各页面的导航链接、标题大量重复，汇总时共用同一个字符串对象
+        str_pool = self._str_pool
+
+        def intern(value):
+            return str_pool.setdefault(value, value)
+
+        # 所有文件中出现过的链接（去重后统一分类，导航链接只分类一次）
+        unique_hrefs = set()
+
+        # 各文件相互独立，解析和转换（CPU密集）分发到多个进程，结果在主进程汇总
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 initializer=_get_converters) as executor:
+            processed = executor.map(
+                _process_file, self.all_files,
+                [self.download_dir] * len(self.all_files),
+                [markdown_dir] * len(self.all_files),
+                [self.force] * len(self.all_files),
+                chunksize=PARSE_CHUNK_SIZE)
+
+            for file_path, (title_text, file_links, link_error, convert_error) in zip(
+                    self.all_files, processed):
+                if convert_error is None:
+                    converted_count += 1
+                else:
+                    print(f"❌ 转换失败 {file_path}: {convert_error}")
+                    failed_count += 1
+
+                if link_error is not None:
+                    print(f"❌ 处理文件失败 {file_path}: {link_error}")
+                    continue
+
+                file_links = [
+                    {'href': intern(link['href']),
+                     'text': intern(link['text']),
+                     'tag': intern(link['tag'])}
+                    for link in file_links
+                ]
+
+                unique_hrefs.update(link['href'] for link in file_links)
 
                 # 获取相对路径
                 relative_path = file_path.relative_to(self.download_dir)
 
-                # 提取所有链接
-                file_links = []
-                for tag in soup.find_all(['a', 'link']):
-                    href = tag.get('href')
-                    if href:
-                        file_links.append({
-                            'href': href,
-                            'text': tag.text.strip() if tag.name == 'a' else '',
-                            'tag': tag.name
-                        })
-
-                        # 分类链接
-                        if href.startswith(('http://', 'https://')):
-                            if 'sec-api.io' in href:
-                                self.internal_links.add(href)
-                            else:
-                                self.external_links.add(href)
-                        elif href.startswith('/'):
-                            self.internal_links.add(
-                                f"https://sec-api.io{href}")
-
                 self.all_links[str(relative_path)] = {
-                    'title': title_text,
+                    'title': intern(title_text),
                     'links': file_links,
                     'path': str(file_path)
                 }
 
-            except Exception as e:
-                print(f"❌ 处理文件失败 {file_path}: {e}")
+        self._classify_links(unique_hrefs)
 
         print(
             f"✅ 提取完成: {len(self.internal_links)} 个内部链接, {len(self.external_links)} 个外部链接")
+        print(f"✅ 转换完成: 成功 {converted_count} 个, 失败 {failed_count} 个")
+
+    def _classify_links(self, hrefs):
+        """将链接分为内部链接和外部链接（每个 href 只做一次正则匹配）"""
+        match_link = LINK_CLASS_RE.match
+        for href in hrefs:
+            m = match_link(href)
+            if m is None:
+                continue
+            if m.group(1) is not None:
+                self.internal_links.add(href)
+            elif m.end() == 1:
+                self.internal_links.add(f"https://sec-api.io{href}")
+            else:
+                self.external_links.add(href)
 
     def check_broken_links(self):
         """检查死链接"""
         print("\n🔍 检查死链接...")
 
+        root = os.path.normpath(self.download_dir)
+        root_prefix = '' if root == '.' else os.path.join(root, '')
+        existing_paths = self.existing_paths
+
+        def exists(path):
+            # 只查扫描时收集的路径集合，不做文件系统调用
+            path_str = os.path.normpath(path)
+            return (path_str.startswith(root_prefix) and
+                    path_str[len(root_prefix):] in existing_paths)
+
+        # 同一目录下的同一链接只检查一次：(目录, href) -> 期望路径（存在时为 None）
+        checked = {}
+
         for file_info in self.all_links.values():
             file_path = Path(file_info['path'])
             file_dir = file_path.parent
+            source = None
 
             for link_info in file_info['links']:
                 href = link_info['href']
 
                 # 只检查相对链接
-                if not href.startswith(('http://', 'https://', '#', 'mailto:', 'javascript:')):
+                if href.startswith(('http://', 'https://', '#', 'mailto:', 'javascript:')):
+                    continue
+
+                # 以 / 开头的链接与所在目录无关
+                check_key = (None if href.startswith('/') else file_dir, href)
+                try:
+                    expected_path = checked[check_key]
+                except KeyError:
                     # 解析相对路径
                     if href.startswith('/'):
                         # 绝对路径
@@ -119,84 +454,28 @@ class SiteAnalyzer:
                             'sec-api.io' / href.lstrip('/')
                     else:
                         # 相对路径
-                        target_path = (file_dir / href).resolve()
+                        target_path = Path(os.path.normpath(file_dir / href))
 
                     # 检查文件是否存在
-                    exists = (target_path.exists() or
-                              target_path.with_suffix('.html').exists() or
-                              (target_path / 'index.html').exists())
-
-                    if not exists:
-                        self.broken_links.append({
-                            'source': str(file_path.relative_to(self.download_dir)),
-                            'broken_link': href,
-                            'expected_path': str(target_path.relative_to(self.download_dir))
-                        })
+                    found = (exists(target_path) or
+                             exists(target_path.with_suffix('.html')) or
+                             exists(target_path / 'index.html'))
+
+                    expected_path = None if found else str(
+                        target_path.relative_to(self.download_dir))
+                    checked[check_key] = expected_path
+
+                if expected_path is not None:
+                    if source is None:
+                        source = str(file_path.relative_to(self.download_dir))
+                    self.broken_links.append({
+                        'source': source,
+                        'broken_link': href,
+                        'expected_path': expected_path
+                    })
 
         print(f"✅ 发现 {len(self.broken_links)} 个死链接")
 
-    def convert_to_markdown(self):
-        """将所有 HTML 文件转换为 Markdown"""
-        print("\n📝 转换为 Markdown...")
-
-        markdown_dir = self.output_dir / 'markdown'
-        markdown_dir.mkdir(exist_ok=True)
-
-        converted_count = 0
-        failed_count = 0
-
-        for file_path in self.all_files:
-            try:
-                # 读取 HTML
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-
-                soup = BeautifulSoup(html_content, 'html.parser')
-
-                # 获取标题
-                title = soup.find('title')
-                title_text = title.text.strip() if title else "Documentation"
-
-                # 查找主要内容区域
-                content = None
-                for selector in ['main', 'article', '.content', '#content', '.docs-content']:
-                    content = soup.select_one(selector)
-                    if content:
-                        break
-
-                if not content:
-                    content = soup.body if soup.body else soup
-
-                # 尝试使用 markitdown
-                try:
-                    result = self.markitdown.convert(str(content))
-                    markdown_content = result.text_content
-                except:
-                    # 降级使用 html2text
-                    markdown_content = self.html2text.handle(str(content))
-
-                # 构建输出路径
-                relative_path = file_path.relative_to(self.download_dir)
-                output_path = markdown_dir / relative_path.with_suffix('.md')
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # 写入 Markdown 文件
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(f"# {title_text}\n\n")
-                    f.write(f"> 源文件: {relative_path}\n")
-                    f.write(
-                        f"> 转换时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write("---\n\n")
-                    f.write(markdown_content)
-
-                converted_count += 1
-
-            except Exception as e:
-                print(f"❌ 转换失败 {file_path}: {e}")
-                failed_count += 1
-
-        print(f"✅ 转换完成: 成功 {converted_count} 个, 失败 {failed_count} 个")
-
     def generate_sitemap(self):
         """生成站点地图"""
         print("\n🗺️  生成站点地图...")
@@ -207,41 +486,39 @@ class SiteAnalyzer:
             'statistics': {}
         }
 
+        pages = sitemap['pages']
+        structure = sitemap['structure']
+        no_info = {}
+
         # 构建页面列表
         for file_path in self.all_files:
-            relative_path = file_path.relative_to(self.download_dir)
+            file_key = str(file_path.relative_to(self.download_dir))
 
             # 转换为 URL
-            url_parts = str(relative_path).replace('\\', '/').split('/')
-            if url_parts[0] == 'sec-api.io':
-                url_parts = url_parts[1:]
+            url_path = file_key.replace('\\', '/').removeprefix('sec-api.io/')
+            url_parts = url_path.split('/')
 
-            url_path = '/'.join(url_parts)
             if url_path.endswith('/index.html'):
                 url_path = url_path[:-11]
-            elif url_path.endswith('.html'):
-                url_path = url_path[:-5]
+            else:
+                url_path = url_path.removesuffix('.html')
 
             # 获取页面信息
-            file_key = str(relative_path)
-            page_info = {
-                'url': f"https://sec-api.io/{url_path}",
-                'file': str(relative_path),
-                'title': self.all_links.get(file_key, {}).get('title', ''),
-                'links_count': len(self.all_links.get(file_key, {}).get('links', []))
-            }
-
-            sitemap['pages'].append(page_info)
+            file_info = self.all_links.get(file_key, no_info)
+            url = f"https://sec-api.io/{url_path}"
+            pages.append({
+                'url': url,
+                'file': file_key,
+                'title': file_info.get('title', ''),
+                'links_count': len(file_info.get('links', ()))
+            })
 
             # 构建树形结构
-            current = sitemap['structure']
+            current = structure
             for part in url_parts[:-1]:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
+                current = current.setdefault(part, {})
 
-            file_name = url_parts[-1] if url_parts else 'index'
-            current[file_name] = page_info['url']
+            current[url_parts[-1]] = url
 
         # 统计信息
         sitemap['statistics'] = {
@@ -253,8 +530,8 @@ class SiteAnalyzer:
         }
 
         # 保存站点地图
-        with open(self.output_dir / 'sitemap.json', 'w', encoding='utf-8') as f:
-            json.dump(sitemap, f, indent=2, ensure_ascii=False)
+        with open(self.output_dir / 'sitemap.json', 'wb') as f:
+            f.write(orjson.dumps(sitemap, option=orjson.OPT_INDENT_2))
 
         print("✅ 站点地图已生成")
 
@@ -297,12 +574,11 @@ class SiteAnalyzer:
 
         # 外部链接
         report.append("## 🌐 外部链接域名统计\n")
-        external_domains = defaultdict(int)
-        for link in self.external_links:
-            domain = urlparse(link).netloc
-            external_domains[domain] += 1
+        match_domain = LINK_DOMAIN_RE.match
+        external_domains = Counter(
+            match_domain(link).group(1) for link in self.external_links)
 
-        for domain, count in sorted(external_domains.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for domain, count in external_domains.most_common(10):
             report.append(f"- {domain}: {count} 个链接")
 
         # 保存报告
@@ -314,15 +590,15 @@ class SiteAnalyzer:
 
         # 同时保存详细的 JSON 数据
         detailed_data = {
-            'all_links': dict(self.all_links),
+            'all_links': self.all_links,
             'internal_links': list(self.internal_links),
             'external_links': list(self.external_links),
             'broken_links': self.broken_links,
             'file_list': [str(f.relative_to(self.download_dir)) for f in self.all_files]
         }
 
-        with open(self.output_dir / 'detailed_analysis.json', 'w', encoding='utf-8') as f:
-            json.dump(detailed_data, f, indent=2, ensure_ascii=False)
+        with open(self.output_dir / 'detailed_analysis.json', 'wb') as f:
+            f.write(orjson.dumps(detailed_data, option=orjson.OPT_INDENT_2))
 
     def run(self):
         """运行完整的分析流程"""
@@ -331,19 +607,16 @@ class SiteAnalyzer:
         # 1. 扫描文件
         self.scan_files()
 
-        # 2. 提取链接
-        self.extract_links()
+        # 2. 提取链接并转换为 Markdown
+        self.process_files()
 
         # 3. 检查死链接
         self.check_broken_links()
 
-        # 4. 转换为 Markdown
-        self.convert_to_markdown()
-
-        # 5. 生成站点地图
+        # 4. 生成站点地图
         self.generate_sitemap()
 
-        # 6. 生成报告
+        # 5. 生成报告
         self.generate_report()
 
         print("\n✨ 分析完成！")
@@ -363,6 +636,8 @@ def main():
     parser.add_argument('download_dir', help='wget 下载的目录路径')
     parser.add_argument('-o', '--output', default='output',
                         help='输出目录 (默认: output)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='重新转换所有文件，不跳过已是最新的 Markdown')
 
     args = parser.parse_args()
 
@@ -376,7 +651,7 @@ def main():
         return
 
     # 运行分析
-    analyzer = SiteAnalyzer(args.download_dir, args.output)
+    analyzer = SiteAnalyzer(args.download_dir, args.output, force=args.force)
     analyzer.run()
 
 
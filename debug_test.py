@@ -17,26 +17,18 @@ async def test_data_sources():
     manager = DataSourceManager()
     # DataSourceManager没有initialize方法，它在初始化时自动完成
 
-    print("\n=== 测试有效股票代码 AAPL ===")
-    try:
-        result = await manager.get_fast_quote("AAPL")
-        print(f"✅ 成功: {result}")
-    except Exception as e:
-        print(f"❌ 失败: {type(e).__name__}: {e}")
-
-    print("\n=== 测试有效股票代码 MSFT ===")
-    try:
-        result = await manager.get_fast_quote("MSFT")
-        print(f"✅ 成功: {result}")
-    except Exception as e:
-        print(f"❌ 失败: {type(e).__name__}: {e}")
-
-    print("\n=== 测试无效股票代码 INVALID123 ===")
-    try:
-        result = await manager.get_fast_quote("INVALID123")
-        print(f"✅ 成功: {result}")
-    except Exception as e:
-        print(f"❌ 失败: {type(e).__name__}: {e}")
+    # 三个代码的请求相互独立，并发执行
+    cases = [("有效", "AAPL"), ("有效", "MSFT"), ("无效", "INVALID123")]
+    results = await asyncio.gather(
+        *(manager.get_fast_quote(symbol) for _, symbol in cases),
+        return_exceptions=True)
+
+    for (label, symbol), result in zip(cases, results):
+        print(f"\n=== 测试{label}股票代码 {symbol} ===")
+        if isinstance(result, Exception):
+            print(f"❌ 失败: {type(result).__name__}: {result}")
+        else:
+            print(f"✅ 成功: {result}")
 
     print("\n=== 数据源状态 ===")
     status = manager.fallback_manager.get_status_summary()
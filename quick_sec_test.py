@@ -4,13 +4,35 @@ SEC API快速测试
 验证SEC API是否能正常工作
 """
 
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 import os
+from collections import Counter
 from datetime import datetime
+from importlib.util import find_spec
 
+# 环境变量中的SEC API密钥（模块加载时读取一次）
+SEC_API_KEY = os.environ.get('SEC_API_KEY')
 
-def test_sec_free_api():
+# 安装了 h2（httpx[http2]）时启用HTTP/2，同一主机的并发请求复用一条连接
+HTTP2_ENABLED = find_spec('h2') is not None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def create_client() -> httpx.AsyncClient:
+    """创建所有SEC请求共用的客户端（sec.gov / data.sec.gov 长连接）"""
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=30,
+        transport=httpx.AsyncHTTPTransport(http2=HTTP2_ENABLED, retries=3),
+    )
+
+
+async def run_sec_free_api(client: httpx.AsyncClient):
     """测试免费的SEC.gov API"""
     print("🔍 测试免费的SEC.gov API...")
 
@@ -18,33 +40,28 @@ def test_sec_free_api():
         # 测试获取公司映射数据
         print("   - 测试公司代码映射...")
         url = "https://www.sec.gov/files/company_tickers.json"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await client.get(url, timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            # 查找AAPL的CIK
-            apple_cik = None
-            for key, company in data.items():
-                if company.get('ticker', '').upper() == 'AAPL':
-                    apple_cik = company.get('cik_str')
-                    print(f"   ✅ 找到AAPL的CIK: {apple_cik}")
-                    break
+            # 建立代码到CIK的映射（SEC数据中的代码均为大写），查找AAPL的CIK
+            ticker_to_cik = {
+                company['ticker']: company['cik_str'] for company in data.values()}
+            apple_cik = ticker_to_cik.get('AAPL')
+            if apple_cik:
+                print(f"   ✅ 找到AAPL的CIK: {apple_cik}")
 
             if apple_cik:
                 # 测试获取公司提交数据
                 print("   - 测试公司提交数据...")
                 submissions_url = f"https://data.sec.gov/submissions/CIK{apple_cik:010d}.json"
 
-                response2 = requests.get(
-                    submissions_url, headers=headers, timeout=15)
+                response2 = await client.get(submissions_url, timeout=15)
 
                 if response2.status_code == 200:
-                    submissions = response2.json()
+                    submissions = orjson.loads(response2.content)
                     company_name = submissions.get('name', 'Unknown')
                     recent_filings = submissions.get(
                         'filings', {}).get('recent', {})
@@ -54,9 +71,7 @@ def test_sec_free_api():
                     print(f"   ✅ 最近提交的表单数量: {len(forms)}")
 
                     # 显示最近的几个10-K和10-Q
-                    form_counts = {}
-                    for form in forms[:20]:
-                        form_counts[form] = form_counts.get(form, 0) + 1
+                    form_counts = Counter(forms[:20])
 
                     print("   📊 最近提交的表单类型:")
                     for form_type, count in list(form_counts.items())[:5]:
@@ -82,7 +97,7 @@ def test_sec_api_connection():
     """测试SEC API连接性"""
     print("\n🔍 测试SEC API连接性...")
 
-    api_key = os.environ.get('SEC_API_KEY')
+    api_key = SEC_API_KEY
     if not api_key:
         print("   ⚠️  未设置SEC_API_KEY环境变量")
         print("   💡 如需测试付费API功能，请设置此变量")
@@ -102,7 +117,7 @@ def test_sec_api_connection():
         return False
 
 
-def test_concepts_api():
+async def run_concepts_api(client: httpx.AsyncClient):
     """测试SEC Concepts API"""
     print("\n🔍 测试SEC Concepts API...")
 
@@ -114,14 +129,11 @@ def test_concepts_api():
         print(f"   - 测试获取概念数据: {concept}...")
 
         url = f"https://data.sec.gov/api/xbrl/companyconcept/CIK{cik.zfill(10)}/us-gaap/{concept}.json"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
 
-        response = requests.get(url, headers=headers, timeout=30)
+        response = await client.get(url, timeout=30)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             entity_name = data.get('entityName', 'Unknown')
             cik_str = data.get('cik')
@@ -130,23 +142,15 @@ def test_concepts_api():
             print(f"   ✅ CIK: {cik_str}")
 
             # 分析数据结构
-            if 'units' in data and 'USD' in data['units']:
-                usd_data = data['units']['USD']
+            usd_data = data.get('units', {}).get('USD')
+            if usd_data is not None:
                 print(f"   ✅ USD数据条目: {len(usd_data)} 条")
 
-                # 统计表单类型
-                form_types = {}
-                fiscal_years = set()
-
-                for item in usd_data:
-                    form_type = item.get('form')
-                    fy = item.get('fy')
-
-                    if form_type:
-                        form_types[form_type] = form_types.get(
-                            form_type, 0) + 1
-                    if fy:
-                        fiscal_years.add(fy)
+                # 统计表单类型和财年（每个字段每条只取一次）
+                form_types = Counter(
+                    form for form in (item.get('form') for item in usd_data) if form)
+                fiscal_years = {
+                    fy for fy in (item.get('fy') for item in usd_data) if fy}
 
                 print("   📊 表单类型分布:")
                 for form_type, count in sorted(form_types.items()):
@@ -170,22 +174,23 @@ def test_concepts_api():
         return False
 
 
+async def run_tests():
+    """并发执行两个访问SEC的测试，data.sec.gov 的请求共用同一连接"""
+    async with create_client() as client:
+        free_result, concepts_result = await asyncio.gather(
+            run_sec_free_api(client), run_concepts_api(client))
+
+    # 测试付费SEC API连接性
+    return [free_result, test_sec_api_connection(), concepts_result]
+
+
 def main():
     """主测试函数"""
     print("🚀 SEC API 快速验证测试")
     print(f"⏰ 测试时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
 
-    results = []
-
-    # 测试免费SEC API
-    results.append(test_sec_free_api())
-
-    # 测试付费SEC API连接性
-    results.append(test_sec_api_connection())
-
-    # 测试概念API
-    results.append(test_concepts_api())
+    results = asyncio.run(run_tests())
 
     # 汇总结果
     print("\n" + "=" * 50)
@@ -5,32 +5,73 @@ SEC高级功能快速测试脚本
 """
 
 import requests
+import requests_cache
 import json
+import orjson
 import time
+from datetime import timedelta
 
 # API基础URL
 BASE_URL = "http://localhost:8000/api/v1/sec-advanced"
 
+# 响应缓存到本地SQLite，重复运行时不再请求相同数据；健康检查始终实时请求
+SESSION = requests_cache.CachedSession(
+    cache_name='test_cache',
+    backend='sqlite',
+    expire_after=timedelta(hours=1),
+    urls_expire_after={'*/health': requests_cache.DO_NOT_CACHE},
+)
+
+
+class RateLimiter:
+    """根据响应头自适应的限速器：仅在服务端提示配额将尽或被限流(429)时等待"""
+
+    def __init__(self):
+        self.wait_seconds = 0.0
+
+    def update(self, response):
+        """根据响应计算下次请求前需要等待的时间"""
+        self.wait_seconds = 0.0
+        if response is None or getattr(response, 'from_cache', False):
+            return
+
+        if response.status_code == 429:
+            try:
+                self.wait_seconds = float(response.headers.get('Retry-After', 1))
+            except ValueError:
+                self.wait_seconds = 1.0
+            return
+
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit() and int(remaining) <= 1:
+            self.wait_seconds = 1.0
+
+    def wait(self):
+        """在下次请求前按需等待"""
+        if self.wait_seconds > 0:
+            time.sleep(self.wait_seconds)
+
 
 def test_endpoint(endpoint_path, test_name):
-    """测试单个端点"""
+    """测试单个端点，返回响应对象（请求失败时为 None）"""
     url = f"{BASE_URL}{endpoint_path}"
     print(f"\n🔄 测试: {test_name}")
     print(f"URL: {url}")
 
+    response = None
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         print(f"状态码: {response.status_code}")
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("✅ 成功")
             print(
                 f"响应数据: {json.dumps(data, indent=2, ensure_ascii=False)[:300]}...")
         else:
             print(f"❌ 失败: HTTP {response.status_code}")
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 print(f"错误信息: {error_data.get('message', 'Unknown error')}")
             except:
                 print(f"错误内容: {response.text[:200]}")
@@ -40,6 +81,8 @@ def test_endpoint(endpoint_path, test_name):
     except Exception as e:
         print(f"❌ 解析失败: {e}")
 
+    return response
+
 
 def main():
     """主测试函数"""
@@ -52,9 +95,10 @@ def main():
         ("/health", "健康检查"),
     ]
 
+    limiter = RateLimiter()
     for endpoint, name in test_cases:
-        test_endpoint(endpoint, name)
-        time.sleep(1)  # 避免请求过快
+        limiter.wait()  # 仅在服务端要求时等待，避免请求过快
+        limiter.update(test_endpoint(endpoint, name))
 
     print("\n" + "=" * 50)
     print("📝 测试说明:")
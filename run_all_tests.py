@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+集成测试统一入口
+在同一个事件循环中并发运行Polygon客户端、SEC高级功能和SEC数据源测试
+"""
+
+import asyncio
+import os
+import sys
+
+from test_polygon_client import test_polygon_client
+from test_sec_advanced import SecAdvancedAPITester
+from test_sec_api import SecApiTester
+
+
+async def run_sec_advanced_tests():
+    """运行SEC高级功能API测试"""
+    async with SecAdvancedAPITester() as tester:
+        await tester.run_all_tests()
+
+
+async def run_sec_api_tests(tickers):
+    """运行SEC数据源测试（未配置API密钥时跳过）"""
+    if not os.environ.get('SEC_API_KEY'):
+        print("⚠️  未设置SEC_API_KEY，跳过SEC数据源测试")
+        return None
+    return await SecApiTester().run_all_tests(tickers)
+
+
+async def main():
+    """主函数"""
+    tickers = [arg.upper() for arg in sys.argv[1:]] or ["AAPL"]
+
+    # 三组测试共用同一个事件循环，互不依赖，并发执行
+    results = await asyncio.gather(
+        test_polygon_client(),
+        run_sec_advanced_tests(),
+        run_sec_api_tests(tickers),
+        return_exceptions=True,
+    )
+
+    failed = False
+    for name, result in zip(["Polygon客户端", "SEC高级功能", "SEC数据源"], results):
+        if isinstance(result, BaseException):
+            print(f"💥 {name}测试异常: {result}")
+            failed = True
+        elif result is False:
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -3,16 +3,47 @@
 简单的SEC API测试脚本
 """
 
-import requests
-import json
+import aiohttp
+import asyncio
+import functools
+import orjson
 import os
 from datetime import datetime
 
+# 环境变量中的SEC API密钥（模块加载时读取一次）
+SEC_API_KEY = os.environ.get('SEC_API_KEY')
 
-def test_sec_endpoints():
+BASE_URL = "http://localhost:8000"
+
+# 按输出顺序排列的SEC端点路径，{ticker} 在生成URL时替换为股票代码
+SEC_ENDPOINTS = (
+    "/api/v1/sec/sec/health",
+    "/api/v1/sec/sec/",
+    "/api/v1/sec/sec/financials/{ticker}",
+    "/api/v1/sec/sec/revenue/{ticker}",
+    "/api/v1/sec/sec/news/{ticker}",
+    "/api/v1/sec/sec/ratios/{ticker}",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def urls_for(ticker):
+    """生成指定股票代码的全部端点URL（按代码缓存）"""
+    return tuple(BASE_URL + path.format(ticker=ticker) for path in SEC_ENDPOINTS)
+
+
+async def fetch(session, url):
+    """请求端点，返回 (状态码, 响应数据)；非200时数据为 None"""
+    async with session.get(url) as response:
+        if response.status != 200:
+            return response.status, None
+        return response.status, orjson.loads(await response.read())
+
+
+async def run_sec_endpoints():
     """测试SEC API端点"""
 
-    base_url = "http://localhost:8000"
+    base_url = BASE_URL
 
     print("🧪 开始测试SEC API功能...")
     print(f"📍 API服务器: {base_url}")
@@ -21,69 +52,72 @@ def test_sec_endpoints():
     test_ticker = "AAPL"
 
     try:
+        # 六个端点相互独立，并发请求后按顺序输出结果
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            (
+                (health_status, _),
+                (overview_status, overview),
+                (financials_status, financials),
+                (revenue_status, revenue),
+                (news_status, news),
+                (ratios_status, ratios_data),
+            ) = await asyncio.gather(
+                *(fetch(session, url) for url in urls_for(test_ticker)))
+
         # 1. 测试健康检查
         print("\n1️⃣ 测试健康检查...")
-        response = requests.get(f"{base_url}/api/v1/sec/sec/health")
-        if response.status_code == 200:
+        if health_status == 200:
             print("✅ 健康检查通过")
         else:
-            print(f"❌ 健康检查失败: {response.status_code}")
+            print(f"❌ 健康检查失败: {health_status}")
 
         # 2. 测试API概览
         print("\n2️⃣ 测试API概览...")
-        response = requests.get(f"{base_url}/api/v1/sec/sec/")
-        if response.status_code == 200:
-            data = response.json()
+        if overview_status == 200:
+            data = overview
             print("✅ API概览获取成功")
             print(f"   描述: {data.get('description', 'N/A')}")
         else:
-            print(f"❌ API概览失败: {response.status_code}")
+            print(f"❌ API概览失败: {overview_status}")
 
         # 3. 测试公司财务数据
         print(f"\n3️⃣ 测试获取 {test_ticker} 财务数据...")
-        response = requests.get(
-            f"{base_url}/api/v1/sec/sec/financials/{test_ticker}")
-        if response.status_code == 200:
-            data = response.json()
+        if financials_status == 200:
+            data = financials
             print("✅ 财务数据获取成功")
             print(f"   公司名称: {data.get('company_name', 'N/A')}")
             print(f"   年度财务记录数: {len(data.get('annual_financials', []))}")
             print(f"   季度财务记录数: {len(data.get('quarterly_financials', []))}")
         else:
-            print(f"❌ 财务数据获取失败: {response.status_code}")
+            print(f"❌ 财务数据获取失败: {financials_status}")
 
         # 4. 测试季度收入
         print(f"\n4️⃣ 测试获取 {test_ticker} 季度收入...")
-        response = requests.get(
-            f"{base_url}/api/v1/sec/sec/revenue/{test_ticker}")
-        if response.status_code == 200:
-            data = response.json()
+        if revenue_status == 200:
+            data = revenue
             print("✅ 季度收入获取成功")
             print(f"   股票代码: {data.get('ticker', 'N/A')}")
             print(f"   季度数据条数: {len(data.get('quarterly_data', []))}")
         else:
-            print(f"❌ 季度收入获取失败: {response.status_code}")
+            print(f"❌ 季度收入获取失败: {revenue_status}")
 
         # 5. 测试SEC新闻
         print(f"\n5️⃣ 测试获取 {test_ticker} SEC新闻...")
-        response = requests.get(
-            f"{base_url}/api/v1/sec/sec/news/{test_ticker}")
-        if response.status_code == 200:
-            data = response.json()
+        if news_status == 200:
+            data = news
             print("✅ SEC新闻获取成功")
             print(f"   新闻条数: {len(data.get('news_items', []))}")
             if data.get('news_items'):
                 first_news = data['news_items'][0]
                 print(f"   第一条新闻: {first_news.get('title', 'N/A')}")
         else:
-            print(f"❌ SEC新闻获取失败: {response.status_code}")
+            print(f"❌ SEC新闻获取失败: {news_status}")
 
         # 6. 测试财务比率
         print(f"\n6️⃣ 测试获取 {test_ticker} 财务比率...")
-        response = requests.get(
-            f"{base_url}/api/v1/sec/sec/ratios/{test_ticker}")
-        if response.status_code == 200:
-            data = response.json()
+        if ratios_status == 200:
+            data = ratios_data
             print("✅ 财务比率获取成功")
             print(f"   期间: {data.get('period', 'N/A')}")
             if data.get('ratios'):
@@ -91,12 +125,12 @@ def test_sec_endpoints():
                 print(f"   ROA: {ratios.get('roa', 'N/A')}%")
                 print(f"   ROE: {ratios.get('roe', 'N/A')}%")
         else:
-            print(f"❌ 财务比率获取失败: {response.status_code}")
+            print(f"❌ 财务比率获取失败: {ratios_status}")
 
         print("\n🎉 SEC API测试完成!")
 
         # 检查是否在模拟模式
-        sec_api_key = os.environ.get('SEC_API_KEY')
+        sec_api_key = SEC_API_KEY
         if not sec_api_key:
             print("\n💡 注意: 当前运行在模拟数据模式")
             print("   如需获取真实数据，请:")
@@ -106,7 +140,7 @@ def test_sec_endpoints():
         else:
             print(f"\n✅ 使用真实API密钥: {sec_api_key[:10]}...")
 
-    except requests.exceptions.ConnectionError:
+    except aiohttp.ClientConnectionError:
         print("❌ 无法连接到API服务器")
         print("   请确保API服务器正在运行: uvicorn app.main:app --reload")
     except Exception as e:
@@ -114,4 +148,4 @@ def test_sec_endpoints():
 
 
 if __name__ == "__main__":
-    test_sec_endpoints()
+    asyncio.run(run_sec_endpoints())
@@ -1,5 +1,9 @@
+import logging
 import os
 import sys
+import traceback
+
+logger = logging.getLogger(__name__)
 
 # 临时移除API密钥
 os.environ.pop('SEC_API_KEY', None)
@@ -23,5 +27,6 @@ except FinanceAPIException as e:
 
 except Exception as e:
     print(f"⚠️ 意外异常类型: {type(e).__name__}: {e}")
-    import traceback
-    traceback.print_exc()
+    # 仅在开启DEBUG日志时输出完整堆栈
+    if logger.isEnabledFor(logging.DEBUG):
+        traceback.print_exc()
@@ -13,13 +13,16 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
+# 环境变量中的SEC API密钥（模块加载时读取一次）
+SEC_API_KEY = os.getenv("SEC_API_KEY")
+
 
 def test_api_config():
     """测试API配置"""
     print("=== SEC API配置测试 ===")
 
     # 检查环境变量
-    env_key = os.getenv("SEC_API_KEY")
+    env_key = SEC_API_KEY
     print(
         f"环境变量 SEC_API_KEY: {env_key[:10]}...{env_key[-10:] if env_key else 'None'}")
 
@@ -14,6 +14,13 @@ from app.data_sources.polygon_source import PolygonDataSource
 from app.data_sources.yfinance_source import YFinanceDataSource
 
 
+def _unwrap(result):
+    """取出 asyncio.gather(return_exceptions=True) 的结果，异常则重新抛出"""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 async def test_api_fallback():
     """测试API降级机制"""
 
@@ -33,10 +40,19 @@ async def test_api_fallback():
 
     test_symbol = "AAPL"
 
+    # 四项测试互不依赖，并发请求后按顺序输出结果
+    fast_result, detailed_result, info_result, history_result = await asyncio.gather(
+        manager.get_fast_quote(test_symbol),
+        manager.get_detailed_quote(test_symbol),
+        manager.get_company_info(test_symbol),
+        manager.get_history(test_symbol, period="1mo"),
+        return_exceptions=True,
+    )
+
     # 测试1: 快速报价（应该从Polygon降级到Yahoo）
     print(f"1️⃣ 测试快速报价降级 ({test_symbol})")
     try:
-        quote_data = await manager.get_fast_quote(test_symbol)
+        quote_data = _unwrap(fast_result)
         print(f"✅ 降级成功获取快速报价:")
         print(f"   📊 股票代码: {test_symbol}")
         print(f"   💰 最新价格: ${quote_data.last_price}")
@@ -53,7 +69,7 @@ async def test_api_fallback():
     # 测试2: 详细报价（应该从Polygon降级到Yahoo）
     print(f"2️⃣ 测试详细报价降级 ({test_symbol})")
     try:
-        detailed_quote = await manager.get_detailed_quote(test_symbol)
+        detailed_quote = _unwrap(detailed_result)
         print(f"✅ 降级成功获取详细报价:")
         print(f"   📊 股票代码: {test_symbol}")
         print(f"   💰 最新价格: ${detailed_quote.last_price}")
@@ -75,7 +91,7 @@ async def test_api_fallback():
     # 测试3: 公司信息（应该从Polygon降级到Yahoo）
     print(f"3️⃣ 测试公司信息降级 ({test_symbol})")
     try:
-        company_info = await manager.get_company_info(test_symbol)
+        company_info = _unwrap(info_result)
         print(f"✅ 降级成功获取公司信息:")
         print(f"   🏢 公司名称: {company_info.name}")
         print(f"   🌐 网站: {company_info.website}")
@@ -92,7 +108,7 @@ async def test_api_fallback():
     # 测试4: 历史数据（应该从Polygon降级到Yahoo）
     print(f"4️⃣ 测试历史数据降级 ({test_symbol}, 1个月)")
     try:
-        history_data = await manager.get_history(test_symbol, period="1mo")
+        history_data = _unwrap(history_result)
         print(f"✅ 降级成功获取历史数据:")
 
         if hasattr(history_data, 'prices') and history_data.prices:
@@ -118,9 +134,12 @@ async def test_api_fallback():
     print("5️⃣ 测试数据源优先级和健康状态")
     sources_to_check = getattr(manager, 'all_sources', [
                                manager.primary_source] + manager.fallback_sources)
-    for i, source in enumerate(sources_to_check, 1):
+    health_results = await asyncio.gather(
+        *(source.health_check() for source in sources_to_check),
+        return_exceptions=True)
+    for i, (source, health_result) in enumerate(zip(sources_to_check, health_results), 1):
         try:
-            health = await source.health_check()
+            health = _unwrap(health_result)
             print(f"   数据源 {i} ({source.name}): {health}")
         except Exception as e:
             print(f"   数据源 {i} ({source.name}): ❌ {e}")
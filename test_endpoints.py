@@ -4,38 +4,112 @@
 验证直接数据源调用功能
 """
 
-import requests
+import functools
+import http.client
 import json
 import sys
-from typing import Dict, Any
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
 BASE_URL = "http://localhost:8000"
 TEST_SYMBOL = "AAPL"
 
-
-def make_request(endpoint: str) -> Dict[str, Any]:
+# 同时进行的测试请求数
+MAX_CONCURRENT_REQUESTS = 8
+
+_BASE = urlsplit(BASE_URL)
+
+# 每个工作线程持有一条到API服务器的长连接（http.client 连接不可跨线程共用）
+_local = threading.local()
+
+
+def _get_connection() -> http.client.HTTPConnection:
+    """获取当前线程的连接，不存在时新建"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = http.client.HTTPConnection(
+            _BASE.hostname, _BASE.port, timeout=30)
+    return conn
+
+# 测试用例模板，endpoint 中的 {symbol} 在生成用例时替换为股票代码
+TEST_CASES = [
+    {
+        "name": "Yahoo Finance 报价测试",
+        "endpoint": "/api/v1/test/yfinance/{symbol}/quote",
+        "description": "测试Yahoo Finance数据源直接调用"
+    },
+    {
+        "name": "Polygon.io 原始数据测试",
+        "endpoint": "/api/v1/test/polygon/{symbol}/raw",
+        "description": "测试Polygon.io原始API响应"
+    },
+    {
+        "name": "Polygon.io 报价测试",
+        "endpoint": "/api/v1/test/polygon/{symbol}/quote",
+        "description": "测试Polygon.io转换后的报价数据"
+    },
+    {
+        "name": "Polygon.io 公司信息测试",
+        "endpoint": "/api/v1/test/polygon/{symbol}/company",
+        "description": "测试Polygon.io公司信息"
+    },
+    {
+        "name": "数据源比较测试",
+        "endpoint": "/api/v1/test/compare/{symbol}",
+        "description": "比较不同数据源的数据差异"
+    },
+    {
+        "name": "健康检查测试",
+        "endpoint": "/api/v1/test/health-check",
+        "description": "测试所有数据源的健康状态"
+    },
+    {
+        "name": "API配置信息测试",
+        "endpoint": "/api/v1/test/api-limits",
+        "description": "查看API配置和限制信息"
+    }
+]
+
+
+@functools.lru_cache(maxsize=64)
+def cases_for_symbol(symbol: str) -> tuple:
+    """生成指定股票代码的测试用例（按代码缓存，URL只拼接一次）"""
+    return tuple(
+        {**test_case, "endpoint": test_case["endpoint"].format(symbol=symbol)}
+        for test_case in TEST_CASES
+    )
+
+
+@dataclass(slots=True)
+class Result:
+    """单次请求结果"""
+    success: bool
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+
+def make_request(endpoint: str) -> Result:
     """发起HTTP请求"""
-    url = f"{BASE_URL}{endpoint}"
+    conn = _get_connection()
     try:
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            return {
-                "success": True,
-                "data": response.json(),
-                "status_code": response.status_code
-            }
+        conn.request("GET", endpoint)
+        response = conn.getresponse()
+        body = response.read()
+        if response.status == 200:
+            return Result(True, data=orjson.loads(body),
+                          status_code=response.status)
         else:
-            return {
-                "success": False,
-                "error": response.text,
-                "status_code": response.status_code
-            }
+            return Result(False, error=body.decode("utf-8", "replace"),
+                          status_code=response.status)
     except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "status_code": None
-        }
+        # 连接状态未知，关闭后下次请求重新建立
+        conn.close()
+        return Result(False, error=str(e))
 
 
 def test_endpoints():
@@ -43,58 +117,25 @@ def test_endpoints():
     print("🚀 开始测试所有测试endpoints")
     print("=" * 60)
 
-    test_cases = [
-        {
-            "name": "Yahoo Finance 报价测试",
-            "endpoint": f"/api/v1/test/yfinance/{TEST_SYMBOL}/quote",
-            "description": "测试Yahoo Finance数据源直接调用"
-        },
-        {
-            "name": "Polygon.io 原始数据测试",
-            "endpoint": f"/api/v1/test/polygon/{TEST_SYMBOL}/raw",
-            "description": "测试Polygon.io原始API响应"
-        },
-        {
-            "name": "Polygon.io 报价测试",
-            "endpoint": f"/api/v1/test/polygon/{TEST_SYMBOL}/quote",
-            "description": "测试Polygon.io转换后的报价数据"
-        },
-        {
-            "name": "Polygon.io 公司信息测试",
-            "endpoint": f"/api/v1/test/polygon/{TEST_SYMBOL}/company",
-            "description": "测试Polygon.io公司信息"
-        },
-        {
-            "name": "数据源比较测试",
-            "endpoint": f"/api/v1/test/compare/{TEST_SYMBOL}",
-            "description": "比较不同数据源的数据差异"
-        },
-        {
-            "name": "健康检查测试",
-            "endpoint": "/api/v1/test/health-check",
-            "description": "测试所有数据源的健康状态"
-        },
-        {
-            "name": "API配置信息测试",
-            "endpoint": "/api/v1/test/api-limits",
-            "description": "查看API配置和限制信息"
-        }
-    ]
+    test_cases = cases_for_symbol(TEST_SYMBOL)
 
     results = []
 
-    for i, test_case in enumerate(test_cases, 1):
+    # 各测试用例相互独立，并发请求后按顺序输出结果
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        responses = list(executor.map(
+            make_request, [test_case['endpoint'] for test_case in test_cases]))
+
+    for i, (test_case, result) in enumerate(zip(test_cases, responses), 1):
         print(f"\n{i}. {test_case['name']}")
         print(f"   📋 {test_case['description']}")
         print(f"   🔗 GET {test_case['endpoint']}")
 
-        result = make_request(test_case['endpoint'])
-
-        if result['success']:
-            print(f"   ✅ 成功 (HTTP {result['status_code']})")
+        if result.success:
+            print(f"   ✅ 成功 (HTTP {result.status_code})")
 
             # 显示关键信息
-            data = result['data']
+            data = result.data
             if 'symbol' in data:
                 print(f"   📊 股票代码: {data['symbol']}")
             if 'data_source' in data:
@@ -113,15 +154,15 @@ def test_endpoints():
                 print(f"   🐛 调试模式: {debug_mode}")
 
         else:
-            print(f"   ❌ 失败 (HTTP {result.get('status_code', 'N/A')})")
-            print(f"   📄 错误信息: {result['error'][:200]}...")
+            print(f"   ❌ 失败 (HTTP {result.status_code})")
+            print(f"   📄 错误信息: {result.error[:200]}...")
 
         results.append({
             "test_name": test_case['name'],
             "endpoint": test_case['endpoint'],
-            "success": result['success'],
-            "status_code": result.get('status_code'),
-            "error": result.get('error') if not result['success'] else None
+            "success": result.success,
+            "status_code": result.status_code,
+            "error": result.error
         })
 
     # 总结
@@ -159,8 +200,8 @@ def main():
 
     # 先检查服务器是否在线
     health_check = make_request("/health")
-    if not health_check['success']:
-        print(f"\n❌ 服务器未响应: {health_check.get('error', '未知错误')}")
+    if not health_check.success:
+        print(f"\n❌ 服务器未响应: {health_check.error or '未知错误'}")
         print("请确保服务器正在运行: uvicorn app.main:app --reload --port 8000")
         sys.exit(1)
 
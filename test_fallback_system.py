@@ -20,131 +20,136 @@ logger = get_logger(__name__)
 
 async def test_basic_functionality():
     """测试基本功能"""
-    print("🚀 开始测试数据源管理器...")
+    logger.info("🚀 开始测试数据源管理器...")
 
     # 创建数据源管理器
     manager = DataSourceManager()
 
     # 测试获取快速报价
-    print("\n📊 测试快速报价...")
+    logger.info("📊 测试快速报价...")
     try:
         quote = await manager.get_fast_quote("AAPL")
-        print(f"✅ 快速报价成功: ${quote.last_price}")
-        print(f"   数据源: {getattr(quote, 'data_source', 'unknown')}")
+        logger.info("✅ 快速报价成功: $%s", quote.last_price)
+        logger.info("   数据源: %s", getattr(quote, 'data_source', 'unknown'))
     except Exception as e:
-        print(f"❌ 快速报价失败: {e}")
+        logger.error("❌ 快速报价失败: %s", e)
 
     # 测试获取详细报价
-    print("\n📈 测试详细报价...")
+    logger.info("📈 测试详细报价...")
     try:
         detailed = await manager.get_detailed_quote("AAPL")
-        print(f"✅ 详细报价成功: ${detailed.last_price}")
-        print(
-            f"   市值: ${detailed.market_cap:,}" if detailed.market_cap else "   市值: N/A")
-        print(f"   数据源: {getattr(detailed, 'data_source', 'unknown')}")
+        logger.info("✅ 详细报价成功: $%s", detailed.last_price)
+        if detailed.market_cap:
+            logger.info("   市值: $%s", format(detailed.market_cap, ","))
+        else:
+            logger.info("   市值: N/A")
+        logger.info("   数据源: %s", getattr(detailed, 'data_source', 'unknown'))
     except Exception as e:
-        print(f"❌ 详细报价失败: {e}")
+        logger.error("❌ 详细报价失败: %s", e)
 
     # 测试获取公司信息
-    print("\n🏢 测试公司信息...")
+    logger.info("🏢 测试公司信息...")
     try:
         info = await manager.get_company_info("AAPL")
-        print(f"✅ 公司信息成功: {info.name}")
-        print(f"   行业: {info.sector}")
-        print(f"   数据源: {getattr(info, 'data_source', 'unknown')}")
+        logger.info("✅ 公司信息成功: %s", info.name)
+        logger.info("   行业: %s", info.sector)
+        logger.info("   数据源: %s", getattr(info, 'data_source', 'unknown'))
     except Exception as e:
-        print(f"❌ 公司信息失败: {e}")
+        logger.error("❌ 公司信息失败: %s", e)
 
     # 测试历史数据
-    print("\n📊 测试历史数据...")
+    logger.info("📊 测试历史数据...")
     try:
         history = await manager.get_history("AAPL", period="5d")
         if isinstance(history, dict) and 'prices' in history:
             prices = history['prices']
             if 'Close' in prices and prices['Close']:
-                print(f"✅ 历史数据成功: {len(prices['Close'])} 个数据点")
+                logger.info("✅ 历史数据成功: %s 个数据点", len(prices['Close']))
             else:
-                print(f"✅ 历史数据成功: 数据格式不同")
+                logger.info("✅ 历史数据成功: 数据格式不同")
         else:
-            print(f"✅ 历史数据成功: {type(history)}")
-        print(
-            f"   数据源: {history.get('data_source', 'unknown') if isinstance(history, dict) else 'unknown'}")
+            logger.info("✅ 历史数据成功: %s", type(history))
+        logger.info(
+            "   数据源: %s",
+            history.get('data_source', 'unknown') if isinstance(history, dict) else 'unknown')
     except Exception as e:
-        print(f"❌ 历史数据失败: {e}")
+        logger.error("❌ 历史数据失败: %s", e)
 
     # 显示状态
-    print("\n📊 数据源状态:")
+    logger.info("📊 数据源状态:")
     status = manager.get_status()
     fallback_status = status.get('fallback_manager', {})
 
     if 'sources' in fallback_status:
         for source in fallback_status['sources']:
             health_indicator = "🟢" if source['status'] == 'healthy' else "🟡" if source['status'] == 'degraded' else "🔴"
-            print(
-                f"   {health_indicator} {source['name']}: {source['status']}")
-            print(f"      请求数: {source['metrics']['total_requests']}")
-            print(f"      成功率: {source['metrics']['success_rate']:.2%}")
+            metrics = source['metrics']
+            logger.info("   %s %s: %s", health_indicator,
+                        source['name'], source['status'])
+            logger.info("      请求数: %s", metrics['total_requests'])
+            logger.info("      成功率: %.2f%%", metrics['success_rate'] * 100)
     else:
-        print("   状态信息不可用")
+        logger.info("   状态信息不可用")
 
     await manager.shutdown()
 
 
 async def test_fallback_mechanism():
     """测试降级机制"""
-    print("\n\n🔄 测试降级机制...")
+    logger.info("🔄 测试降级机制...")
 
     manager = DataSourceManager()
 
     # 手动触发降级
-    print("🔧 手动触发降级...")
+    logger.info("🔧 手动触发降级...")
     await manager.force_fallback("测试降级机制")
 
     # 检查状态
     status = manager.get_status()
     fallback_status = status.get('fallback_manager', {})
-    print(
-        f"   降级状态: {'启用' if fallback_status.get('should_use_fallback', False) else '禁用'}")
-    print(f"   连续失败次数: {fallback_status.get('consecutive_failures', 0)}")
+    logger.info("   降级状态: %s",
+                '启用' if fallback_status.get('should_use_fallback', False) else '禁用')
+    logger.info("   连续失败次数: %s",
+                fallback_status.get('consecutive_failures', 0))
 
     # 在降级状态下获取数据
-    print("\n📊 在降级状态下获取数据...")
+    logger.info("📊 在降级状态下获取数据...")
     try:
         quote = await manager.get_fast_quote("AAPL")
-        print(f"✅ 降级数据获取成功: ${quote.last_price}")
+        logger.info("✅ 降级数据获取成功: $%s", quote.last_price)
         is_fallback = getattr(quote, 'is_fallback', False)
         data_source = getattr(quote, 'data_source', 'unknown')
-        print(f"   是否降级数据: {'是' if is_fallback else '否'}")
-        print(f"   数据源: {data_source}")
+        logger.info("   是否降级数据: %s", '是' if is_fallback else '否')
+        logger.info("   数据源: %s", data_source)
     except Exception as e:
-        print(f"❌ 降级数据获取失败: {e}")
+        logger.error("❌ 降级数据获取失败: %s", e)
 
     # 重置降级状态
-    print("\n🔄 重置降级状态...")
+    logger.info("🔄 重置降级状态...")
     await manager.reset_fallback()
 
     status = manager.get_status()
     fallback_status = status.get('fallback_manager', {})
-    print(
-        f"   重置后状态: {'启用' if fallback_status.get('should_use_fallback', False) else '禁用'}")
+    logger.info("   重置后状态: %s",
+                '启用' if fallback_status.get('should_use_fallback', False) else '禁用')
 
     await manager.shutdown()
 
 
 async def test_health_check():
     """测试健康检查"""
-    print("\n\n🏥 测试健康检查...")
+    logger.info("🏥 测试健康检查...")
 
     manager = DataSourceManager()
 
     # 执行健康检查
     health_results = await manager.health_check()
 
-    print("健康检查结果:")
+    logger.info("健康检查结果:")
     for source_name, is_healthy in health_results.items():
         status_indicator = "🟢" if is_healthy else "🔴"
-        print(
-            f"   {status_indicator} {source_name}: {'健康' if is_healthy else '不健康'}")
+        logger.info("   %s %s: %s", status_indicator, source_name,
+                    '健康' if is_healthy else '不健康')
 
     await manager.shutdown()
 
@@ -156,15 +161,16 @@ async def main():
     print("=" * 60)
 
     # 显示配置信息
-    print(f"🔧 配置信息:")
-    print(f"   降级启用: {settings.fallback_enabled}")
-    print(f"   最大失败次数: {settings.primary_source_max_failures}")
-    print(f"   超时时间: {settings.fallback_timeout}秒")
-    print(f"   冷却期: {settings.fallback_cooldown_period}秒")
-    print(f"   Polygon API密钥: {'已配置' if settings.polygon_api_key else '未配置'}")
+    logger.info("🔧 配置信息:")
+    logger.info("   降级启用: %s", settings.fallback_enabled)
+    logger.info("   最大失败次数: %s", settings.primary_source_max_failures)
+    logger.info("   超时时间: %s秒", settings.fallback_timeout)
+    logger.info("   冷却期: %s秒", settings.fallback_cooldown_period)
+    logger.info("   Polygon API密钥: %s",
+                '已配置' if settings.polygon_api_key else '未配置')
 
     if not settings.polygon_api_key:
-        print("❌ 错误: 未配置 Polygon API 密钥")
+        logger.error("❌ 错误: 未配置 Polygon API 密钥")
         return
 
     try:
@@ -177,14 +183,13 @@ async def main():
         # 测试健康检查
         await test_health_check()
 
-        print("\n" + "=" * 60)
-        print("✅ 所有测试完成!")
+        print("=" * 60)
+        logger.info("✅ 所有测试完成!")
         print("=" * 60)
 
-    except Exception as e:
-        print(f"\n❌ 测试过程中发生错误: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # exception() 会附带堆栈，无需再调用 traceback.print_exc()
+        logger.exception("❌ 测试过程中发生错误")
 
 
 if __name__ == "__main__":
@@ -4,8 +4,23 @@
 """
 
 import asyncio
+import os
 import sys
 from app.data_sources.polygon_source import PolygonDataSource
+from app.utils.concurrency import gather_with_concurrency
+
+# 同时进行的Polygon请求数上限
+MAX_CONCURRENT_REQUESTS = 10
+
+# 设置环境变量 DEBUG_POLYGON 时才输出原始对象的属性和完整内容
+DEBUG = bool(os.environ.get("DEBUG_POLYGON"))
+
+
+def _unwrap(result):
+    """取出 gather_with_concurrency 的结果，异常则重新抛出"""
+    if isinstance(result, BaseException):
+        raise result
+    return result
 
 
 async def test_polygon_client():
@@ -16,10 +31,30 @@ async def test_polygon_client():
 
     test_symbol = "AAPL"
 
+    # 七项探测互不依赖，并发请求后按顺序输出结果
+    (
+        health_result,
+        fast_result,
+        detailed_result,
+        info_result,
+        history_result,
+        raw_quote_result,
+        raw_details_result,
+    ) = await gather_with_concurrency(
+        MAX_CONCURRENT_REQUESTS,
+        polygon.health_check(),
+        polygon.get_fast_quote(test_symbol),
+        polygon.get_detailed_quote(test_symbol),
+        polygon.get_company_info(test_symbol),
+        polygon.get_history_data(test_symbol, "1mo"),
+        polygon.get_raw_quote(test_symbol),
+        polygon.get_raw_ticker_details(test_symbol),
+    )
+
     # 1. 健康检查测试
     print("\n1️⃣ 测试健康检查")
     try:
-        health = await polygon.health_check()
+        health = _unwrap(health_result)
         print(f"✅ 健康检查: {health}")
     except Exception as e:
         print(f"❌ 健康检查失败: {e}")
@@ -27,7 +62,7 @@ async def test_polygon_client():
     # 2. 快速报价测试
     print(f"\n2️⃣ 测试快速报价 ({test_symbol})")
     try:
-        fast_quote = await polygon.get_fast_quote(test_symbol)
+        fast_quote = _unwrap(fast_result)
         print(f"✅ 快速报价: {fast_quote}")
     except Exception as e:
         print(f"❌ 快速报价失败: {e}")
@@ -35,7 +70,7 @@ async def test_polygon_client():
     # 3. 详细报价测试
     print(f"\n3️⃣ 测试详细报价 ({test_symbol})")
     try:
-        detailed_quote = await polygon.get_detailed_quote(test_symbol)
+        detailed_quote = _unwrap(detailed_result)
         print(f"✅ 详细报价: {detailed_quote}")
     except Exception as e:
         print(f"❌ 详细报价失败: {e}")
@@ -43,7 +78,7 @@ async def test_polygon_client():
     # 4. 公司信息测试
     print(f"\n4️⃣ 测试公司信息 ({test_symbol})")
     try:
-        company_info = await polygon.get_company_info(test_symbol)
+        company_info = _unwrap(info_result)
         print(f"✅ 公司信息: {company_info}")
     except Exception as e:
         print(f"❌ 公司信息失败: {e}")
@@ -51,7 +86,7 @@ async def test_polygon_client():
     # 5. 历史数据测试
     print(f"\n5️⃣ 测试历史数据 ({test_symbol}, 1个月)")
     try:
-        history_data = await polygon.get_history_data(test_symbol, "1mo")
+        history_data = _unwrap(history_result)
         if hasattr(history_data, 'prices') and history_data.prices:
             print(f"✅ 历史数据: 获取到 {len(history_data.prices)} 个数据点")
             print(
@@ -65,26 +100,30 @@ async def test_polygon_client():
     # 6. 原始报价调试测试
     print(f"\n6️⃣ 调试测试: 原始报价数据 ({test_symbol})")
     try:
-        raw_quote = await polygon.get_raw_quote(test_symbol)
+        raw_quote = _unwrap(raw_quote_result)
         print(f"✅ 原始报价对象类型: {type(raw_quote)}")
-        print(f"   原始报价属性: {dir(raw_quote)}")
-        if hasattr(raw_quote, '__dict__'):
-            print(f"   原始报价数据: {raw_quote.__dict__}")
-        else:
-            print(f"   原始报价内容: {raw_quote}")
+        if DEBUG:
+            if hasattr(raw_quote, '__dict__'):
+                print(
+                    f"   原始报价属性: {[a for a in vars(raw_quote) if not a.startswith('_')]}")
+                print(f"   原始报价数据: {raw_quote.__dict__}")
+            else:
+                print(f"   原始报价内容: {raw_quote}")
     except Exception as e:
         print(f"❌ 原始报价调试失败: {e}")
 
     # 7. 原始ticker详情调试测试
     print(f"\n7️⃣ 调试测试: 原始ticker详情 ({test_symbol})")
     try:
-        raw_details = await polygon.get_raw_ticker_details(test_symbol)
+        raw_details = _unwrap(raw_details_result)
         print(f"✅ 原始详情对象类型: {type(raw_details)}")
-        print(f"   原始详情属性: {dir(raw_details)}")
-        if hasattr(raw_details, '__dict__'):
-            print(f"   原始详情数据: {raw_details.__dict__}")
-        else:
-            print(f"   原始详情内容: {raw_details}")
+        if DEBUG:
+            if hasattr(raw_details, '__dict__'):
+                print(
+                    f"   原始详情属性: {[a for a in vars(raw_details) if not a.startswith('_')]}")
+                print(f"   原始详情数据: {raw_details.__dict__}")
+            else:
+                print(f"   原始详情内容: {raw_details}")
     except Exception as e:
         print(f"❌ 原始详情调试失败: {e}")
 
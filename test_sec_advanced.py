@@ -6,12 +6,91 @@ SEC高级功能API测试脚本
 
 import asyncio
 import aiohttp
+import functools
 import json
+import orjson
 from typing import Dict, Any
 
+from app.utils.concurrency import gather_with_concurrency
+
 # API基础URL
 BASE_URL = "http://localhost:8000/api/v1/sec-advanced"
 
+# 同时进行的测试请求数（SEC接口限流约10次/秒）
+MAX_CONCURRENT_TESTS = 5
+
+# 请求速率上限（次/秒）：全部请求合计，以及每类端点（路径第一段）单独限制
+MAX_REQUESTS_PER_SECOND = 10
+MAX_ENDPOINT_REQUESTS_PER_SECOND = 5
+
+# 连接失败或被限流(429)时的重试次数及初始退避秒数（指数退避）
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5
+
+# 错误响应体最多读取的字节数
+MAX_ERROR_BODY = 1024
+
+# 测试规格：(汇总名称, 结果标题, 端点, 查询参数)，按输出顺序排列
+TEST_SPECS = (
+    ("API概览", "API概览", "/", None),
+    ("健康检查", "健康检查", "/health", None),
+    ("XBRL公司数据", "XBRL公司数据 (AAPL)", "/xbrl/company/AAPL", {
+        "form_type": "10-K",
+        "fiscal_year": 2023
+    }),
+    ("全文搜索", "全文搜索 (AI)", "/search/full-text", {
+        "query": "artificial intelligence",
+        "form_types": "10-K,10-Q",
+        "limit": 10
+    }),
+    ("公司文件搜索", "公司文件搜索 (TSLA)", "/search/company/TSLA", {
+        "query": "revenue growth",
+        "form_types": "10-K,10-Q",
+        "years": 2
+    }),
+    ("内幕交易", "内幕交易数据 (AAPL)", "/insider-trading/AAPL", {
+        "days_back": 60,
+        "include_derivatives": True
+    }),
+    ("机构持股", "机构持股数据 (MSFT)", "/institutional-holdings/MSFT", {
+        "quarters": 4,
+        "min_value": 1000000
+    }),
+    ("最近IPO", "最近IPO数据", "/ipo/recent", {
+        "days_back": 90,
+        "min_offering_amount": 100000000
+    }),
+    ("公司IPO详情", "公司IPO详情 (SNOW)", "/ipo/SNOW", None),
+    ("高管薪酬", "高管薪酬数据 (AAPL)", "/executive-compensation/AAPL", {
+        "years": 3
+    }),
+    ("公司治理", "公司治理信息 (GOOGL)", "/governance/GOOGL", {
+        "include_subsidiaries": True,
+        "include_audit_fees": True
+    }),
+    ("SEC执法", "SEC执法行动", "/enforcement/recent", {
+        "days_back": 60
+    }),
+    ("股票代码映射", "股票代码映射 (AAPL)", "/mapping/ticker-to-cik/AAPL", {
+        "include_historical": False
+    }),
+)
+
+
+def _encode_params(params: Dict[str, Any] = None) -> Dict[str, str]:
+    """将查询参数编码为字符串（布尔值转为 true/false，aiohttp 不接受布尔类型）"""
+    if not params:
+        return None
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else str(value)
+        for key, value in params.items()
+    }
+
+
+def _endpoint_group(endpoint: str) -> str:
+    """端点分类（路径第一段），用于按分类限流"""
+    return endpoint.split("/", 2)[1] if endpoint.startswith("/") else endpoint
+
 
 class SecAdvancedAPITester:
     """SEC高级API测试器"""
@@ -19,33 +98,106 @@ class SecAdvancedAPITester:
     def __init__(self, base_url: str = BASE_URL):
         self.base_url = base_url
         self.session = None
+        # 速率限制：限流键 -> 下一个可用的发送时间（事件循环时钟）
+        self._next_request_time: Dict[str, float] = {}
+        # 进行中的请求：(URL, 参数) -> 请求任务，相同请求复用同一结果
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # 预先拼接好每项测试的URL、限流分类和编码后的参数
+        self._requests = [
+            (name, title, f"{base_url}{endpoint}", _endpoint_group(endpoint),
+             _encode_params(params))
+            for name, title, endpoint, params in TEST_SPECS
+        ]
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # 所有测试共用一个会话和连接池，保持长连接并缓存DNS解析
+        connector = aiohttp.TCPConnector(
+            limit=64, limit_per_host=MAX_CONCURRENT_TESTS * 2, ttl_dns_cache=300,
+            keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=30))
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
 
+    def _reserve_slot(self, key: str, interval: float, not_before: float) -> float:
+        """为限流键预约不早于 not_before 的发送时间"""
+        slot = max(not_before, self._next_request_time.get(key, 0.0))
+        self._next_request_time[key] = slot + interval
+        return slot
+
+    async def _rate_limit(self, group: str):
+        """实施速率限制（全局 + 按端点分类）"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        # 先在端点分类上排队，再按该时间在全局上排队（预约在等待前完成，无需加锁）
+        slot = self._reserve_slot(
+            f"endpoint:{group}", 1 / MAX_ENDPOINT_REQUESTS_PER_SECOND, now)
+        slot = self._reserve_slot("global", 1 / MAX_REQUESTS_PER_SECOND, slot)
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     async def make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """发送API请求"""
-        url = f"{self.base_url}{endpoint}"
-        try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
+        return await self._fetch(
+            f"{self.base_url}{endpoint}", _endpoint_group(endpoint), _encode_params(params))
+
+    async def _fetch(self, url: str, group: str, params: Dict[str, str] = None) -> Dict[str, Any]:
+        """
+        按预先构建的URL和参数发送请求；相同请求进行中时直接等待其结果
+
+        请求在独立任务中执行，某个调用方被取消不会影响等待同一请求的其他调用方。
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._send(url, group, params))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: tuple, task: asyncio.Task):
+        """请求结束后移除登记；没有其他等待者时避免 "exception was never retrieved" 警告"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _send(self, url: str, group: str, params: Dict[str, str] = None) -> Dict[str, Any]:
+        """发送请求（含限流与重试）"""
+        for attempt in range(MAX_RETRIES + 1):
+            await self._rate_limit(group)
+            try:
+                async with self.session.get(url, params=params) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    if response.status == 429 and attempt < MAX_RETRIES:
+                        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                        continue
+                    # 错误响应只读取前 MAX_ERROR_BODY 字节，避免缓冲完整的错误堆栈
+                    error_text = (await response.content.read(MAX_ERROR_BODY)).decode(
+                        'utf-8', errors='replace')
                     return {
                         "error": f"HTTP {response.status}",
                         "message": error_text
                     }
-        except Exception as e:
-            return {
-                "error": "Request failed",
-                "message": str(e)
-            }
+            except aiohttp.ClientConnectionError as e:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                return {
+                    "error": "Request failed",
+                    "message": str(e)
+                }
+            except Exception as e:
+                return {
+                    "error": "Request failed",
+                    "message": str(e)
+                }
 
     def print_result(self, test_name: str, result: Dict[str, Any]):
         """格式化打印测试结果"""
@@ -74,143 +226,25 @@ class SecAdvancedAPITester:
         print(f"数据源: {result.get('data_source', 'unknown')}")
         print(f"是否降级: {result.get('is_fallback', 'unknown')}")
 
-    async def test_xbrl_company_data(self):
-        """测试XBRL公司数据"""
-        result = await self.make_request("/xbrl/company/AAPL", {
-            "form_type": "10-K",
-            "fiscal_year": 2023
-        })
-        self.print_result("XBRL公司数据 (AAPL)", result)
-        return result
-
-    async def test_full_text_search(self):
-        """测试全文搜索"""
-        result = await self.make_request("/search/full-text", {
-            "query": "artificial intelligence",
-            "form_types": "10-K,10-Q",
-            "limit": 10
-        })
-        self.print_result("全文搜索 (AI)", result)
-        return result
-
-    async def test_company_search(self):
-        """测试公司文件搜索"""
-        result = await self.make_request("/search/company/TSLA", {
-            "query": "revenue growth",
-            "form_types": "10-K,10-Q",
-            "years": 2
-        })
-        self.print_result("公司文件搜索 (TSLA)", result)
-        return result
-
-    async def test_insider_trading(self):
-        """测试内幕交易数据"""
-        result = await self.make_request("/insider-trading/AAPL", {
-            "days_back": 60,
-            "include_derivatives": True
-        })
-        self.print_result("内幕交易数据 (AAPL)", result)
-        return result
-
-    async def test_institutional_holdings(self):
-        """测试机构持股数据"""
-        result = await self.make_request("/institutional-holdings/MSFT", {
-            "quarters": 4,
-            "min_value": 1000000
-        })
-        self.print_result("机构持股数据 (MSFT)", result)
-        return result
-
-    async def test_recent_ipos(self):
-        """测试最近IPO数据"""
-        result = await self.make_request("/ipo/recent", {
-            "days_back": 90,
-            "min_offering_amount": 100000000
-        })
-        self.print_result("最近IPO数据", result)
-        return result
-
-    async def test_company_ipo(self):
-        """测试公司IPO详情"""
-        result = await self.make_request("/ipo/SNOW")
-        self.print_result("公司IPO详情 (SNOW)", result)
-        return result
-
-    async def test_executive_compensation(self):
-        """测试高管薪酬数据"""
-        result = await self.make_request("/executive-compensation/AAPL", {
-            "years": 3
-        })
-        self.print_result("高管薪酬数据 (AAPL)", result)
-        return result
-
-    async def test_company_governance(self):
-        """测试公司治理信息"""
-        result = await self.make_request("/governance/GOOGL", {
-            "include_subsidiaries": True,
-            "include_audit_fees": True
-        })
-        self.print_result("公司治理信息 (GOOGL)", result)
-        return result
-
-    async def test_enforcement_actions(self):
-        """测试SEC执法行动"""
-        result = await self.make_request("/enforcement/recent", {
-            "days_back": 60
-        })
-        self.print_result("SEC执法行动", result)
-        return result
-
-    async def test_ticker_mapping(self):
-        """测试股票代码映射"""
-        result = await self.make_request("/mapping/ticker-to-cik/AAPL", {
-            "include_historical": False
-        })
-        self.print_result("股票代码映射 (AAPL)", result)
-        return result
-
-    async def test_health_check(self):
-        """测试健康检查"""
-        result = await self.make_request("/health")
-        self.print_result("健康检查", result)
-        return result
-
-    async def test_api_overview(self):
-        """测试API概览"""
-        result = await self.make_request("/")
-        self.print_result("API概览", result)
-        return result
-
     async def run_all_tests(self):
         """运行所有测试"""
         print("🚀 开始SEC高级功能API测试")
         print(f"API地址: {self.base_url}")
 
-        tests = [
-            ("API概览", self.test_api_overview),
-            ("健康检查", self.test_health_check),
-            ("XBRL公司数据", self.test_xbrl_company_data),
-            ("全文搜索", self.test_full_text_search),
-            ("公司文件搜索", self.test_company_search),
-            ("内幕交易", self.test_insider_trading),
-            ("机构持股", self.test_institutional_holdings),
-            ("最近IPO", self.test_recent_ipos),
-            ("公司IPO详情", self.test_company_ipo),
-            ("高管薪酬", self.test_executive_compensation),
-            ("公司治理", self.test_company_governance),
-            ("SEC执法", self.test_enforcement_actions),
-            ("股票代码映射", self.test_ticker_mapping),
-        ]
-
-        results = {}
-        for test_name, test_func in tests:
+        async def _run(test_name, title, url, group, params):
             try:
                 print(f"\n🔄 正在执行: {test_name}")
-                result = await test_func()
-                results[test_name] = "✅ 成功" if "error" not in result else "❌ 失败"
+                result = await self._fetch(url, group, params)
+                self.print_result(title, result)
+                return "✅ 成功" if "error" not in result else "❌ 失败"
             except Exception as e:
                 print(f"❌ 测试异常: {e}")
-                results[test_name] = f"❌ 异常: {str(e)}"
+                return f"❌ 异常: {str(e)}"
+
+        # 各测试相互独立，限量并发执行；结果按测试顺序汇总
+        statuses = await gather_with_concurrency(
+            MAX_CONCURRENT_TESTS, *(_run(*request) for request in self._requests))
+        results = {request[0]: status for request, status in zip(self._requests, statuses)}
 
         # 打印测试总结
         print(f"\n{'='*60}")
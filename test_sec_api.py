@@ -7,10 +7,12 @@ SEC API测试脚本
 from app.core.logging import get_logger
 from app.data_sources.base import DataSourceError
 from app.data_sources.sec_source import SecDataSource
+from app.utils.concurrency import gather_with_concurrency
 import asyncio
 import sys
 import os
 from datetime import datetime
+from typing import List
 
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -18,6 +20,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 logger = get_logger(__name__)
 
+# 同时进行的SEC请求数上限，避免触发速率限制
+MAX_CONCURRENT_REQUESTS = 5
+
 
 class SecApiTester:
     def __init__(self, api_key: str = None):
@@ -154,34 +159,44 @@ class SecApiTester:
             print(f"❌ 获取健康状态异常: {e}")
             return False
 
-    async def run_all_tests(self, ticker: str = "AAPL"):
-        """运行所有测试"""
-        print(f"🚀 开始SEC API测试 - 测试股票: {ticker}")
+    async def run_all_tests(self, tickers: List[str]):
+        """运行所有测试（多个股票代码一并测试）"""
+        print(f"🚀 开始SEC API测试 - 测试股票: {', '.join(tickers)}")
         print(f"⏰ 测试时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
 
-        results = []
-
-        # 测试健康检查
-        results.append(await self.test_health_check())
-
-        # 测试获取CIK
-        cik = await self.test_get_cik(ticker)
-        results.append(bool(cik))
-
-        # 测试财务数据
-        results.append(await self.test_company_financials(ticker))
-
-        # 测试SEC新闻
-        results.append(await self.test_company_news(ticker))
-
-        # 测试健康状态
-        results.append(await self.test_health_status())
+        # 第一阶段：健康检查、健康状态和各代码的CIK相互独立，并发执行
+        # 各测试自行捕获异常，无需 return_exceptions
+        health_ok, health_status_ok, *ciks = await gather_with_concurrency(
+            MAX_CONCURRENT_REQUESTS,
+            self.test_health_check(),
+            self.test_health_status(),
+            *(self.test_get_cik(ticker) for ticker in tickers),
+            return_exceptions=False,
+        )
+
+        # 第二阶段：CIK就绪后并发获取所有代码的财务数据和SEC新闻
+        ticker_results = await gather_with_concurrency(
+            MAX_CONCURRENT_REQUESTS,
+            *(self.test_company_financials(ticker) for ticker in tickers),
+            *(self.test_company_news(ticker) for ticker in tickers),
+            return_exceptions=False,
+        )
+        financials_ok = ticker_results[:len(tickers)]
+        news_ok = ticker_results[len(tickers):]
+
+        # 按原有测试顺序汇总，每个代码一组
+        test_names = ["健康检查"]
+        results = [health_ok]
+        for ticker, cik, financial_ok, news_item_ok in zip(tickers, ciks, financials_ok, news_ok):
+            test_names += [f"获取CIK ({ticker})", f"财务数据 ({ticker})", f"SEC新闻 ({ticker})"]
+            results += [bool(cik), financial_ok, news_item_ok]
+        test_names.append("健康状态")
+        results.append(health_status_ok)
 
         # 总结结果
         print("\n" + "=" * 60)
         print("📊 测试结果总结:")
-        test_names = ["健康检查", "获取CIK", "财务数据", "SEC新闻", "健康状态"]
 
         passed = sum(results)
         total = len(results)
@@ -206,19 +221,19 @@ async def main():
     api_key = None  # 或者直接设置: api_key = "your-api-key-here"
 
     # 可以在这里指定测试的股票代码
-    test_ticker = "AAPL"  # 默认测试苹果公司
+    test_tickers = ["AAPL"]  # 默认测试苹果公司
 
     print("🔧 SEC API 修复验证工具")
     print("=" * 40)
 
     if len(sys.argv) > 1:
-        test_ticker = sys.argv[1].upper()
-        print(f"使用命令行参数指定的股票代码: {test_ticker}")
+        test_tickers = [arg.upper() for arg in sys.argv[1:]]
+        print(f"使用命令行参数指定的股票代码: {', '.join(test_tickers)}")
 
     tester = SecApiTester(api_key=api_key)
 
     try:
-        success = await tester.run_all_tests(test_ticker)
+        success = await tester.run_all_tests(test_tickers)
         if success:
             print("\n✨ 验证完成：SEC API修复有效！")
             sys.exit(0)
@@ -4,24 +4,29 @@
 通过实际的HTTP请求验证我们的API接口
 """
 
-import requests
+import asyncio
+import httpx
 import json
-import time
+import orjson
 from datetime import datetime
+from importlib.util import find_spec
 
 # API基础URL
 BASE_URL = "http://localhost:8000"
 
+# 安装了 h2（httpx[http2]）时启用HTTP/2；BASE_URL 为 https 时并发请求复用同一连接
+HTTP2_ENABLED = find_spec('h2') is not None
 
-def test_api_health():
+
+async def check_api_health(client: httpx.AsyncClient):
     """测试API健康状态"""
     print("🔍 测试API健康状态...")
 
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=10)
+        response = await client.get("/health", timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ API状态: {data.get('status', 'unknown')}")
             print(f"   ⏰ 响应时间: {data.get('timestamp', 'N/A')}")
             return True
@@ -29,7 +34,7 @@ def test_api_health():
             print(f"   ❌ 健康检查失败: HTTP {response.status_code}")
             return False
 
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("   ❌ 无法连接到API服务器")
         print("   💡 请确保API服务器正在运行: uvicorn app.main:app --reload")
         return False
@@ -38,25 +43,40 @@ def test_api_health():
         return False
 
 
-def test_sec_financials_endpoint():
+async def wait_ready(client: httpx.AsyncClient, attempts: int = 5) -> bool:
+    """轮询 /health 直到连续两次返回200（指数退避），代替固定等待"""
+    consecutive = 0
+    for i in range(attempts):
+        try:
+            response = await client.get("/health", timeout=10)
+            consecutive = consecutive + 1 if response.status_code == 200 else 0
+        except httpx.HTTPError:
+            consecutive = 0
+        if consecutive >= 2:
+            return True
+        await asyncio.sleep(0.05 * 2 ** i)
+    return False
+
+
+async def check_sec_financials_endpoint(client: httpx.AsyncClient):
     """测试SEC财务数据接口"""
     print("\n🔍 测试SEC财务数据接口...")
 
     try:
         ticker = "AAPL"
-        url = f"{BASE_URL}/api/v1/sec/financials/{ticker}"
+        path = f"/api/v1/sec/financials/{ticker}"
         params = {
             "years": 2,
             "include_quarterly": True
         }
 
-        print(f"   - 请求URL: {url}")
+        print(f"   - 请求URL: {BASE_URL}{path}")
         print(f"   - 参数: {params}")
 
-        response = requests.get(url, params=params, timeout=30)
+        response = await client.get(path, params=params)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             print(f"   ✅ 请求成功")
             print(f"   📊 数据结构验证:")
@@ -85,13 +105,13 @@ def test_sec_financials_endpoint():
             return True
 
         elif response.status_code == 500:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             print(f"   ❌ 服务器错误: {error_data.get('detail', 'Unknown error')}")
             return False
         else:
             print(f"   ❌ 请求失败: HTTP {response.status_code}")
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 print(
                     f"       错误详情: {error_data.get('detail', 'Unknown error')}")
             except:
@@ -103,24 +123,24 @@ def test_sec_financials_endpoint():
         return False
 
 
-def test_sec_news_endpoint():
+async def check_sec_news_endpoint(client: httpx.AsyncClient):
     """测试SEC新闻接口"""
     print("\n🔍 测试SEC新闻接口...")
 
     try:
         ticker = "AAPL"
-        url = f"{BASE_URL}/api/v1/sec/news/{ticker}"
+        path = f"/api/v1/sec/news/{ticker}"
         params = {
             "limit": 5
         }
 
-        print(f"   - 请求URL: {url}")
+        print(f"   - 请求URL: {BASE_URL}{path}")
         print(f"   - 参数: {params}")
 
-        response = requests.get(url, params=params, timeout=30)
+        response = await client.get(path, params=params)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             print(f"   ✅ 请求成功")
             print(f"   📊 数据结构验证:")
@@ -139,13 +159,13 @@ def test_sec_news_endpoint():
             return True
 
         elif response.status_code == 500:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             print(f"   ❌ 服务器错误: {error_data.get('detail', 'Unknown error')}")
             return False
         else:
             print(f"   ❌ 请求失败: HTTP {response.status_code}")
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 print(
                     f"       错误详情: {error_data.get('detail', 'Unknown error')}")
             except:
@@ -157,21 +177,21 @@ def test_sec_news_endpoint():
         return False
 
 
-def test_sec_quarterly_revenue_endpoint():
+async def check_sec_quarterly_revenue_endpoint(client: httpx.AsyncClient):
     """测试季度收入接口"""
     print("\n🔍 测试季度收入接口...")
 
     try:
         ticker = "AAPL"
-        url = f"{BASE_URL}/api/v1/sec/quarterly-revenue/{ticker}"
+        path = f"/api/v1/sec/quarterly-revenue/{ticker}"
         params = {
             "quarters": 4
         }
 
-        response = requests.get(url, params=params, timeout=30)
+        response = await client.get(path, params=params)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
 
             print(f"   ✅ 请求成功")
             print(f"   📊 数据结构验证:")
@@ -198,34 +218,40 @@ def test_sec_quarterly_revenue_endpoint():
         return False
 
 
-def main():
+async def main():
     """主测试函数"""
     print("🚀 SEC API接口验证测试")
     print(f"⏰ 测试时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
-    results = []
-
-    # 测试API健康状态
-    results.append(test_api_health())
-
-    # 如果API服务不可用，跳过其他测试
-    if not results[0]:
-        print("\n❌ API服务不可用，跳过其他测试")
-        print("💡 请先启动API服务: uvicorn app.main:app --reload")
-        return
-
-    # 等待一秒钟，确保服务稳定
-    time.sleep(1)
-
-    # 测试SEC财务数据接口
-    results.append(test_sec_financials_endpoint())
-
-    # 测试SEC新闻接口
-    results.append(test_sec_news_endpoint())
-
-    # 测试季度收入接口
-    results.append(test_sec_quarterly_revenue_endpoint())
+    # 所有请求共用一个客户端，复用到API服务器的长连接
+    async with httpx.AsyncClient(
+        http2=HTTP2_ENABLED,
+        base_url=BASE_URL,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=10),
+    ) as client:
+        results = []
+
+        # 测试API健康状态
+        results.append(await check_api_health(client))
+
+        # 如果API服务不可用，跳过其他测试
+        if not results[0]:
+            print("\n❌ API服务不可用，跳过其他测试")
+            print("💡 请先启动API服务: uvicorn app.main:app --reload")
+            return
+
+        # 等待服务稳定（连续两次健康检查通过即继续）
+        if not await wait_ready(client):
+            print("\n⚠️  服务状态不稳定，继续测试")
+
+        # 财务数据、新闻、季度收入三个接口相互独立，并发测试
+        results.extend(await asyncio.gather(
+            check_sec_financials_endpoint(client),
+            check_sec_news_endpoint(client),
+            check_sec_quarterly_revenue_endpoint(client),
+        ))
 
     # 汇总结果
     print("\n" + "=" * 60)
@@ -253,4 +279,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
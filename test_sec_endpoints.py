@@ -6,47 +6,160 @@ SEC API endpoints 测试文件
 
 import asyncio
 import aiohttp
-import json
+import functools
+import hashlib
+import itertools
+import orjson
+import os
+import sys
+import time
 from datetime import datetime
-import requests
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from app.utils.concurrency import gather_with_concurrency
+
+# 本地响应缓存目录及有效期（SEC数据至多每日更新）
+CACHE_DIR = Path(".cache")
+CACHE_TTL = 24 * 3600
+
+# 默认同时进行的端点请求数（可用 --concurrency=N 覆盖），低于连接池的 limit_per_host
+DEFAULT_CONCURRENCY = 6
+
+# 基础测试端点：(路径, 描述)，{ticker} 在运行时替换为测试股票代码
+ENDPOINTS = (
+    ("/v1/sec/", "SEC API概览"),
+    ("/v1/sec/health", "SEC服务健康检查"),
+    ("/v1/sec/financials/{ticker}?years=3&include_quarterly=true",
+     "获取{ticker}财务数据 (3年含季度)"),
+    ("/v1/sec/quarterly-revenue/{ticker}?quarters=8", "获取{ticker}季度收入 (8个季度)"),
+    ("/v1/sec/annual-comparison/{ticker}?years=5", "获取{ticker}年度对比 (5年)"),
+    ("/v1/sec/news/{ticker}?limit=10", "获取{ticker}SEC新闻 (10条)"),
+    ("/v1/sec/ratios/{ticker}?period=annual", "获取{ticker}年度财务比率"),
+    ("/v1/sec/financials/INVALID_TICKER", "错误处理测试 (无效股票代码)"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def endpoints_for(ticker: str):
+    """返回替换好股票代码的端点表，每个股票代码只格式化一次"""
+    return tuple(
+        (path.format(ticker=ticker), description.format(ticker=ticker))
+        for path, description in ENDPOINTS
+    )
+
+
+class FileCache:
+    """按URL的MD5存放响应体的本地文件缓存，超过TTL视为过期"""
+
+    def __init__(self, directory: Path = CACHE_DIR, ttl: float = CACHE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.md5(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[bytes]:
+        """读取未过期的缓存，不存在或已过期时返回 None"""
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, url: str, raw: bytes):
+        """写入缓存（先写临时文件再替换，避免并发读到半个文件）"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(raw)
+        tmp_path.replace(path)
 
 
 class SecAPITester:
     """SEC API端点测试工具"""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", use_cache: bool = True,
+                 concurrency: int = DEFAULT_CONCURRENCY):
         self.base_url = base_url
+        self.concurrency = concurrency
         # 修正基础路径
         self.sec_base = f"{base_url}/api/v1/sec/sec"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "User-Agent": "SEC-API-Tester/1.0"
-        })
-
-    async def test_endpoint(self, endpoint, description):
-        """测试单个端点"""
-        print(f"\n🧪 测试: {description}")
-        print(f"📡 端点: {endpoint}")
+        self.session = None
+        self.cache = FileCache() if use_cache else None
+        # URL -> (ETag, 响应体)，再次请求时发送条件请求，304时复用已有响应体
+        self._etag_cache: Dict[str, tuple] = {}
+
+    async def __aenter__(self):
+        # 所有端点测试共用一个会话，复用到API服务器的长连接并缓存DNS解析
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "SEC-API-Tester/1.0"
+            })
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session:
+            await self.session.close()
+
+    async def test_endpoint(self, endpoint, description, log: Optional[list] = None):
+        """
+        测试单个端点（输出先缓存，避免并发时多个测试的输出交错）
+
+        传入 log 时输出行追加到其中由调用方统一打印，否则结束时自行打印
+        """
+        lines = [f"\n🧪 测试: {description}", f"📡 端点: {endpoint}"]
+        url = f"{self.base_url}{endpoint}"
+        # 健康检查始终实时请求
+        cache = self.cache if not endpoint.endswith("/health") else None
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}{endpoint}") as response:
-                    print(f"📊 状态码: {response.status}")
-
-                    if response.status == 200:
-                        data = await response.json()
-                        print(f"✅ 成功 - 数据大小: {len(json.dumps(data))} 字符")
-                        return data
-                    else:
-                        error_text = await response.text()
-                        print(f"❌ 失败 - 错误: {error_text}")
-                        return None
+            if cache:
+                raw = cache.get(url)
+                if raw is not None:
+                    lines.append(f"💾 缓存命中 - 数据大小: {len(raw)} 字节")
+                    return orjson.loads(raw)
+
+            cached = self._etag_cache.get(url)
+            headers = {"If-None-Match": cached[0]} if cached else None
+
+            async with self.session.get(url, headers=headers) as response:
+                lines.append(f"📊 状态码: {response.status}")
+
+                if response.status == 304 and cached:
+                    lines.append(f"♻️  未修改 - 复用已有响应 ({len(cached[1])} 字节)")
+                    return orjson.loads(cached[1])
+
+                if response.status == 200:
+                    # 直接以响应体字节数作为数据大小，无需重新序列化
+                    raw = await response.read()
+                    lines.append(f"✅ 成功 - 数据大小: {len(raw)} 字节")
+                    data = orjson.loads(raw)
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self._etag_cache[url] = (etag, raw)
+                    if cache:
+                        cache.set(url, raw)
+                        lines.append("🌐 缓存未命中，已写入本地缓存")
+                    return data
+                else:
+                    error_text = await response.text()
+                    lines.append(f"❌ 失败 - 错误: {error_text}")
+                    return None
 
         except Exception as e:
-            print(f"🚫 异常: {str(e)}")
+            lines.append(f"🚫 异常: {str(e)}")
             return None
+        finally:
+            if log is None:
+                print("\n".join(lines))
+            else:
+                log.extend(lines)
 
     async def run_tests(self):
         """运行所有测试"""
@@ -56,53 +169,15 @@ class SecAPITester:
         # 测试公司：苹果公司 (AAPL)
         ticker = "AAPL"
 
-        # 1. 测试SEC API概览
-        await self.test_endpoint(
-            "/v1/sec/",
-            "SEC API概览"
-        )
-
-        # 2. 测试健康检查
-        await self.test_endpoint(
-            "/v1/sec/health",
-            "SEC服务健康检查"
-        )
-
-        # 3. 测试获取财务数据
-        await self.test_endpoint(
-            f"/v1/sec/financials/{ticker}?years=3&include_quarterly=true",
-            f"获取{ticker}财务数据 (3年含季度)"
-        )
-
-        # 4. 测试季度收入数据
-        await self.test_endpoint(
-            f"/v1/sec/quarterly-revenue/{ticker}?quarters=8",
-            f"获取{ticker}季度收入 (8个季度)"
-        )
-
-        # 5. 测试年度对比
-        await self.test_endpoint(
-            f"/v1/sec/annual-comparison/{ticker}?years=5",
-            f"获取{ticker}年度对比 (5年)"
-        )
-
-        # 6. 测试SEC新闻
-        await self.test_endpoint(
-            f"/v1/sec/news/{ticker}?limit=10",
-            f"获取{ticker}SEC新闻 (10条)"
-        )
-
-        # 7. 测试财务比率
-        await self.test_endpoint(
-            f"/v1/sec/ratios/{ticker}?period=annual",
-            f"获取{ticker}年度财务比率"
-        )
-
-        # 8. 测试错误处理
-        await self.test_endpoint(
-            "/v1/sec/financials/INVALID_TICKER",
-            "错误处理测试 (无效股票代码)"
-        )
+        # 各端点相互独立，共用会话并发请求（限制同时进行的请求数）；
+        # 输出按端点顺序收集，全部完成后一次写出
+        endpoints = endpoints_for(ticker)
+        logs = [[] for _ in endpoints]
+        await gather_with_concurrency(self.concurrency, *(
+            self.test_endpoint(path, description, log)
+            for (path, description), log in zip(endpoints, logs)
+        ))
+        sys.stdout.write("\n".join(itertools.chain.from_iterable(logs)) + "\n")
 
         print("\n" + "=" * 50)
         print("🏁 测试完成!")
@@ -157,18 +232,32 @@ class SecAPITester:
 
 async def main():
     """主函数"""
-    tester = SecAPITester()
-
     print("🌟 SEC API 端点测试工具")
     print("⚠️  请确保API服务在 http://localhost:8000 上运行")
     print()
 
-    # 运行基础测试
-    await tester.run_tests()
+    # 传入 --no-cache 时忽略本地缓存，全部实时请求；--concurrency=N 调整并发数
+    concurrency = DEFAULT_CONCURRENCY
+    for arg in sys.argv[1:]:
+        if arg.startswith("--concurrency="):
+            concurrency = max(1, int(arg.split("=", 1)[1]))
+
+    async with SecAPITester(use_cache="--no-cache" not in sys.argv,
+                            concurrency=concurrency) as tester:
+        # 运行基础测试
+        await tester.run_tests()
 
-    # 运行详细功能测试
-    await tester.test_specific_features()
+        # 运行详细功能测试
+        await tester.test_specific_features()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # 优先使用 uvloop 事件循环（未安装或Windows下回退到标准 asyncio）
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
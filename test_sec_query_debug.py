@@ -4,14 +4,67 @@ SEC API查询调试工具
 直接测试SEC API的响应来理解数据结构
 """
 
-import requests
-import json
+import aiohttp
+import asyncio
+import orjson
 import os
 from datetime import datetime
+from pathlib import Path
 
+from app.utils.concurrency import gather_with_concurrency
 
-def test_sec_api_query():
-    """测试SEC API的直接查询"""
+SEC_API_URL = 'https://api.sec-api.io'
+
+# 每次查询后预取详情页的文件数，以及访问 sec.gov 所需的请求头
+PREFETCH_FILINGS = 2
+SEC_GOV_HEADERS = {'User-Agent': 'YFinance-API/1.0 (https://example.com/contact)'}
+
+# 批量调试的股票代码和表单类型（两两组合并发查询）
+DEBUG_TICKERS = ["AAPL", "MSFT", "GOOG"]
+DEBUG_FORM_TYPES = ["10-K", "10-Q"]
+
+# 同时进行的查询数上限，遵守 api.sec-api.io 的速率限制
+MAX_CONCURRENT_QUERIES = 3
+
+
+def build_query(ticker: str, form_type: str) -> dict:
+    """根据官方文档构建查询"""
+    return {
+        "query": f"ticker:\"{ticker}\" AND formType:\"{form_type}\"",
+        "from": "0",
+        "size": "2",
+        "sort": [{"filedAt": {"order": "desc"}}]
+    }
+
+
+async def _post_query(session: aiohttp.ClientSession, query_payload: dict, headers: dict):
+    """发送查询，返回 (状态码, 响应数据, 错误文本)"""
+    async with session.post(
+        SEC_API_URL,
+        data=orjson.dumps(query_payload),
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=30)
+    ) as response:
+        if response.status == 200:
+            return response.status, orjson.loads(await response.read()), None
+        return response.status, None, await response.text()
+
+
+async def _prefetch_filing_details(session: aiohttp.ClientSession, url: str):
+    """预取文件详情页，返回 (URL, 状态码, 响应字节数)"""
+    async with session.get(
+        url, headers=SEC_GOV_HEADERS, timeout=aiohttp.ClientTimeout(total=30)
+    ) as response:
+        body = await response.read()
+        return url, response.status, len(body)
+
+
+async def run_sec_api_query(
+    session: aiohttp.ClientSession = None,
+    ticker: str = "AAPL",
+    form_type: str = "10-K"
+):
+    """测试SEC API的直接查询（可传入共用的会话）"""
 
     api_key = os.environ.get('SEC_API_KEY')
     if not api_key:
@@ -19,35 +72,28 @@ def test_sec_api_query():
         print("请设置环境变量 SEC_API_KEY")
         return
 
-    # 根据官方文档构建查询
-    query_payload = {
-        "query": "ticker:\"AAPL\" AND formType:\"10-K\"",
-        "from": "0",
-        "size": "2",
-        "sort": [{"filedAt": {"order": "desc"}}]
-    }
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await run_sec_api_query(own_session, ticker, form_type)
+
+    query_payload = build_query(ticker, form_type)
 
     headers = {
         'Authorization': api_key,
         'Content-Type': 'application/json'
     }
 
-    print("🔍 测试SEC API查询...")
-    print(f"查询payload: {json.dumps(query_payload, indent=2)}")
-    print(f"API端点: https://api.sec-api.io")
+    print(f"🔍 测试SEC API查询: {ticker} {form_type}...")
+    print(f"查询payload: {orjson.dumps(query_payload, option=orjson.OPT_INDENT_2).decode()}")
+    print(f"API端点: {SEC_API_URL}")
 
     try:
-        response = requests.post(
-            'https://api.sec-api.io',
-            json=query_payload,
-            headers=headers,
-            timeout=30
-        )
+        status, data, error_text = await _post_query(
+            session, query_payload, headers)
 
-        print(f"HTTP状态码: {response.status_code}")
+        print(f"HTTP状态码: {status}")
 
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             print("✅ 查询成功!")
 
             # 打印响应结构
@@ -59,6 +105,13 @@ def test_sec_api_query():
                 print(f"  - 文件数量: {len(filings)}")
 
                 if filings:
+                    # 先发起前几个文件详情页的预取，与下面的输出处理重叠
+                    prefetch = asyncio.gather(*(
+                        _prefetch_filing_details(session, filing['linkToFilingDetails'])
+                        for filing in filings[:PREFETCH_FILINGS]
+                        if filing.get('linkToFilingDetails')
+                    ), return_exceptions=True)
+
                     print(f"\n📄 第一个文件的结构:")
                     first_filing = filings[0]
                     print(f"  - 键: {list(first_filing.keys())}")
@@ -85,20 +138,52 @@ def test_sec_api_query():
                                 print(f"    {key}: {value}")
 
                     # 保存完整响应到文件用于调试
-                    with open('sec_api_response_debug.json', 'w') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
-                    print(f"\n💾 完整响应已保存到: sec_api_response_debug.json")
+                    debug_file = f'sec_api_response_debug_{ticker}_{form_type}.json'
+                    Path(debug_file).write_bytes(orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                    print(f"\n💾 完整响应已保存到: {debug_file}")
+
+                    prefetched = await prefetch
+                    if prefetched:
+                        print(f"\n🔗 文件详情页预取:")
+                    for result in prefetched:
+                        if isinstance(result, Exception):
+                            print(f"  - 预取失败: {result}")
+                        else:
+                            url, detail_status, size = result
+                            print(f"  - {url}: HTTP {detail_status}, {size} 字节")
             else:
                 print("❌ 响应中没有'filings'字段")
-                print(f"实际响应: {json.dumps(data, indent=2)}")
+                print(f"实际响应: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
 
         else:
-            print(f"❌ 查询失败: HTTP {response.status_code}")
-            print(f"错误响应: {response.text}")
+            print(f"❌ 查询失败: HTTP {status}")
+            print(f"错误响应: {error_text}")
 
     except Exception as e:
         print(f"❌ 请求异常: {e}")
 
 
+async def main():
+    """对所有股票代码和表单类型组合并发执行查询"""
+    if not os.environ.get('SEC_API_KEY'):
+        print("❌ 错误: 未找到SEC API密钥")
+        print("请设置环境变量 SEC_API_KEY")
+        return
+
+    # 共用一个会话；限制到SEC API的连接数，避免触发速率限制，并缓存DNS解析
+    connector = aiohttp.TCPConnector(limit_per_host=4, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await gather_with_concurrency(
+            MAX_CONCURRENT_QUERIES,
+            *(run_sec_api_query(session, ticker, form_type)
+              for ticker in DEBUG_TICKERS for form_type in DEBUG_FORM_TYPES)
+        )
+
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"❌ 查询异常: {result}")
+
+
 if __name__ == "__main__":
-    test_sec_api_query()
+    asyncio.run(main())